@@ -0,0 +1,77 @@
+"""Checks whether a goose slot can be beaten at all, straight from the requirements in Rules.py.
+
+Once the player has every item the options put in the pool, each requirement either simplifies away or is left
+with only the item checks nothing can satisfy. So this needs no regions, items or CollectionState and can run
+as soon as the options are known, which generate_early does to reject impossible options before anything is built.
+"""
+from typing import TYPE_CHECKING, Optional
+
+from .Items import area_items, npc_soul_items, prop_soul_items
+from .Locations import GOAL_LOCATIONS, LOCATION_REGISTRY, location_index_by_name
+from .Requirements import ALWAYS, Clause, Has, Requirement, all_of
+from .names import itemNames
+
+if TYPE_CHECKING:
+    from . import GooseGameWorld
+
+
+def get_pool_checks(world: "GooseGameWorld") -> Clause:
+    """Every item check the player passes once they have the whole item pool and their starting items,
+    matching what create_items adds"""
+    options = world.options
+    checks = set()
+    if options.progressive_area_access.value:
+        checks.add(Has(itemNames.PROGRESSIVE_AREA_ACCESS, len(area_items)))
+    else:
+        checks.update(Has(area) for area in area_items)
+    if options.include_npc_souls.value:
+        checks.update(Has(soul) for soul in npc_soul_items)
+    if options.include_prop_souls.value:
+        checks.update(Has(soul) for soul in prop_soul_items)
+    if options.goal.value == 1:
+        checks.add(Has(itemNames.PROP_GOLDEN_BELL))
+    return frozenset(checks)
+
+
+def get_goal_requirement(world: "GooseGameWorld") -> Requirement:
+    """What finishing the game takes, the goal location included for goals that lock the Golden Bell Soul there"""
+    rules = world.get_rules()
+    completion = rules.steal_bell()
+    goal_location = GOAL_LOCATIONS.get(world.options.goal.value)
+    if goal_location is None:
+        return completion
+
+    record = LOCATION_REGISTRY[location_index_by_name[goal_location]]
+    # The Golden Bell Soul only comes from the goal location, so stealing the bell can count on it
+    bell_soul = frozenset((Has(itemNames.PROP_GOLDEN_BELL),))
+    return all_of(
+        rules.has_region(record.region),
+        rules.location_rules[goal_location](),
+        rules.compiler.assume(completion, bell_soul),
+    )
+
+
+def get_missing_goal_requirement(world: "GooseGameWorld") -> Requirement:
+    """The part of the goal requirement the whole item pool doesn't cover, ALWAYS when the slot can be beaten"""
+    return world.get_rules().compiler.assume(get_goal_requirement(world), get_pool_checks(world))
+
+
+def describe_missing(world: "GooseGameWorld", missing: Requirement) -> str:
+    """The smallest sets of item checks that would make up for a missing requirement, or the requirement
+    itself when it has too many alternatives to flatten"""
+    clauses = world.get_rules().compiler.to_dnf(missing)
+    if not clauses:
+        return repr(missing)
+    fewest = min(len(clause) for clause in clauses)
+    return " or ".join(
+        ", ".join(sorted(check.item if check.count == 1 else f"{check.item} x{check.count}" for check in clause))
+        for clause in clauses if len(clause) == fewest
+    )
+
+
+def check_beatable(world: "GooseGameWorld") -> Optional[str]:
+    """What the goal still needs with the whole item pool, or None when the slot can be beaten"""
+    missing = get_missing_goal_requirement(world)
+    if missing is ALWAYS:
+        return None
+    return describe_missing(world, missing)
@@ -0,0 +1,178 @@
+"""Times how expensive the goose world's logic is to build and evaluate.
+
+Builds a solo multiworld in-process (no server, no YAMLs) for every combination in the option matrix
+and times each generation step, so changes to Rules.py that slow generation down show up in review.
+
+This needs the Archipelago source, not only the installed apworld: it imports Fill.distribute_items_restrictive,
+MultiWorld.set_options and worlds.AutoWorld.call_all, which the release builds don't ship as importable modules.
+Run it from the root of an Archipelago source checkout with the world in worlds/untitled_goose_game:
+    python -m worlds.untitled_goose_game.Benchmark --output goose_bench.json
+"""
+import argparse
+import itertools
+import json
+import sys
+import time
+from argparse import Namespace
+from typing import Any, Dict, Iterator, List, Optional
+
+from BaseClasses import CollectionState, MultiWorld
+from Fill import distribute_items_restrictive
+from Options import Option, OptionError
+from worlds.AutoWorld import World, call_all
+
+from . import GooseGameWorld
+
+PLAYER = 1
+
+# Steps run before the timed steps start
+SETUP_STEPS = ("generate_early",)
+
+# Generation steps that are timed one by one
+TIMED_STEPS = ("create_regions", "create_items", "set_rules")
+
+# Steps between setting the rules and filling, timed together with the fill.
+# connect_entrances only exists on newer Archipelago versions.
+PRE_FILL_STEPS = tuple(
+    step for step in ("connect_entrances", "generate_basic", "pre_fill")
+    if hasattr(World, step)
+)
+
+GOALS = range(7)
+TOGGLES = (False, True)
+CHURCH_PECKS = ("none", "first_pecks_only", "all_pecks")
+
+
+def option_matrix() -> Iterator[Dict[str, Any]]:
+    """Every combination of goal, souls, location toggles and church pecks.
+
+    Extra and speedrun tasks are turned on whenever the goal needs them, so every goal can generate."""
+    for goal, souls, pickups, drags, interactions, pecks in itertools.product(
+        GOALS, TOGGLES, TOGGLES, TOGGLES, TOGGLES, CHURCH_PECKS
+    ):
+        yield {
+            "goal": goal,
+            "include_npc_souls": souls,
+            "include_prop_souls": souls,
+            "include_item_pickups": pickups,
+            "include_drag_items": drags,
+            "include_interactions": interactions,
+            "include_model_church_pecks": pecks,
+            "include_extra_tasks": goal in (4, 5),
+            "include_speedrun_tasks": goal in (3, 5),
+        }
+
+
+def create_multiworld(option_values: Dict[str, Any], seed: int) -> MultiWorld:
+    """Sets up a one player multiworld with the given goose options, ready for generate_early"""
+    return create_multiworld_from_options({
+        name: option.from_any(option_values.get(name, option.default))
+        for name, option in GooseGameWorld.options_dataclass.type_hints.items()
+    }, seed)
+
+
+def create_multiworld_from_options(options: Dict[str, Option], seed: int) -> MultiWorld:
+    """Same as create_multiworld, for options that are already rolled"""
+    multiworld = MultiWorld(1)
+    multiworld.game[PLAYER] = GooseGameWorld.game
+    multiworld.player_name = {PLAYER: "Goose"}
+    multiworld.set_seed(seed)
+
+    args = Namespace()
+    for name, option in options.items():
+        setattr(args, name, {PLAYER: option})
+    multiworld.set_options(args)
+    multiworld.state = CollectionState(multiworld)
+    return multiworld
+
+
+def run_steps(multiworld: MultiWorld, steps) -> None:
+    for step in steps:
+        call_all(multiworld, step)
+
+
+def benchmark_options(option_values: Dict[str, Any], seed: int) -> Dict[str, Any]:
+    """Generates once with the given options and returns how long each step took, in seconds"""
+    multiworld = create_multiworld(option_values, seed)
+    try:
+        run_steps(multiworld, SETUP_STEPS)
+    except OptionError as error:
+        return {"options": option_values, "skipped": str(error)}
+
+    timings: Dict[str, float] = {}
+    for step in TIMED_STEPS:
+        start = time.perf_counter()
+        call_all(multiworld, step)
+        timings[step] = time.perf_counter() - start
+
+    # Every location the player could reach with the whole item pool
+    start = time.perf_counter()
+    state = multiworld.get_all_state(False)
+    reachable = multiworld.get_reachable_locations(state, PLAYER)
+    timings["sweep"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    run_steps(multiworld, PRE_FILL_STEPS)
+    distribute_items_restrictive(multiworld)
+    timings["fill"] = time.perf_counter() - start
+
+    return {
+        "options": option_values,
+        "locations": len(multiworld.get_locations(PLAYER)),
+        "reachable": len(reachable),
+        "beatable": multiworld.can_beat_game(CollectionState(multiworld)),
+        "timings": timings,
+    }
+
+
+def merge_runs(runs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Keeps the fastest time of each step over repeated runs, which is the least noisy"""
+    result = dict(runs[0])
+    if "timings" in result:
+        result["timings"] = {
+            step: min(run["timings"][step] for run in runs)
+            for step in result["timings"]
+        }
+    return result
+
+
+def run_benchmark(seed: int = 0, repeat: int = 1, limit: Optional[int] = None) -> Dict[str, Any]:
+    results = []
+    for option_values in itertools.islice(option_matrix(), limit):
+        runs = [benchmark_options(option_values, seed) for _ in range(repeat)]
+        results.append(merge_runs(runs))
+
+    totals: Dict[str, float] = {}
+    for result in results:
+        for step, seconds in result.get("timings", {}).items():
+            totals[step] = totals.get(step, 0.0) + seconds
+
+    return {
+        "seed": seed,
+        "repeat": repeat,
+        "generated": sum("timings" in result for result in results),
+        "skipped": sum("skipped" in result for result in results),
+        "totals": totals,
+        "results": results,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark Untitled Goose Game generation over the option matrix")
+    parser.add_argument("--seed", type=int, default=0, help="Seed used for every generation")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per option set, keeping the fastest time of each step")
+    parser.add_argument("--limit", type=int, default=None, help="Only run the first N option sets")
+    parser.add_argument("--output", default=None, help="File to write the JSON report to, instead of stdout")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(args.seed, max(1, args.repeat), args.limit)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""Generates StaticData.py, the frozen location name and id tables the world registers when it is imported,
+and optionally GeneratedIdTables.cs, the item and location names and ids for the client.
+
+Items.py and Locations.py stay the source of truth. StaticData.py only holds plain tuples of constants,
+so importing it just loads them from the compiled module instead of building the location registry.
+The item tables aren't generated into it: create_item and the item mask need Items.py at import anyway.
+
+Run from the root of an Archipelago checkout after changing items or locations:
+    python -m worlds.untitled_goose_game.GenerateData --csharp path/to/client/GeneratedIdTables.cs
+and with --check to fail instead of writing when either file is out of date.
+"""
+import argparse
+import json
+import os
+import sys
+from typing import Any, Dict, List, Optional
+
+from .Items import BASE_ID, item_ids, item_names
+from .Locations import LOCATION_REGISTRY
+
+OUTPUT_PATH = os.path.join(os.path.dirname(__file__), "StaticData.py")
+
+HEADER = '''"""Name and id tables of every location, generated by GenerateData.py from Locations.py.
+
+Do not edit by hand, run `python -m worlds.untitled_goose_game.GenerateData` instead."""
+'''
+
+
+def collect_tables() -> Dict[str, Any]:
+    """The tables StaticData.py should hold, built from the source tables"""
+    return {
+        "LOCATION_NAMES": tuple(record.name for record in LOCATION_REGISTRY),
+        "LOCATION_IDS": tuple(record.id for record in LOCATION_REGISTRY),
+    }
+
+
+def render_value(value: Any) -> str:
+    if isinstance(value, tuple):
+        return "(\n" + "".join(f"    {entry!r},\n" for entry in value) + ")"
+    return repr(value)
+
+
+def render(tables: Dict[str, Any]) -> str:
+    return HEADER + "".join(f"\n{name} = {render_value(value)}\n" for name, value in tables.items())
+
+
+CSHARP_TEMPLATE = """// <auto-generated>
+// Generated by GenerateData.py from the apworld's Items.py and Locations.py.
+// Do not edit by hand, run `python -m worlds.untitled_goose_game.GenerateData --csharp <this file>` instead.
+// </auto-generated>
+
+namespace GooseGameAP
+{{
+    /// <summary>
+    /// Every item and location the apworld defines, as id offsets from Plugin.BASE_ID sorted ascending
+    /// with the matching names at the same index. LocationMappings builds its lookups from these.
+    /// </summary>
+    public static class GeneratedIdTables
+    {{
+        public static readonly int[] ItemOffsets =
+        {{
+{item_offsets}
+        }};
+
+        public static readonly string[] ItemNames =
+        {{
+{item_names}
+        }};
+
+        public static readonly int[] LocationOffsets =
+        {{
+{location_offsets}
+        }};
+
+        public static readonly string[] LocationNames =
+        {{
+{location_names}
+        }};
+    }}
+}}
+"""
+
+
+def render_csharp(tables: Dict[str, Any]) -> str:
+    """GeneratedIdTables.cs for the client, with each table sorted by id. The items come straight from Items.py."""
+    def columns(ids, names):
+        pairs = sorted(zip(ids, names))
+        offsets = "\n".join(f"            {entry_id - BASE_ID}," for entry_id, _ in pairs)
+        # JSON string escapes are valid C# string escapes
+        literals = "\n".join(f"            {json.dumps(name)}," for _, name in pairs)
+        return offsets, literals
+
+    item_offsets, item_name_literals = columns(item_ids, item_names)
+    location_offsets, location_name_literals = columns(tables["LOCATION_IDS"], tables["LOCATION_NAMES"])
+    return CSHARP_TEMPLATE.format(
+        item_offsets=item_offsets,
+        item_names=item_name_literals,
+        location_offsets=location_offsets,
+        location_names=location_name_literals,
+    )
+
+
+def verify_csharp(path: str) -> bool:
+    """Whether the client's generated tables at the path match the source tables"""
+    if not os.path.exists(path):
+        return False
+    with open(path, newline="") as file:
+        return file.read() == render_csharp(collect_tables())
+
+
+def verify() -> List[str]:
+    """Every table in StaticData.py that no longer matches the source tables"""
+    from . import StaticData
+    return [
+        name for name, value in collect_tables().items()
+        if getattr(StaticData, name, None) != value
+    ]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Generate the static location tables of Untitled Goose Game")
+    parser.add_argument("--check", action="store_true", help="Only check that the generated files are up to date")
+    parser.add_argument("--csharp", default=None, help="Path of the client's GeneratedIdTables.cs to write or check too")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        stale = verify()
+        if stale:
+            print(f"StaticData.py is out of date ({', '.join(stale)}), run GenerateData to regenerate it")
+        if args.csharp and not verify_csharp(args.csharp):
+            print(f"{args.csharp} is out of date, run GenerateData with --csharp to regenerate it")
+            stale.append(args.csharp)
+        if stale:
+            sys.exit(1)
+        print("Generated tables are up to date")
+        return
+
+    tables = collect_tables()
+    with open(OUTPUT_PATH, "w", newline="\n") as file:
+        file.write(render(tables))
+    print(f"Wrote {OUTPUT_PATH}")
+    if args.csharp:
+        with open(args.csharp, "w", newline="\n") as file:
+            file.write(render_csharp(tables))
+        print(f"Wrote {args.csharp}")
+
+
+if __name__ == "__main__":
+    main()
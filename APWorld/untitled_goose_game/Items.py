@@ -1,4 +1,6 @@
-from typing import Dict, NamedTuple, Optional, Set
+import sys
+from array import array
+from typing import Dict, NamedTuple, Optional, Set, Tuple
 from BaseClasses import Item, ItemClassification
 
 from .names import itemNames
@@ -191,6 +193,204 @@ item_table: Dict[str, GooseGameItemData] = {
 
 }
 
+# Compact, index-based views of item_table. An item's index is its position in item_table,
+# and the same index is used across all of these, so one int lookup replaces the NamedTuple.
+item_names: Tuple[str, ...] = tuple(sys.intern(name) for name in item_table)
+item_ids = array("q", (data.id for data in item_table.values()))
+item_classification_codes = array("B", (int(data.classification) for data in item_table.values()))
+item_index_by_name: Dict[str, int] = {name: index for index, name in enumerate(item_names)}
+
+# Bit of each item in a player's goose_item_mask, set while the player has at least one of it
+item_bits: Dict[str, int] = {name: 1 << index for index, name in enumerate(item_names)}
+
+# Decodes the classification bytes without going through the enum constructor for every item
+item_classifications: Dict[int, ItemClassification] = {
+    code: ItemClassification(code) for code in set(item_classification_codes)
+}
+
+
+# All area access items (5 total)
+area_items: Tuple[str, ...] = (
+    itemNames.GARDEN_ACCESS,
+    itemNames.HIGH_STREET_ACCESS,
+    itemNames.BACK_GARDENS_ACCESS,
+    itemNames.PUB_ACCESS,
+    itemNames.MODEL_VILLAGE_ACCESS,
+)
+
+# NPC Soul items (11 total) - required for NPC-related goals
+npc_soul_items: Tuple[str, ...] = (
+    itemNames.NPC_GROUNDSKEEPER,
+    itemNames.NPC_BOY,
+    itemNames.NPC_TV_SHOP_OWNER,
+    itemNames.NPC_MARKET_LADY,
+    itemNames.NPC_TIDY_NEIGHBOUR,
+    itemNames.NPC_MESSY_NEIGHBOUR,
+    itemNames.NPC_BURLY_MAN,
+    itemNames.NPC_OLD_MAN,
+    itemNames.NPC_PUB_LADY,
+    itemNames.NPC_FANCY_LADIES,
+    itemNames.NPC_COOK,
+)
+
+# Prop Soul items - required for picking up/dragging items
+# NOTE: NPC-tied items (Keys, Gardener Hat, Boy's Glasses, Slipper, Wooly Hat, Pub Cloth, etc)
+prop_soul_items: Tuple[str, ...] = (
+    # Grouped Props (26)
+    itemNames.PROP_CARROTS,
+    itemNames.PROP_TOMATOES,
+    itemNames.PROP_PUMPKINS,
+    itemNames.PROP_TOPSOIL_BAGS,
+    itemNames.PROP_GREEN_QUOITS,
+    itemNames.PROP_PLATES,
+    itemNames.PROP_ORANGES,
+    itemNames.PROP_LEEKS,
+    itemNames.PROP_CUCUMBERS,
+    itemNames.PROP_UMBRELLAS,
+    itemNames.PROP_TINNED_FOOD,
+    itemNames.PROP_SOCKS,
+    itemNames.PROP_PINT_BOTTLES,
+    itemNames.PROP_KNIVES,
+    itemNames.PROP_GUMBOOTS,
+    itemNames.PROP_FORKS,
+    itemNames.PROP_APPLE_CORES,
+    itemNames.PROP_APPLES,
+    itemNames.PROP_SANDWICH,
+    itemNames.PROP_RED_QUOITS,
+    itemNames.PROP_RIBBONS,
+    itemNames.PROP_WALKIE_TALKIES,
+    itemNames.PROP_BOOTS,
+    itemNames.PROP_MINI_PEOPLE,
+    itemNames.PROP_MINI_BENCHES,
+    itemNames.PROP_WEED_TOOLS,
+
+    # Start Area One-Off Props (5)
+    itemNames.PROP_DRINK_CAN,
+    itemNames.PROP_TENNIS_BALL,
+    itemNames.PROP_DUMMY,
+    itemNames.PROP_FISHING_BOBBER,
+    itemNames.PROP_TACKLE_BOX,
+
+    # Garden One-Off Props (15)
+    itemNames.PROP_RADIO,
+    itemNames.PROP_TROWEL,
+    itemNames.PROP_TULIP,
+    itemNames.PROP_JAM,
+    itemNames.PROP_PICNIC_MUG,
+    itemNames.PROP_THERMOS,
+    itemNames.PROP_STRAW_HAT,
+    itemNames.PROP_RAKE,
+    itemNames.PROP_PICNIC_BASKET,
+    itemNames.PROP_ESKY,
+    itemNames.PROP_SHOVEL,
+    itemNames.PROP_WATERING_CAN,
+    itemNames.PROP_MALLET,
+    itemNames.PROP_WOODEN_CRATE,
+    itemNames.PROP_CABBAGES,
+
+    # High Street One-Off Props (22)
+    itemNames.PROP_HORN_RIMMED_GLASSES,
+    itemNames.PROP_RED_GLASSES,
+    itemNames.PROP_SUNGLASSES,
+    itemNames.PROP_LOO_PAPER,
+    itemNames.PROP_TOY_CAR,
+    itemNames.PROP_FOOTBALL,
+    itemNames.PROP_HAIRBRUSH,
+    itemNames.PROP_TOOTHRBRUSH,
+    itemNames.PROP_STEREOSCOPE,
+    itemNames.PROP_DISH_SOAP_BOTTLE,
+    itemNames.PROP_SPRAY_BOTTLE,
+    itemNames.PROP_LILY_FLOWER,
+    itemNames.PROP_TOY_PLANE,
+    itemNames.PROP_CHALK,
+    itemNames.PROP_DUSTBIN_LID,
+    itemNames.PROP_SHOPPING_BASKET,
+    itemNames.PROP_PUSH_BROOM,
+    itemNames.PROP_DUSTBIN,
+    itemNames.PROP_BABY_DOLL,
+    itemNames.PROP_PRICING_GUN,
+    itemNames.PROP_ADDING_MACHINE,
+    itemNames.PROP_GARAGE_ROPE,
+
+    # Back Gardens One-Off Props (24)
+    itemNames.PROP_CRICKET_BALL,
+    itemNames.PROP_BUST_PIPE,
+    itemNames.PROP_BUST_HAT,
+    itemNames.PROP_BUST_GLASSES,
+    itemNames.PROP_TEA_CUP,
+    itemNames.PROP_NEWSPAPER,
+    itemNames.PROP_BADMINTON_RACKET,
+    itemNames.PROP_POT_STACK,
+    itemNames.PROP_SOAP,
+    itemNames.PROP_PAINTBRUSH,
+    itemNames.PROP_VASE,
+    itemNames.PROP_BRA,
+    itemNames.PROP_ROSE,
+    itemNames.PROP_ROSE_BOX,
+    itemNames.PROP_CRICKET_BAT,
+    itemNames.PROP_TEA_POT,
+    itemNames.PROP_CLIPPERS,
+    itemNames.PROP_DUCK_STATUE,
+    itemNames.PROP_FROG_STATUE,
+    itemNames.PROP_JEREMY_FISH,
+    itemNames.PROP_NO_GOOSE_SIGN_MESSY,
+    itemNames.PROP_DRAWER,
+    itemNames.PROP_ENAMEL_JUG,
+    itemNames.PROP_NO_GOOSE_SIGN_CLEAN,
+
+    # Pub Prop One-Off Props (17)
+    itemNames.PROP_LETTER,
+    itemNames.PROP_PINT_GLASSES,
+    itemNames.PROP_TOY_BOAT,
+    itemNames.PROP_PEPPER_GRINDER,
+    itemNames.PROP_CORK,
+    itemNames.PROP_CANDLESTICK,
+    itemNames.PROP_FLOWER_FOR_VASE,
+    itemNames.PROP_HARMONICA,
+    itemNames.PROP_TRAFFIC_CONE,
+    itemNames.PROP_PARCEL,
+    itemNames.PROP_STEALTH_BOX,
+    itemNames.PROP_NO_GOOSE_SIGN_PUB,
+    itemNames.PROP_PORTABLE_STOOL,
+    itemNames.PROP_DARTBOARD,
+    itemNames.PROP_MOP_BUCKET,
+    itemNames.PROP_MOP,
+    itemNames.PROP_BUCKET,
+
+    # Model Village One-Off Props (10)
+    itemNames.PROP_MINI_GOOSE,
+    itemNames.PROP_MINI_MAIL_PILLAR,
+    itemNames.PROP_MINI_PHONE_DOOR,
+    itemNames.PROP_MINI_SHOVEL,
+    itemNames.PROP_POPPY_FLOWER,
+    itemNames.PROP_TIMBER_HANDLE,
+    itemNames.PROP_MINI_BIRDBATH,
+    itemNames.PROP_MINI_EASEL,
+    itemNames.PROP_MINI_PUMP,
+    itemNames.PROP_MINI_SUN_LOUNGE,
+
+    # Golden Bell Soul is always required even when prop souls are turned off, so it's not in this list
+)
+
+
+ItemTemplate = Tuple[str, ItemClassification, int]
+
+
+def get_item_template(name: str) -> ItemTemplate:
+    """The (name, classification, id) an item is created from"""
+    index = item_index_by_name[name]
+    return item_names[index], item_classifications[item_classification_codes[index]], item_ids[index]
+
+
+def get_item_templates(names: Tuple[str, ...]) -> Tuple[ItemTemplate, ...]:
+    return tuple(get_item_template(name) for name in names)
+
+
+area_item_templates = get_item_templates(area_items)
+npc_soul_item_templates = get_item_templates(npc_soul_items)
+prop_soul_item_templates = get_item_templates(prop_soul_items)
+
+
 # Item groups for logical grouping
 ITEM_GROUPS = {
     "Area Unlocks": {
@@ -1,8 +1,15 @@
-from typing import Dict, NamedTuple
+import sys
+from array import array
+from enum import IntFlag
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, NamedTuple, Tuple
 from BaseClasses import Location
 
 from .names import locationNames, regionNames
 
+if TYPE_CHECKING:
+    from .Options import GooseGameOptions
+
 
 class GooseGameLocationData(NamedTuple):
     id: int
@@ -491,39 +498,211 @@ new_tasks_locations: Dict[str, GooseGameLocationData] = {
 }
 
 
+# =============================================================================
+# LOCATION REGISTRY - Every location once, tagged with the option category that enables it
+# =============================================================================
+
+class LocationCategory(IntFlag):
+    MAIN_TASK = 1 << 0
+    EXTRA_TASK = 1 << 1
+    SPEEDRUN_TASK = 1 << 2
+    ITEM_PICKUP = 1 << 3
+    UNIQUE_ITEM_PICKUP = 1 << 4
+    ITEM_DRAG = 1 << 5
+    UNIQUE_ITEM_DRAG = 1 << 6
+    INTERACTION = 1 << 7
+    NEW_TASK = 1 << 8
+    FIRST_PECK = 1 << 9
+    PECK = 1 << 10
+    MILESTONE_MAIN = 1 << 11
+    MILESTONE_EXTRA = 1 << 12
+    MILESTONE_SPEEDRUN = 1 << 13
+    MILESTONE_ALL = 1 << 14
+    GOAL_MODEL_VILLAGE_ENTRY = 1 << 15
+    GOAL_ALL_MAIN = 1 << 16
+    GOAL_ALL_SPEEDRUN = 1 << 17
+    GOAL_ALL_NON_SPEEDRUN = 1 << 18
+    GOAL_ALL_TASKS = 1 << 19
+    GOAL_ALL_FINAL_TASKS = 1 << 20
+    COMPLETION = 1 << 21  # Currently unused, never enabled
+
+
+class LocationRecord(NamedTuple):
+    id: int
+    name: str
+    region: str
+    category: LocationCategory
+
+
+# Goal option value -> the goal location it adds (find_bell has none)
+GOAL_CATEGORIES: Dict[int, LocationCategory] = {
+    0: LocationCategory.GOAL_MODEL_VILLAGE_ENTRY,
+    2: LocationCategory.GOAL_ALL_MAIN,
+    3: LocationCategory.GOAL_ALL_SPEEDRUN,
+    4: LocationCategory.GOAL_ALL_NON_SPEEDRUN,
+    5: LocationCategory.GOAL_ALL_TASKS,
+    6: LocationCategory.GOAL_ALL_FINAL_TASKS,
+}
+
+# Goal option value -> the goal location pre_fill locks the Golden Bell Soul at
+GOAL_LOCATIONS: Dict[int, str] = {
+    0: locationNames.GOAL_MODEL_VILLAGE_ENTRY,
+    2: locationNames.GOAL_ALL_MAIN,
+    3: locationNames.GOAL_ALL_SPEEDRUN,
+    4: locationNames.GOAL_ALL_NON_SPEEDRUN,
+    5: locationNames.GOAL_ALL_TASKS,
+    6: locationNames.GOAL_ALL_FINAL_TASKS,
+}
+
+# Category -> the options that add its locations, which the rule profiler charges their cost to.
+# Main tasks are always there.
+CATEGORY_OPTIONS: Dict[LocationCategory, Tuple[str, ...]] = {
+    LocationCategory.MAIN_TASK: (),
+    LocationCategory.EXTRA_TASK: ("include_extra_tasks",),
+    LocationCategory.SPEEDRUN_TASK: ("include_speedrun_tasks",),
+    LocationCategory.ITEM_PICKUP: ("include_item_pickups",),
+    LocationCategory.UNIQUE_ITEM_PICKUP: ("include_item_pickups",),
+    LocationCategory.ITEM_DRAG: ("include_drag_items",),
+    LocationCategory.UNIQUE_ITEM_DRAG: ("include_drag_items",),
+    LocationCategory.INTERACTION: ("include_interactions",),
+    LocationCategory.NEW_TASK: ("include_new_tasks",),
+    LocationCategory.FIRST_PECK: ("include_model_church_pecks",),
+    LocationCategory.PECK: ("include_model_church_pecks",),
+    LocationCategory.MILESTONE_MAIN: ("include_milestone_locations",),
+    LocationCategory.MILESTONE_EXTRA: ("include_milestone_locations", "include_extra_tasks"),
+    LocationCategory.MILESTONE_SPEEDRUN: ("include_milestone_locations", "include_speedrun_tasks"),
+    LocationCategory.MILESTONE_ALL: ("include_milestone_locations", "include_extra_tasks", "include_speedrun_tasks"),
+    LocationCategory.COMPLETION: (),
+    **{category: ("goal",) for category in GOAL_CATEGORIES.values()},
+}
+
+# Single milestone and goal locations, which get their own category each
+_single_location_categories: Dict[str, LocationCategory] = {
+    locationNames.MILESTONE_ALL_EXTRA: LocationCategory.MILESTONE_EXTRA,
+    locationNames.MILESTONE_ALL_SPEEDRUN: LocationCategory.MILESTONE_SPEEDRUN,
+    locationNames.MILESTONE_ALL_TASKS: LocationCategory.MILESTONE_ALL,
+    locationNames.GOAL_MODEL_VILLAGE_ENTRY: LocationCategory.GOAL_MODEL_VILLAGE_ENTRY,
+    locationNames.GOAL_ALL_MAIN: LocationCategory.GOAL_ALL_MAIN,
+    locationNames.GOAL_ALL_SPEEDRUN: LocationCategory.GOAL_ALL_SPEEDRUN,
+    locationNames.GOAL_ALL_NON_SPEEDRUN: LocationCategory.GOAL_ALL_NON_SPEEDRUN,
+    locationNames.GOAL_ALL_TASKS: LocationCategory.GOAL_ALL_TASKS,
+    locationNames.GOAL_ALL_FINAL_TASKS: LocationCategory.GOAL_ALL_FINAL_TASKS,
+}
+
+
+def _build_registry() -> Tuple[LocationRecord, ...]:
+    """Flattens the tables above into one record per location, in the order regions are filled"""
+    tables = (
+        (location_table, LocationCategory.MAIN_TASK),
+        (extra_locations, LocationCategory.EXTRA_TASK),
+        (speedrun_locations, LocationCategory.SPEEDRUN_TASK),
+        (item_pickup_locations, LocationCategory.ITEM_PICKUP),
+        (unique_item_pickup_locations, LocationCategory.UNIQUE_ITEM_PICKUP),
+        (drag_item_locations, LocationCategory.ITEM_DRAG),
+        (unique_item_drag_locations, LocationCategory.UNIQUE_ITEM_DRAG),
+        (interaction_locations, LocationCategory.INTERACTION),
+        (new_tasks_locations, LocationCategory.NEW_TASK),
+        (sandcastle_first_peck_locations, LocationCategory.FIRST_PECK),
+        (sandcastle_peck_locations, LocationCategory.PECK),
+        (milestone_locations_main_tasks, LocationCategory.MILESTONE_MAIN),
+        (completion_location, LocationCategory.COMPLETION),
+    )
+    records = [
+        LocationRecord(data.id, sys.intern(name), data.region, category)
+        for table, category in tables
+        for name, data in table.items()
+    ]
+    # The rest of the milestone table, ordered by when create_regions adds them
+    singles = sorted(_single_location_categories.items(), key=lambda entry: entry[1])
+    records.extend(
+        LocationRecord(milestone_locations[name].id, sys.intern(name), milestone_locations[name].region, category)
+        for name, category in singles
+    )
+    return tuple(records)
+
+
+LOCATION_REGISTRY: Tuple[LocationRecord, ...] = _build_registry()
+# Parallel id array and name index into LOCATION_REGISTRY
+location_ids = array("q", (record.id for record in LOCATION_REGISTRY))
+location_index_by_name: Dict[str, int] = {record.name: index for index, record in enumerate(LOCATION_REGISTRY)}
+
+
+def get_location_categories(options: "GooseGameOptions") -> LocationCategory:
+    """The categories of location a set of options enables"""
+    categories = LocationCategory.MAIN_TASK
+    
+    if options.include_extra_tasks:
+        categories |= LocationCategory.EXTRA_TASK
+    if options.include_speedrun_tasks:
+        categories |= LocationCategory.SPEEDRUN_TASK
+    if options.include_item_pickups:
+        categories |= LocationCategory.ITEM_PICKUP | LocationCategory.UNIQUE_ITEM_PICKUP
+    if options.include_drag_items:
+        categories |= LocationCategory.ITEM_DRAG | LocationCategory.UNIQUE_ITEM_DRAG
+    if options.include_interactions:
+        categories |= LocationCategory.INTERACTION
+    if options.include_new_tasks:
+        categories |= LocationCategory.NEW_TASK
+    
+    pecking = options.include_model_church_pecks.value
+    if pecking == 1:
+        categories |= LocationCategory.FIRST_PECK
+    elif pecking == 2:
+        categories |= LocationCategory.PECK
+    
+    if options.include_milestone_locations:
+        categories |= LocationCategory.MILESTONE_MAIN
+        if options.include_extra_tasks:
+            categories |= LocationCategory.MILESTONE_EXTRA
+        if options.include_speedrun_tasks:
+            categories |= LocationCategory.MILESTONE_SPEEDRUN
+        if options.include_extra_tasks and options.include_speedrun_tasks:
+            categories |= LocationCategory.MILESTONE_ALL
+    
+    categories |= GOAL_CATEGORIES.get(options.goal.value, 0)
+    return categories
+
+
+@lru_cache(maxsize=None)
+def get_locations_for_categories(categories: int) -> Tuple[LocationRecord, ...]:
+    """Every location in the given categories, in the order regions are filled.
+
+    Computed once per process for each combination, so slots with the same options share it."""
+    return tuple(record for record in LOCATION_REGISTRY if record.category & categories)
+
+
 def get_all_locations(include_extra: bool = False, include_speedrun: bool = False, 
                       include_items: bool = True, include_drags: bool = True,
                       include_interactions: bool = True, include_unique: bool = True,
                       include_sandcastle: bool = True) -> Dict[str, GooseGameLocationData]:
     """Get locations based on options (for region creation)"""
-    locations = dict(location_table)
+    categories = LocationCategory.MAIN_TASK
     
     if include_extra:
-        locations.update(extra_locations)
-        locations.update(completion_location)
+        categories |= LocationCategory.EXTRA_TASK | LocationCategory.COMPLETION
     
     if include_speedrun:
-        locations.update(speedrun_locations)
+        categories |= LocationCategory.SPEEDRUN_TASK
     
     if include_items:
-        locations.update(item_pickup_locations)
+        categories |= LocationCategory.ITEM_PICKUP
     
     if include_drags:
-        locations.update(drag_item_locations)
+        categories |= LocationCategory.ITEM_DRAG
     
     if include_interactions:
-        locations.update(interaction_locations)
-    
-    if include_unique:
-        locations.update(unique_item_pickup_locations)
+        categories |= LocationCategory.INTERACTION
     
     if include_unique:
-        locations.update(unique_item_drag_locations)
+        categories |= LocationCategory.UNIQUE_ITEM_PICKUP | LocationCategory.UNIQUE_ITEM_DRAG
     
     if include_sandcastle:
-        locations.update(sandcastle_peck_locations)
+        categories |= LocationCategory.PECK
     
-    return locations
+    return {
+        record.name: GooseGameLocationData(record.id, record.region)
+        for record in get_locations_for_categories(categories)
+    }
 
 
 def get_all_location_ids() -> Dict[str, int]:
@@ -532,18 +711,4 @@ def get_all_location_ids() -> Dict[str, int]:
     IMPORTANT: AP requires all possible locations registered upfront,
     regardless of whether they're enabled by options.
     """
-    all_locs = {}
-    all_locs.update({name: data.id for name, data in location_table.items()})
-    all_locs.update({name: data.id for name, data in extra_locations.items()})
-    all_locs.update({name: data.id for name, data in speedrun_locations.items()})
-    all_locs.update({name: data.id for name, data in completion_location.items()})
-    all_locs.update({name: data.id for name, data in milestone_locations.items()})
-    all_locs.update({name: data.id for name, data in item_pickup_locations.items()})
-    all_locs.update({name: data.id for name, data in drag_item_locations.items()})
-    all_locs.update({name: data.id for name, data in interaction_locations.items()})
-    all_locs.update({name: data.id for name, data in unique_item_pickup_locations.items()})
-    all_locs.update({name: data.id for name, data in unique_item_drag_locations.items()})
-    all_locs.update({name: data.id for name, data in sandcastle_peck_locations.items()})
-    all_locs.update({name: data.id for name, data in sandcastle_first_peck_locations.items()})
-    all_locs.update({name: data.id for name, data in new_tasks_locations.items()})
-    return all_locs
+    return dict(zip((record.name for record in LOCATION_REGISTRY), location_ids))
\ No newline at end of file
@@ -0,0 +1,27 @@
+"""Compact id lists sent to the client in slot_data.
+
+A manifest is a sorted list of ids, stored as offsets from BASE_ID where each entry is the difference to the one
+before it, so the JSON stays short. The client rebuilds the sorted ids once on connect and binary searches them.
+Bump MANIFEST_VERSION whenever the encoding changes, the client ignores manifests of versions it doesn't know.
+"""
+from itertools import accumulate
+from typing import Iterable, List
+
+from .Items import BASE_ID
+
+MANIFEST_VERSION = 1
+
+
+def encode_id_manifest(ids: Iterable[int]) -> List[int]:
+    """Sorted, delta-encoded offsets of the ids from BASE_ID"""
+    manifest = []
+    previous = BASE_ID
+    for value in sorted(set(ids)):
+        manifest.append(value - previous)
+        previous = value
+    return manifest
+
+
+def decode_id_manifest(manifest: Iterable[int]) -> List[int]:
+    """The sorted ids a manifest was encoded from"""
+    return list(accumulate(manifest, initial=BASE_ID))[1:]
@@ -15,6 +15,13 @@ class StartingArea(Choice):
     default = 4  # Random by default
 
 
+class ProgressiveAreaAccess(Toggle):
+    """Replaces the area access items with Progressive Area items. Each one opens the next area in order:
+    the starting area first, then the rest of Garden, High Street, Back Gardens and Pub, and the Model Village last."""
+    display_name = "Progressive Area Access"
+    default = False
+
+
 class Goal(Choice):
     """Victory is always when you steal the Golden Bell and bring it home. Goal settings change how it spawns:
     only_steal = Simply reach the bell and steal it!
@@ -214,6 +221,7 @@ class DeathLink(Toggle):
 @dataclass
 class GooseGameOptions(PerGameCommonOptions):
     starting_area: StartingArea
+    progressive_area_access: ProgressiveAreaAccess
     goal: Goal
     include_npc_souls: IncludeNPCSouls
     logically_require_npc_souls: LogicallyRequireNPCSouls
@@ -0,0 +1,248 @@
+"""Opt-in timing of the goose world's generation steps and rules.
+
+Set GOOSE_PROFILE to turn it on. Each goose slot then logs a short summary once its slot data is filled.
+When GOOSE_PROFILE names an existing directory, the full report is written there as
+goose_profile_<seed>_P<player>.json; for any other value the report is logged as JSON instead.
+With GOOSE_PROFILE unset nothing is wrapped, so generation runs the plain methods.
+
+Set GOOSE_PROFILE_RULES as well (or instead) to also time every location rule on its own. The report then
+lists the most called and most expensive location rules, the top 10 or however many GOOSE_PROFILE_RULES says,
+and how much of the rule time each option that added locations is responsible for.
+"""
+import os
+import time
+from functools import wraps
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from BaseClasses import CollectionState
+
+if TYPE_CHECKING:
+    from . import GooseGameWorld
+    from .Requirements import Rule
+
+GOOSE_PROFILE = os.environ.get("GOOSE_PROFILE", "")
+GOOSE_PROFILE_RULES = os.environ.get("GOOSE_PROFILE_RULES", "")
+PROFILING = bool(GOOSE_PROFILE or GOOSE_PROFILE_RULES)
+
+# How many location rules the hot spot lists show
+RULE_TOP = int(GOOSE_PROFILE_RULES) if GOOSE_PROFILE_RULES.isdigit() else 10
+
+# Locations that are always there are charged to this instead of an option
+BASE_FLAG = "base"
+
+# UntitledGooseRules methods that aren't rules themselves
+NON_RULE_METHODS = frozenset((
+    "rule", "location_rule", "region_items", "set_rules", "get_item_dependents"
+))
+
+# World steps that are timed, in the order Archipelago calls them.
+# The report is written once the last of them is done.
+PROFILED_STAGES = ("generate_early", "create_regions", "create_items", "set_rules", "pre_fill", "fill_slot_data")
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class RuleStats:
+    """Call count and total time of one rule, in seconds"""
+    __slots__ = ("calls", "seconds")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.seconds = 0.0
+
+    def to_json(self) -> Dict[str, Any]:
+        return {"calls": self.calls, "seconds": self.seconds}
+
+
+class LocationRuleStats(RuleStats):
+    """Call count and total time of one location's rule, with the rule method and options behind it"""
+    __slots__ = ("rule", "flags")
+
+    def __init__(self, rule: str, flags: Tuple[str, ...]) -> None:
+        super().__init__()
+        self.rule = rule
+        self.flags = flags or (BASE_FLAG,)
+
+    def to_json(self) -> Dict[str, Any]:
+        return {"rule": self.rule, "flags": list(self.flags), **super().to_json()}
+
+
+class GooseProfile:
+    """Timings collected for one goose slot"""
+
+    def __init__(self, world: "GooseGameWorld") -> None:
+        self.world = world
+        self.stages: Dict[str, float] = {}
+        # Rule method -> time spent building its requirement while the rules were set
+        self.builds: Dict[str, RuleStats] = {}
+        # Rule method -> time spent evaluating its compiled rule during fill and sweeps
+        self.evaluations: Dict[str, RuleStats] = {}
+        # Location name -> time spent evaluating that location's rule, only kept with GOOSE_PROFILE_RULES
+        self.locations: Dict[str, LocationRuleStats] = {}
+
+    def stats(self, table: Dict[str, RuleStats], name: str) -> RuleStats:
+        stats = table.get(name)
+        if stats is None:
+            stats = table[name] = RuleStats()
+        return stats
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "game": self.world.game,
+            "player": self.world.player,
+            "player_name": self.world.multiworld.get_player_name(self.world.player),
+            "stages": self.stages,
+            "builds": {name: stats.to_json() for name, stats in self.builds.items()},
+            "evaluations": {name: stats.to_json() for name, stats in self.evaluations.items()},
+            "locations": {name: stats.to_json() for name, stats in self.locations.items()},
+            "flags": {flag: stats.to_json() for flag, stats in self.flag_costs().items()},
+        }
+
+    def flag_costs(self) -> Dict[str, RuleStats]:
+        """Location rule time per option. A location added by several options counts fully for each of them."""
+        costs: Dict[str, RuleStats] = {}
+        for stats in self.locations.values():
+            for flag in stats.flags:
+                cost = self.stats(costs, flag)
+                cost.calls += stats.calls
+                cost.seconds += stats.seconds
+        return costs
+
+    def summary(self, top: int = 5) -> str:
+        lines = [f"Goose profile for {self.world.multiworld.get_player_name(self.world.player)}:"]
+        lines += [f"  {stage:<16}{seconds * 1000:9.2f} ms" for stage, seconds in self.stages.items()]
+        for title, table in (("Slowest rule builds", self.builds), ("Slowest rule evaluations", self.evaluations)):
+            slowest = sorted(table.items(), key=lambda entry: entry[1].seconds, reverse=True)[:top]
+            if slowest:
+                lines.append(f"  {title}:")
+                lines += [
+                    f"    {name:<40}{stats.calls:9} calls{stats.seconds * 1000:9.2f} ms" for name, stats in slowest
+                ]
+        if self.locations:
+            lines += self.hot_spots(RULE_TOP)
+        return "\n".join(lines)
+
+    def hot_spots(self, top: int) -> List[str]:
+        lines = []
+        for title, key in (
+            ("Most called location rules", lambda entry: entry[1].calls),
+            ("Most expensive location rules", lambda entry: entry[1].seconds),
+        ):
+            lines.append(f"  {title}:")
+            lines += [
+                f"    {name:<48}{stats.rule:<32}{stats.calls:9} calls{stats.seconds * 1000:9.2f} ms"
+                f"  ({', '.join(stats.flags)})"
+                for name, stats in sorted(self.locations.items(), key=key, reverse=True)[:top]
+            ]
+        lines.append("  Location rule time by option:")
+        lines += [
+            f"    {flag:<48}{stats.calls:9} calls{stats.seconds * 1000:9.2f} ms"
+            for flag, stats in sorted(self.flag_costs().items(), key=lambda entry: entry[1].seconds, reverse=True)
+        ]
+        return lines
+
+    def write_report(self) -> None:
+        # Only needed once a profiled slot finishes, so importing the world doesn't load them
+        import json
+        import logging
+
+        logging.info(self.summary())
+        if not os.path.isdir(GOOSE_PROFILE):
+            logging.info(f"Goose profile: {json.dumps(self.to_json())}")
+            return
+        path = os.path.join(GOOSE_PROFILE, f"goose_profile_{self.world.multiworld.seed_name}_P{self.world.player}.json")
+        with open(path, "w") as file:
+            json.dump(self.to_json(), file, indent=2)
+        logging.info(f"Goose profile written to {path}")
+
+
+def get_profile(world: "GooseGameWorld") -> GooseProfile:
+    profile = world.__dict__.get("goose_profile")
+    if profile is None:
+        profile = world.goose_profile = GooseProfile(world)
+    return profile
+
+
+def profile_stage(method: F) -> F:
+    """Times a GooseGameWorld step, writing the slot's report after the last one"""
+    if not PROFILING:
+        return method
+    stage = method.__name__
+
+    @wraps(method)
+    def timed(world: "GooseGameWorld", *args, **kwargs):
+        profile = get_profile(world)
+        start = time.perf_counter()
+        try:
+            return method(world, *args, **kwargs)
+        finally:
+            profile.stages[stage] = profile.stages.get(stage, 0.0) + time.perf_counter() - start
+            if stage == PROFILED_STAGES[-1]:
+                profile.write_report()
+
+    return timed  # type: ignore[return-value]
+
+
+def profile_rule_methods(rules_class: type) -> None:
+    """Counts and times every rule method of UntitledGooseRules while the requirements are built.
+
+    Times are inclusive, so a rule made of other rules also counts the time spent building those."""
+    if not PROFILING:
+        return
+    for name, method in list(vars(rules_class).items()):
+        if name.startswith("_") or not callable(method) or name in NON_RULE_METHODS:
+            continue
+        setattr(rules_class, name, _timed_rule_method(method))
+
+
+def _timed_rule_method(method: Callable) -> Callable:
+    name = method.__name__
+
+    @wraps(method)
+    def timed(rules, *args, **kwargs):
+        profile = get_profile(rules.world)
+        stats = profile.stats(profile.builds, name)
+        start = time.perf_counter()
+        try:
+            return method(rules, *args, **kwargs)
+        finally:
+            stats.calls += 1
+            stats.seconds += time.perf_counter() - start
+
+    return timed
+
+
+def profile_compiled_rule(
+    world: "GooseGameWorld", name: str, compiled: "Rule", location: Optional[str] = None, flags: Tuple[str, ...] = ()
+) -> "Rule":
+    """Wraps a compiled rule so its evaluations are counted under the rule method it came from,
+    and under its location too when GOOSE_PROFILE_RULES is set"""
+    if not PROFILING:
+        return compiled
+    profile = get_profile(world)
+    stats = profile.stats(profile.evaluations, name)
+    clock = time.perf_counter
+
+    if location is not None and GOOSE_PROFILE_RULES:
+        location_stats = profile.locations[location] = LocationRuleStats(name, flags)
+
+        def timed_location(state: CollectionState) -> bool:
+            start = clock()
+            result = compiled(state)
+            elapsed = clock() - start
+            stats.seconds += elapsed
+            stats.calls += 1
+            location_stats.seconds += elapsed
+            location_stats.calls += 1
+            return result
+
+        return timed_location
+
+    def timed(state: CollectionState) -> bool:
+        start = clock()
+        result = compiled(state)
+        stats.seconds += clock() - start
+        stats.calls += 1
+        return result
+
+    return timed
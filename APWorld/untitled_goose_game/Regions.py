@@ -1,13 +1,6 @@
 from typing import TYPE_CHECKING
 from BaseClasses import Region
-from .Locations import (
-    BASE_ID, location_table, extra_locations, speedrun_locations, completion_location,
-    milestone_locations, item_pickup_locations, drag_item_locations, interaction_locations,
-    unique_item_pickup_locations, unique_item_drag_locations, sandcastle_peck_locations,
-    sandcastle_first_peck_locations, milestone_locations_main_tasks, new_tasks_locations,
-    GooseGameLocation
-)
-from .Rules import UntitledGooseRules
+from .Locations import GooseGameLocation, get_location_categories, get_locations_for_categories
 from .names import itemNames, locationNames, regionNames
 
 if TYPE_CHECKING:
@@ -35,7 +28,7 @@ def create_regions(world: "GooseGameWorld") -> None:
     
     multiworld = world.multiworld
     player = world.player
-    rules = UntitledGooseRules(world)
+    rules = world.get_rules()
     
     # Create regions
     menu = Region(regionNames.MENU, player, multiworld)
@@ -55,102 +48,22 @@ def create_regions(world: "GooseGameWorld") -> None:
     
     # All areas connect directly FROM the hub
     # Rules for these entrances are set in Rules.py
-    hub.connect(garden, lambda state: rules.has_garden(state))
-    hub.connect(high_street, lambda state: rules.has_high_street(state))
-    hub.connect(back_gardens, lambda state: rules.has_back_gardens(state))
-    hub.connect(pub, lambda state: rules.has_pub(state))
-    hub.connect(model_village, lambda state: rules.has_model_village(state))
+    hub.connect(garden, rules.rule(rules.has_garden))
+    hub.connect(high_street, rules.rule(rules.has_high_street))
+    hub.connect(back_gardens, rules.rule(rules.has_back_gardens))
+    hub.connect(pub, rules.rule(rules.has_pub))
+    hub.connect(model_village, rules.rule(rules.has_model_village))
     
-    # Helper to add location to correct region
-    def add_location(loc_name: str, loc_id: int, region_name: str):
-        region = multiworld.get_region(region_name, player)
-        location = GooseGameLocation(player, loc_name, loc_id, region)
-        region.locations.append(location)
+    # Resolve each region once instead of looking it up for every location
+    regions = {region.name: region for region in (menu, hub, garden, high_street, back_gardens, pub, model_village)}
     
-    # Add main task locations (always included)
-    for loc_name, loc_data in location_table.items():
-        add_location(loc_name, loc_data.id, loc_data.region)
+    records = get_locations_for_categories(get_location_categories(world.options))
+    for record in records:
+        region = regions[record.region]
+        region.locations.append(GooseGameLocation(player, record.name, record.id, region))
     
-    # Add extra task locations if enabled
-    if world.options.include_extra_tasks:
-        for loc_name, loc_data in extra_locations.items():
-            add_location(loc_name, loc_data.id, loc_data.region)
-    
-    # Add speedrun goal locations if enabled
-    if world.options.include_speedrun_tasks:
-        for loc_name, loc_data in speedrun_locations.items():
-            add_location(loc_name, loc_data.id, loc_data.region)
-    
-    # Add item pickup locations if enabled
-    if world.options.include_item_pickups:
-        for loc_name, loc_data in item_pickup_locations.items():
-            add_location(loc_name, loc_data.id, loc_data.region)
-        
-        # Add unique tracked item pickup locations (position-based carrots, etc.)
-        for loc_name, loc_data in unique_item_pickup_locations.items():
-            add_location(loc_name, loc_data.id, loc_data.region)
-    
-    # Add drag item locations if enabled (separate toggle from pickups)
-    if world.options.include_drag_items:
-        for loc_name, loc_data in drag_item_locations.items():
-            add_location(loc_name, loc_data.id, loc_data.region)
-        
-        # Add unique tracked item drag locations (position-based carrots, etc.)
-        for loc_name, loc_data in unique_item_drag_locations.items():
-            add_location(loc_name, loc_data.id, loc_data.region)
-    
-    # Add interaction locations if enabled
-    if world.options.include_interactions:
-        for loc_name, loc_data in interaction_locations.items():
-            add_location(loc_name, loc_data.id, loc_data.region)
-    
-    # Add new tasks locations if enabled
-    if world.options.include_new_tasks:
-        for loc_name, loc_data in new_tasks_locations.items():
-            add_location(loc_name, loc_data.id, loc_data.region)
-    
-    # Add sandcastle peck locations if enabled
-    pecking = world.options.include_model_church_pecks.value
-    if pecking == 1:
-        for loc_name, loc_data in sandcastle_first_peck_locations.items():
-            add_location(loc_name, loc_data.id, loc_data.region)
-    elif pecking == 2:
-        for loc_name, loc_data in sandcastle_peck_locations.items():
-            add_location(loc_name, loc_data.id, loc_data.region)
-    
-    # Add milestone locations if enabled
-    if world.options.include_milestone_locations:
-        for loc_name, loc_data in milestone_locations_main_tasks.items():
-            add_location(loc_name, loc_data.id, loc_data.region)
-    
-        # Add extra task milestone if enabled
-        if world.options.include_extra_tasks:
-            add_location(locationNames.MILESTONE_ALL_EXTRA, BASE_ID + 85, regionNames.HUB)
-        
-        # Add speedrun task milestone if enabled
-        if world.options.include_speedrun_tasks:
-            add_location(locationNames.MILESTONE_ALL_SPEEDRUN, BASE_ID + 86, regionNames.HUB)
-    
-        # Add all tasks milestone if both extra and speedrun are enabled
-        if world.options.include_extra_tasks and world.options.include_speedrun_tasks:
-            add_location(locationNames.MILESTONE_ALL_TASKS, BASE_ID + 90, regionNames.HUB)
-        
-    
-    # Add locations based on goal option
-    goal = world.options.goal.value
-    if goal == 0:  # Just reach the bell
-        add_location(locationNames.GOAL_MODEL_VILLAGE_ENTRY, BASE_ID + 93, regionNames.MODEL_VILLAGE)
-    # elif goal == 1:  # Find bell
-    elif goal == 2:  # All main tasks
-        add_location(locationNames.GOAL_ALL_MAIN, BASE_ID + 89, regionNames.HUB)
-    elif goal == 3:  # Only speedrun tasks
-        add_location(locationNames.GOAL_ALL_SPEEDRUN, BASE_ID + 87, regionNames.HUB)
-    elif goal == 4:  # All except speedrun tasks
-        add_location(locationNames.GOAL_ALL_NON_SPEEDRUN, BASE_ID + 92, regionNames.HUB)
-    elif goal == 5:  # All tasks
-        add_location(locationNames.GOAL_ALL_TASKS, BASE_ID + 91, regionNames.HUB)
-    elif goal == 6:  # Four Final Tasks
-        add_location(locationNames.GOAL_ALL_FINAL_TASKS, BASE_ID + 94, regionNames.HUB)
+    # create_items sizes the filler from this instead of scanning the multiworld for unfilled locations
+    world.location_count = len(records)
     
     
     # Base items always needed
@@ -160,4 +73,4 @@ def create_regions(world: "GooseGameWorld") -> None:
     ]
     
     if world.options.include_prop_souls.value:
-        base_items.extend([itemNames.PROP_TIMBER_HANDLE])
\ No newline at end of file
+        base_items.extend([itemNames.PROP_TIMBER_HANDLE])
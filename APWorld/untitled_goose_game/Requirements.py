@@ -0,0 +1,599 @@
+from functools import wraps
+from itertools import combinations
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple, TypeVar
+
+from BaseClasses import CollectionState
+
+# Rules with more alternative item sets than this stay as a tree of small checks instead of being flattened
+DNF_LIMIT = 16
+
+# Counting rules with more terms than this are evaluated by counting instead of being expanded into item sets
+AT_LEAST_EXPANSION_LIMIT = 8
+
+
+class Requirement:
+    """Immutable description of what the player needs for a rule to pass.
+
+    The rule methods in Rules.py build these out of item checks combined with & and |,
+    and RequirementCompiler.compile turns the result into a plain CollectionState predicate once per world.
+    Option checks are resolved while building, so they never reach the compiled rule."""
+    __slots__ = ("_hash",)
+
+    def __and__(self, other: "Requirement") -> "Requirement":
+        return all_of(self, other)
+
+    def __or__(self, other: "Requirement") -> "Requirement":
+        return any_of(self, other)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __bool__(self) -> bool:
+        raise TypeError("Requirements must be combined with & and |, not 'and' and 'or'")
+
+
+class Constant(Requirement):
+    __slots__ = ("value",)
+
+    def __init__(self, value: bool) -> None:
+        self.value = value
+        self._hash = hash(value)
+
+    __hash__ = Requirement.__hash__
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Constant) and other.value == self.value
+
+    def __repr__(self) -> str:
+        return "ALWAYS" if self.value else "NEVER"
+
+
+ALWAYS = Constant(True)
+NEVER = Constant(False)
+
+
+class Has(Requirement):
+    __slots__ = ("item", "count")
+
+    def __init__(self, item: str, count: int = 1) -> None:
+        self.item = item
+        self.count = count
+        self._hash = hash((item, count))
+
+    __hash__ = Requirement.__hash__
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Has) and other.item == self.item and other.count == self.count
+
+    def __repr__(self) -> str:
+        if self.count == 1:
+            return f"Has({self.item!r})"
+        return f"Has({self.item!r}, {self.count})"
+
+
+class AllOf(Requirement):
+    __slots__ = ("children",)
+
+    def __init__(self, children: Tuple[Requirement, ...]) -> None:
+        self.children = children
+        self._hash = hash(("all", children))
+
+    __hash__ = Requirement.__hash__
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, AllOf) and other._hash == self._hash and other.children == self.children
+
+    def __repr__(self) -> str:
+        return f"AllOf{self.children!r}"
+
+
+class AnyOf(Requirement):
+    __slots__ = ("children",)
+
+    def __init__(self, children: Tuple[Requirement, ...]) -> None:
+        self.children = children
+        self._hash = hash(("any", children))
+
+    __hash__ = Requirement.__hash__
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, AnyOf) and other._hash == self._hash and other.children == self.children
+
+    def __repr__(self) -> str:
+        return f"AnyOf{self.children!r}"
+
+
+class AtLeast(Requirement):
+    """Passes when the weights of the satisfied terms add up to at least the threshold"""
+    __slots__ = ("threshold", "terms")
+
+    def __init__(self, threshold: int, terms: Tuple[Tuple[Requirement, int], ...]) -> None:
+        self.threshold = threshold
+        self.terms = terms
+        self._hash = hash(("at_least", threshold, terms))
+
+    __hash__ = Requirement.__hash__
+
+    def __eq__(self, other) -> bool:
+        return (
+            isinstance(other, AtLeast)
+            and other._hash == self._hash
+            and other.threshold == self.threshold
+            and other.terms == self.terms
+        )
+
+    def __repr__(self) -> str:
+        return f"AtLeast({self.threshold}, {self.terms!r})"
+
+
+class Task(Requirement):
+    """A named in-game task that other rules build on.
+
+    Flattening looks straight through it, but when it has to be compiled as a tree
+    its result is memoized on the CollectionState until the player's items change."""
+    __slots__ = ("name", "requirement")
+
+    def __init__(self, name: str, requirement: Requirement) -> None:
+        self.name = name
+        self.requirement = requirement
+        self._hash = hash(("task", name, requirement))
+
+    __hash__ = Requirement.__hash__
+
+    def __eq__(self, other) -> bool:
+        return (
+            isinstance(other, Task)
+            and other._hash == self._hash
+            and other.name == self.name
+            and other.requirement == self.requirement
+        )
+
+    def __repr__(self) -> str:
+        return f"Task({self.name!r})"
+
+
+# ----- Construction -----
+
+def _unique(requirements: Iterable[Requirement]) -> Tuple[Requirement, ...]:
+    return tuple(dict.fromkeys(requirements))
+
+
+def all_of(*requirements: Requirement) -> Requirement:
+    children: List[Requirement] = []
+    for requirement in requirements:
+        if requirement is NEVER:
+            return NEVER
+        if isinstance(requirement, AllOf):
+            children.extend(requirement.children)
+        elif requirement is not ALWAYS:
+            children.append(requirement)
+    unique = _unique(children)
+    if not unique:
+        return ALWAYS
+    if len(unique) == 1:
+        return unique[0]
+    return AllOf(unique)
+
+
+def any_of(*requirements: Requirement) -> Requirement:
+    children: List[Requirement] = []
+    for requirement in requirements:
+        if requirement is ALWAYS:
+            return ALWAYS
+        if isinstance(requirement, AnyOf):
+            children.extend(requirement.children)
+        elif requirement is not NEVER:
+            children.append(requirement)
+    unique = _unique(children)
+    if not unique:
+        return NEVER
+    if len(unique) == 1:
+        return unique[0]
+    return AnyOf(unique)
+
+
+def weighted_at_least(threshold: int, terms: Iterable[Tuple[Requirement, int]]) -> Requirement:
+    """Passes when the weights of the satisfied requirements add up to at least the threshold"""
+    remaining: List[Tuple[Requirement, int]] = []
+    for requirement, weight in terms:
+        if weight <= 0 or requirement is NEVER:
+            continue
+        if requirement is ALWAYS:
+            threshold -= weight
+        else:
+            remaining.append((requirement, weight))
+
+    if threshold <= 0:
+        return ALWAYS
+    total = sum(weight for _, weight in remaining)
+    if total < threshold:
+        return NEVER
+    if total == threshold:
+        return all_of(*(requirement for requirement, _ in remaining))
+    if all(weight >= threshold for _, weight in remaining):
+        return any_of(*(requirement for requirement, _ in remaining))
+    return AtLeast(threshold, tuple(remaining))
+
+
+def at_least(count: int, *requirements: Requirement) -> Requirement:
+    """Passes when at least count of the requirements pass"""
+    return weighted_at_least(count, ((requirement, 1) for requirement in requirements))
+
+
+RulesT = TypeVar("RulesT")
+
+
+def task(builder: Callable[[RulesT], Requirement]) -> Callable[[RulesT], Requirement]:
+    """Marks a rule method as a named task.
+
+    The requirement is built once per rules instance and kept in its tasks dict,
+    so every rule that builds on the task shares the same node."""
+    name = builder.__name__
+
+    @wraps(builder)
+    def build_task(self) -> Requirement:
+        requirement = self.tasks.get(name)
+        if requirement is None:
+            requirement = builder(self)
+            if not isinstance(requirement, (Constant, Has)):
+                requirement = Task(name, requirement)
+            self.tasks[name] = requirement
+        return requirement
+
+    return build_task
+
+
+# ----- Flattening -----
+
+Clause = FrozenSet[Has]
+
+
+def _absorb(clauses: Iterable[Clause]) -> List[Clause]:
+    """Drops every item set that is a superset of another, since it can never be the cheaper way through"""
+    kept: List[Clause] = []
+    for clause in sorted(set(clauses), key=len):
+        if not any(other <= clause for other in kept):
+            kept.append(clause)
+    return kept
+
+
+def _expand_at_least(requirement: AtLeast) -> Optional[Requirement]:
+    """Rewrites a counting rule as an AnyOf over its minimal passing combinations"""
+    terms = requirement.terms
+    if len(terms) > AT_LEAST_EXPANSION_LIMIT:
+        return None
+
+    passing: List[FrozenSet[int]] = []
+    for size in range(1, len(terms) + 1):
+        for indices in combinations(range(len(terms)), size):
+            if sum(terms[index][1] for index in indices) < requirement.threshold:
+                continue
+            chosen = frozenset(indices)
+            if not any(smaller <= chosen for smaller in passing):
+                passing.append(chosen)
+
+    return any_of(*(
+        all_of(*(terms[index][0] for index in sorted(indices)))
+        for indices in passing
+    ))
+
+
+# ----- Compilation -----
+
+Rule = Callable[[CollectionState], bool]
+
+
+def _always(state: CollectionState) -> bool:
+    return True
+
+
+def _never(state: CollectionState) -> bool:
+    return False
+
+
+def _simple_items(checks: Iterable[Has]) -> Optional[FrozenSet[str]]:
+    """Item names of a group of single-copy checks, or None if any of them needs more than one copy"""
+    items = set()
+    for check in checks:
+        if check.count != 1:
+            return None
+        items.add(check.item)
+    return frozenset(items)
+
+
+# The world keeps state.goose_item_mask in step with prog_items as items are collected and removed,
+# with one bit set per item the player has, so single-copy checks are a couple of integer operations.
+
+def _has_all_items(mask: int, player: int) -> Rule:
+    return lambda state: state.goose_item_mask[player] & mask == mask
+
+
+def _has_any_item(mask: int, player: int) -> Rule:
+    return lambda state: state.goose_item_mask[player] & mask != 0
+
+
+class RequirementCompiler:
+    """Lowers requirements into CollectionState predicates for one player.
+
+    Anything small enough is flattened into alternative item sets and checked as goose_item_mask bit tests,
+    everything else becomes a short-circuiting tree of those checks.
+    Shared sub-requirements are flattened and compiled only once per compiler."""
+
+    def __init__(self, player: int, item_bits: Dict[str, int], dnf_limit: int = DNF_LIMIT) -> None:
+        self.player = player
+        self.item_bits = item_bits
+        self.dnf_limit = dnf_limit
+        self.dnf_cache: Dict[Requirement, Optional[List[Clause]]] = {}
+        self.rule_cache: Dict[Requirement, Rule] = {}
+        self.assume_cache: Dict[Tuple[Requirement, Clause], Requirement] = {}
+        self.items_cache: Dict[Requirement, FrozenSet[str]] = {}
+
+    def to_dnf(self, requirement: Requirement) -> Optional[List[Clause]]:
+        """Flattens a requirement into alternative item sets, any one of which is enough on its own.
+
+        Returns None when the result would need more than dnf_limit item sets."""
+        if requirement is ALWAYS:
+            return [frozenset()]
+        if requirement is NEVER:
+            return []
+        if isinstance(requirement, Has):
+            return [frozenset((requirement,))]
+        if isinstance(requirement, Task):
+            return self.to_dnf(requirement.requirement)
+
+        if requirement in self.dnf_cache:
+            return self.dnf_cache[requirement]
+        clauses = self.dnf_cache[requirement] = self._to_dnf(requirement)
+        return clauses
+
+    def _to_dnf(self, requirement: Requirement) -> Optional[List[Clause]]:
+        if isinstance(requirement, AnyOf):
+            clauses: List[Clause] = []
+            for child in requirement.children:
+                child_clauses = self.to_dnf(child)
+                if child_clauses is None:
+                    return None
+                clauses = _absorb(clauses + child_clauses)
+                if len(clauses) > self.dnf_limit:
+                    return None
+            return clauses
+
+        if isinstance(requirement, AllOf):
+            clauses = [frozenset()]
+            for child in requirement.children:
+                child_clauses = self.to_dnf(child)
+                if child_clauses is None:
+                    return None
+                clauses = _absorb(left | right for left in clauses for right in child_clauses)
+                if len(clauses) > self.dnf_limit:
+                    return None
+            return clauses
+
+        if isinstance(requirement, AtLeast):
+            expanded = _expand_at_least(requirement)
+            if expanded is None:
+                return None
+            return self.to_dnf(expanded)
+
+        raise TypeError(f"Unknown requirement {requirement!r}")
+
+    def items_of(self, requirement: Requirement) -> FrozenSet[str]:
+        """Every item the requirement checks for, so the only items that can change its result"""
+        if isinstance(requirement, Constant):
+            return frozenset()
+        if isinstance(requirement, Has):
+            return frozenset((requirement.item,))
+
+        items = self.items_cache.get(requirement)
+        if items is None:
+            if isinstance(requirement, Task):
+                items = self.items_of(requirement.requirement)
+            elif isinstance(requirement, AtLeast):
+                items = frozenset().union(*(self.items_of(term) for term, _ in requirement.terms))
+            else:
+                items = frozenset().union(*(self.items_of(child) for child in requirement.children))
+            self.items_cache[requirement] = items
+        return items
+
+    def assume(self, requirement: Requirement, held: Clause) -> Requirement:
+        """Simplifies a requirement for when the held item checks are already known to pass.
+
+        Tasks that change keep their place in the tree under a new name, so their memoized
+        results never mix with the unsimplified task's."""
+        if not held or isinstance(requirement, Constant):
+            return requirement
+        if isinstance(requirement, Has):
+            for check in held:
+                if check.item == requirement.item and check.count >= requirement.count:
+                    return ALWAYS
+            return requirement
+
+        key = (requirement, held)
+        simplified = self.assume_cache.get(key)
+        if simplified is None:
+            simplified = self.assume_cache[key] = self._assume(requirement, held)
+        return simplified
+
+    def _assume(self, requirement: Requirement, held: Clause) -> Requirement:
+        if isinstance(requirement, AllOf):
+            return all_of(*(self.assume(child, held) for child in requirement.children))
+
+        if isinstance(requirement, AnyOf):
+            return any_of(*(self.assume(child, held) for child in requirement.children))
+
+        if isinstance(requirement, AtLeast):
+            return weighted_at_least(requirement.threshold, (
+                (self.assume(term, held), weight) for term, weight in requirement.terms
+            ))
+
+        if isinstance(requirement, Task):
+            inner = self.assume(requirement.requirement, held)
+            if inner == requirement.requirement:
+                return requirement
+            if isinstance(inner, (Constant, Has)):
+                return inner
+            held_names = ", ".join(sorted(check.item for check in held))
+            return Task(f"{requirement.name} given {held_names}", inner)
+
+        raise TypeError(f"Unknown requirement {requirement!r}")
+
+    def compile(self, requirement: Requirement) -> Rule:
+        if requirement is ALWAYS:
+            return _always
+        if requirement is NEVER:
+            return _never
+
+        rule = self.rule_cache.get(requirement)
+        if rule is None:
+            clauses = self.to_dnf(requirement)
+            if clauses is not None:
+                rule = self._compile_dnf(clauses)
+            elif isinstance(requirement, Task):
+                rule = self._memoize(requirement.name, self.compile(requirement.requirement))
+            else:
+                rule = self._compile_tree(requirement)
+            self.rule_cache[requirement] = rule
+        return rule
+
+    def _memoize(self, name: str, rule: Rule) -> Rule:
+        """Caches a task's result in the state's goose_task_cache, which the world clears whenever
+        the player collects or loses an item"""
+        player = self.player
+
+        def task_rule(state: CollectionState) -> bool:
+            cache = state.goose_task_cache[player]
+            result = cache.get(name)
+            if result is None:
+                result = cache[name] = rule(state)
+            return result
+
+        return task_rule
+
+    def mask_of(self, items: Iterable[str]) -> int:
+        """The goose_item_mask bits of the items"""
+        mask = 0
+        for item in items:
+            mask |= self.item_bits[item]
+        return mask
+
+    def _compile_clause(self, clause: Clause) -> Rule:
+        player = self.player
+        items = _simple_items(clause)
+        if items is None:
+            counts: Dict[str, int] = {}
+            for check in clause:
+                counts[check.item] = max(counts.get(check.item, 0), check.count)
+            if len(counts) == 1:
+                [(item, count)] = counts.items()
+                return lambda state: state.prog_items[player][item] >= count
+            return lambda state: state.has_all_counts(counts, player)
+        if not items:
+            return _always
+        return _has_all_items(self.mask_of(items), player)
+
+    def _compile_dnf(self, clauses: List[Clause]) -> Rule:
+        player = self.player
+        if not clauses:
+            return _never
+        if len(clauses) == 1:
+            return self._compile_clause(clauses[0])
+
+        # Pull the items every alternative needs out front so they are checked only once
+        common = frozenset.intersection(*clauses)
+        alternatives = [clause - common for clause in clauses]
+        required = self._compile_clause(common)
+
+        single_items = None
+        if all(len(clause) == 1 for clause in alternatives):
+            single_items = _simple_items(next(iter(clause)) for clause in alternatives)
+        if single_items is not None:
+            any_mask = self.mask_of(single_items)
+            if not common:
+                return _has_any_item(any_mask, player)
+            required_items = _simple_items(common)
+            if required_items is not None:
+                required_mask = self.mask_of(required_items)
+
+                def factored_rule(state: CollectionState) -> bool:
+                    owned = state.goose_item_mask[player]
+                    return owned & required_mask == required_mask and owned & any_mask != 0
+
+                return factored_rule
+            return lambda state: required(state) and state.goose_item_mask[player] & any_mask != 0
+
+        checks = tuple(self._compile_clause(clause) for clause in alternatives)
+
+        def dnf_rule(state: CollectionState) -> bool:
+            if not required(state):
+                return False
+            for check in checks:
+                if check(state):
+                    return True
+            return False
+
+        return dnf_rule
+
+    def _term_mask(self, requirement: Requirement) -> Optional[int]:
+        """The mask of the items a counting term needs, if it comes down to a single set of single-copy items"""
+        clauses = self.to_dnf(requirement)
+        if clauses is None or len(clauses) != 1:
+            return None
+        items = _simple_items(clauses[0])
+        if items is None:
+            return None
+        return self.mask_of(items)
+
+    def _compile_tree(self, requirement: Requirement) -> Rule:
+        player = self.player
+        if isinstance(requirement, AtLeast):
+            threshold = requirement.threshold
+            total = sum(weight for _, weight in requirement.terms)
+            # Heaviest terms first so the threshold is reached, or ruled out, in as few checks as possible.
+            # Terms that are just a set of items are looked up directly, anything else runs its compiled rule.
+            terms = tuple(
+                (self._term_mask(term), self.compile(term), weight)
+                for term, weight in sorted(requirement.terms, key=lambda term: -term[1])
+            )
+
+            def count_rule(state: CollectionState) -> bool:
+                owned = state.goose_item_mask[player]
+                count = 0
+                remaining = total
+                for mask, rule, weight in terms:
+                    if owned & mask == mask if mask is not None else rule(state):
+                        count += weight
+                        if count >= threshold:
+                            return True
+                    else:
+                        remaining -= weight
+                        if remaining < threshold:
+                            return False
+                return False
+
+            return count_rule
+
+        # Plain item checks go first as one mask test, nested rules after them
+        simple = [child for child in requirement.children if isinstance(child, Has) and child.count == 1]
+        mask = self.mask_of(child.item for child in simple)
+        checks = tuple(self.compile(child) for child in requirement.children if child not in simple)
+
+        if isinstance(requirement, AllOf):
+            def all_rule(state: CollectionState) -> bool:
+                if state.goose_item_mask[player] & mask != mask:
+                    return False
+                for check in checks:
+                    if not check(state):
+                        return False
+                return True
+
+            return all_rule
+
+        def any_rule(state: CollectionState) -> bool:
+            if state.goose_item_mask[player] & mask != 0:
+                return True
+            for check in checks:
+                if check(state):
+                    return True
+            return False
+
+        return any_rule
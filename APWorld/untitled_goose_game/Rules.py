@@ -1,423 +1,491 @@
-from BaseClasses import CollectionState
-from typing import TYPE_CHECKING
+from functools import cached_property
+from typing import TYPE_CHECKING, Callable, Dict, FrozenSet, Iterable, NamedTuple, Optional, Set, Tuple
+from BaseClasses import Location
 from worlds.generic.Rules import set_rule
 
+from .Items import ITEM_GROUPS, item_bits
+from .Locations import CATEGORY_OPTIONS, LOCATION_REGISTRY, location_index_by_name
+from .Profiling import profile_compiled_rule, profile_rule_methods
+from .Requirements import ALWAYS, Has, Requirement, RequirementCompiler, Rule, at_least, task, weighted_at_least
 from .names import itemNames, locationNames, regionNames
 
 if TYPE_CHECKING:
     from . import GooseGameWorld
 
+
+class WeightedItem(NamedTuple):
+    item: str
+    weight: int
+    area: str
+    needs: Optional[str] = None  # Extra prop soul needed to reach the item, like the drawer for the back of the Back Gardens
+
+
+# Weight needed to make the scales ding, so any item with this weight is enough on its own
+SCALES_THRESHOLD = 3
+
+# Everything that can be carried onto the High Street scales, weighted by how many copies of it there are
+SCALES_ITEMS: Tuple[WeightedItem, ...] = (
+    # Any of these provides enough items to complete the task alone
+    WeightedItem(itemNames.PROP_CARROTS, SCALES_THRESHOLD, regionNames.HIGH_STREET),
+    WeightedItem(itemNames.PROP_TOMATOES, SCALES_THRESHOLD, regionNames.HIGH_STREET),
+    WeightedItem(itemNames.PROP_ORANGES, SCALES_THRESHOLD, regionNames.HIGH_STREET),
+    WeightedItem(itemNames.PROP_LEEKS, SCALES_THRESHOLD, regionNames.HIGH_STREET),
+    WeightedItem(itemNames.PROP_CUCUMBERS, SCALES_THRESHOLD, regionNames.HIGH_STREET),
+    WeightedItem(itemNames.PROP_TINNED_FOOD, SCALES_THRESHOLD, regionNames.HIGH_STREET),
+    WeightedItem(itemNames.PROP_GREEN_QUOITS, SCALES_THRESHOLD, regionNames.PUB),
+    WeightedItem(itemNames.PROP_RED_QUOITS, SCALES_THRESHOLD, regionNames.PUB),
+    WeightedItem(itemNames.PROP_PLATES, SCALES_THRESHOLD, regionNames.PUB),
+    WeightedItem(itemNames.PROP_DARTBOARD, SCALES_THRESHOLD, regionNames.PUB),
+    WeightedItem(itemNames.PROP_MINI_PEOPLE, SCALES_THRESHOLD, regionNames.MODEL_VILLAGE),
+    WeightedItem(itemNames.PROP_PINT_BOTTLES, SCALES_THRESHOLD, regionNames.HUB), # Two in High Street, one in the hub near the dummy
+    
+    # High Street items (1 each)
+    WeightedItem(itemNames.PROP_TOOTHRBRUSH, 1, regionNames.HIGH_STREET),
+    WeightedItem(itemNames.PROP_HAIRBRUSH, 1, regionNames.HIGH_STREET),
+    WeightedItem(itemNames.PROP_LOO_PAPER, 1, regionNames.HIGH_STREET),
+    WeightedItem(itemNames.PROP_DISH_SOAP_BOTTLE, 1, regionNames.HIGH_STREET),
+    WeightedItem(itemNames.PROP_SPRAY_BOTTLE, 1, regionNames.HIGH_STREET),
+    WeightedItem(itemNames.PROP_TOY_CAR, 1, regionNames.HIGH_STREET),
+    WeightedItem(itemNames.PROP_HORN_RIMMED_GLASSES, 1, regionNames.HIGH_STREET),
+    WeightedItem(itemNames.PROP_RED_GLASSES, 1, regionNames.HIGH_STREET),
+    WeightedItem(itemNames.PROP_SUNGLASSES, 1, regionNames.HIGH_STREET),
+    WeightedItem(itemNames.NPC_BOY, 1, regionNames.HIGH_STREET),
+    WeightedItem(itemNames.PROP_TOY_PLANE, 1, regionNames.HIGH_STREET),
+    WeightedItem(itemNames.PROP_LILY_FLOWER, 1, regionNames.HIGH_STREET),
+    WeightedItem(itemNames.PROP_STEREOSCOPE, 1, regionNames.HIGH_STREET),
+    WeightedItem(itemNames.PROP_DUSTBIN_LID, 1, regionNames.HIGH_STREET),
+    
+    # High Street items (2 each)
+    WeightedItem(itemNames.PROP_APPLE_CORES, 2, regionNames.HIGH_STREET),
+    WeightedItem(itemNames.PROP_WALKIE_TALKIES, 2, regionNames.HIGH_STREET),
+    WeightedItem(itemNames.PROP_WEED_TOOLS, 2, regionNames.HIGH_STREET),
+    
+    # Hub items (1 each)
+    WeightedItem(itemNames.PROP_TENNIS_BALL, 1, regionNames.HUB),
+    WeightedItem(itemNames.PROP_DUMMY, 1, regionNames.HUB),
+    WeightedItem(itemNames.PROP_FISHING_BOBBER, 1, regionNames.HUB),
+    WeightedItem(itemNames.PROP_DRINK_CAN, 1, regionNames.HUB),
+    WeightedItem(itemNames.PROP_RIBBONS, 1, regionNames.HUB),
+    
+    # Hub items (2 each)
+    WeightedItem(itemNames.PROP_BOOTS, 2, regionNames.HUB),
+    
+    # Garden items (1 each)
+    WeightedItem(itemNames.PROP_JAM, 1, regionNames.GARDEN),
+    WeightedItem(itemNames.PROP_TULIP, 1, regionNames.GARDEN),
+    WeightedItem(itemNames.PROP_PICNIC_MUG, 1, regionNames.GARDEN),
+    WeightedItem(itemNames.PROP_THERMOS, 1, regionNames.GARDEN),
+    WeightedItem(itemNames.PROP_TROWEL, 1, regionNames.GARDEN),
+    WeightedItem(itemNames.PROP_RADIO, 1, regionNames.GARDEN),
+    
+    # Garden items (2 each)
+    WeightedItem(itemNames.PROP_APPLES, 2, regionNames.GARDEN),
+    WeightedItem(itemNames.PROP_SANDWICH, 2, regionNames.GARDEN),
+    
+    # Back Garden front items (1 each)
+    WeightedItem(itemNames.PROP_TEA_CUP, 1, regionNames.BACK_GARDENS),
+    WeightedItem(itemNames.PROP_CRICKET_BALL, 1, regionNames.BACK_GARDENS),
+    WeightedItem(itemNames.PROP_BUST_PIPE, 1, regionNames.BACK_GARDENS),
+    WeightedItem(itemNames.PROP_BUST_HAT, 1, regionNames.BACK_GARDENS),
+    WeightedItem(itemNames.PROP_BUST_GLASSES, 1, regionNames.BACK_GARDENS),
+    WeightedItem(itemNames.PROP_NEWSPAPER, 1, regionNames.BACK_GARDENS),
+    
+    # Back Garden back items (mostly 1 each)
+    WeightedItem(itemNames.PROP_SOAP, 1, regionNames.BACK_GARDENS, itemNames.PROP_DRAWER),
+    WeightedItem(itemNames.PROP_POT_STACK, 1, regionNames.BACK_GARDENS, itemNames.PROP_DRAWER),
+    WeightedItem(itemNames.PROP_PAINTBRUSH, 1, regionNames.BACK_GARDENS, itemNames.PROP_DRAWER),
+    WeightedItem(itemNames.PROP_BRA, 1, regionNames.BACK_GARDENS, itemNames.PROP_DRAWER),
+    WeightedItem(itemNames.PROP_SOCKS, 2, regionNames.BACK_GARDENS, itemNames.PROP_DRAWER),
+    
+    # Pub items (1 each)
+    WeightedItem(itemNames.PROP_CORK, 1, regionNames.PUB),
+    WeightedItem(itemNames.PROP_LETTER, 1, regionNames.PUB),
+    WeightedItem(itemNames.PROP_CANDLESTICK, 1, regionNames.PUB),
+    WeightedItem(itemNames.PROP_HARMONICA, 1, regionNames.PUB),
+    WeightedItem(itemNames.PROP_TOY_BOAT, 1, regionNames.PUB),
+    WeightedItem(itemNames.PROP_PEPPER_GRINDER, 1, regionNames.PUB),
+    
+    # Pub items (2 each)
+    WeightedItem(itemNames.PROP_KNIVES, 2, regionNames.PUB),
+    WeightedItem(itemNames.PROP_FORKS, 2, regionNames.PUB),
+    
+    # Model Village items (1 each)
+    WeightedItem(itemNames.PROP_MINI_GOOSE, 1, regionNames.MODEL_VILLAGE),
+    WeightedItem(itemNames.PROP_MINI_MAIL_PILLAR, 1, regionNames.MODEL_VILLAGE),
+    WeightedItem(itemNames.PROP_MINI_PHONE_DOOR, 1, regionNames.MODEL_VILLAGE),
+    WeightedItem(itemNames.PROP_MINI_SHOVEL, 1, regionNames.MODEL_VILLAGE),
+    WeightedItem(itemNames.PROP_POPPY_FLOWER, 1, regionNames.MODEL_VILLAGE),
+    WeightedItem(itemNames.PROP_TIMBER_HANDLE, 1, regionNames.MODEL_VILLAGE),
+)
+
+# The flowers for 'Collect the five flowers' apart from the rose, which needs the Back Gardens finished
+FIVE_FLOWERS_ITEMS: Tuple[WeightedItem, ...] = (
+    WeightedItem(itemNames.PROP_TULIP, 1, regionNames.GARDEN),
+    WeightedItem(itemNames.PROP_LILY_FLOWER, 1, regionNames.HIGH_STREET),
+    WeightedItem(itemNames.PROP_FLOWER_FOR_VASE, 1, regionNames.PUB),
+    WeightedItem(itemNames.PROP_POPPY_FLOWER, 1, regionNames.MODEL_VILLAGE),
+)
+
+# Location name -> the option its rule comes with, for locations that are there whatever the options are.
+# 'Pick up Golden Bell' is a main location, but it only has the pickup rule when item pickups are included.
+OPTION_GATED_RULES: Dict[str, str] = {
+    locationNames.PICKUP_GOLDEN_BELL: "include_item_pickups",
+}
+
 class UntitledGooseRules:
     world: "GooseGameWorld"
 
     def __init__(self, world: "GooseGameWorld") -> None:
         self.player = world.player
         self.world = world
+        self.compiler = RequirementCompiler(self.player, item_bits)
+        self.tasks: Dict[str, Requirement] = {}
         
-        # To Do (As Well) Task Rules
-        if self.world.options.include_extra_tasks.value:
-            self.extra_task_rules = {
-                locationNames.EXTRA_TASK_GROUNDSKEEPER: self.lock_groundskeeper_out,
-                locationNames.EXTRA_TASK_CABBAGE: self.cabbage_picnic,
-                locationNames.EXTRA_TASK_PUDDLE: self.trip_boy_in_puddle,
-                locationNames.EXTRA_TASK_SCALES: self.make_scales_ding,
-                locationNames.EXTRA_TASK_UMBRELLA: self.open_umbrella_on_tv,
-                locationNames.EXTRA_TASK_BUY: self.make_groundskeeper_buyback,
-                locationNames.EXTRA_TASK_FLOWERS: self.collect_five_flowers,
-                locationNames.EXTRA_TASK_GARAGE: self.trap_boy_in_garage,
-                locationNames.EXTRA_TASK_CATCH: self.catch_thrown_object,
-                locationNames.EXTRA_TASK_THROWN: self.get_thrown_over_fence,
-                locationNames.EXTRA_TASK_BUST: self.dress_up_bust_outside_items,
-                locationNames.EXTRA_TASK_GOAL: self.score_goal,
-                locationNames.EXTRA_TASK_BOAT: self.sail_boat_under_bridge,
-                locationNames.EXTRA_TASK_RIBBON: self.perform_with_ribbon,
-                locationNames.EXTRA_TASK_HAT: self.steal_woolen_hat,
-            }
+        # Access item -> how many Progressive Area items open it, when areas are progressive
+        self.area_counts: Dict[str, int] = {}
+        if self.world.options.progressive_area_access.value:
+            self.area_counts = {area: count for count, area in enumerate(self.world.get_area_order(), 1)}
+        self.compiled_rules: Dict[str, Rule] = {}
+        # Location name -> every item its access depends on, filled in as set_rules compiles each location
+        self.location_dependencies: Dict[str, FrozenSet[str]] = {}
+    
+    @cached_property
+    def location_rules(self) -> Dict[str, Callable[[], Requirement]]:
+        """Location name -> the rule method for it, built the first time set_rules needs it.
 
-        # To Do (Quickly!!) Task Rules
-        if self.world.options.include_speedrun_tasks.value:
-            self.speedrun_task_rules = {
-                locationNames.SPEEDRUN_TASK_GARDEN: self.speedrun_garden,
-                locationNames.SPEEDRUN_TASK_HIGH_STREET: self.speedrun_high_street,
-                locationNames.SPEEDRUN_TASK_BACK_GARDENS: self.speedrun_back_gardens,
-                locationNames.SPEEDRUN_TASK_PUB: self.speedrun_pub,
-            }
+        Only the locations create_regions added for the slot's options are looked up,
+        so the table covers every option combination, apart from the OPTION_GATED_RULES left out here."""
+        location_rules = {
+            # To Do (As Well) Task Rules
+            locationNames.EXTRA_TASK_GROUNDSKEEPER: self.lock_groundskeeper_out,
+            locationNames.EXTRA_TASK_CABBAGE: self.cabbage_picnic,
+            locationNames.EXTRA_TASK_PUDDLE: self.trip_boy_in_puddle,
+            locationNames.EXTRA_TASK_SCALES: self.make_scales_ding,
+            locationNames.EXTRA_TASK_UMBRELLA: self.open_umbrella_on_tv,
+            locationNames.EXTRA_TASK_BUY: self.make_groundskeeper_buyback,
+            locationNames.EXTRA_TASK_FLOWERS: self.collect_five_flowers,
+            locationNames.EXTRA_TASK_GARAGE: self.trap_boy_in_garage,
+            locationNames.EXTRA_TASK_CATCH: self.catch_thrown_object,
+            locationNames.EXTRA_TASK_THROWN: self.get_thrown_over_fence,
+            locationNames.EXTRA_TASK_BUST: self.dress_up_bust_outside_items,
+            locationNames.EXTRA_TASK_GOAL: self.score_goal,
+            locationNames.EXTRA_TASK_BOAT: self.sail_boat_under_bridge,
+            locationNames.EXTRA_TASK_RIBBON: self.perform_with_ribbon,
+            locationNames.EXTRA_TASK_HAT: self.steal_woolen_hat,
 
-        # Item Pickup Rules
-        if self.world.options.include_item_pickups.value:
-            self.pickup_rules = {
-                locationNames.PICKUP_RADIO: self.pickup_radio,
-                locationNames.PICKUP_TROWEL: self.pickup_trowel,
-                locationNames.PICKUP_KEYS: self.pickup_keys,
-                locationNames.PICKUP_TULIP: self.pickup_tulip,
-                locationNames.PICKUP_APPLE_1: self.pickup_apples,
-                locationNames.PICKUP_JAM: self.pickup_jam,
-                locationNames.PICKUP_PICNIC_MUG: self.pickup_picnic_mug,
-                locationNames.PICKUP_THERMOS: self.pickup_thermos,
-                locationNames.PICKUP_SANDWICH_R: self.pickup_sandwich,
-                locationNames.PICKUP_SANDWICH_L: self.pickup_sandwich,
-                locationNames.PICKUP_STRAW_HAT: self.pickup_straw_hat,
-                locationNames.PICKUP_DRINK_CAN: self.pickup_drink_can,
-                locationNames.PICKUP_TENNIS_BALL: self.pickup_tennis_ball,
-                locationNames.PICKUP_GROUNDSKEEPERS_HAT: self.pickup_grounsdkeepers_hat,
-                locationNames.PICKUP_APPLE_2: self.pickup_apples,
-                locationNames.PICKUP_BOYS_GLASSES: self.pickup_boys_glasses,
-                locationNames.PICKUP_HORN_RIMMED_GLASSES: self.pickup_horn_rimmed_glasses,
-                locationNames.PICKUP_RED_GLASSES: self.pickup_red_glasses,
-                locationNames.PICKUP_SUNGLASSES: self.pickup_sunglasses,
-                locationNames.PICKUP_LOO_PAPER: self.pickup_loo_paper,
-                locationNames.PICKUP_TOY_CAR: self.pickup_toy_car,
-                locationNames.PICKUP_HAIRBRUSH: self.pickup_hairbrush,
-                locationNames.PICKUP_TOOTHBRUSH: self.pickup_toothbrush,
-                locationNames.PICKUP_STEREOSCOPE: self.pickup_stereoscope,
-                locationNames.PICKUP_DISH_SOAP_BOTTLE: self.pickup_dish_soap_bottle,
-                locationNames.PICKUP_TINNED_FOOD_BLUE: self.pickup_food_cans,
-                locationNames.PICKUP_TINNED_FOOD_YELLOW: self.pickup_food_cans,
-                locationNames.PICKUP_TINNED_FOOD_ORANGE: self.pickup_food_cans,
-                locationNames.PICKUP_WEED_TOOL: self.pickup_weed_tools,
-                locationNames.PICKUP_LILY_FLOWER: self.pickup_lily_flower,
-                locationNames.PICKUP_ORANGE_1: self.pickup_oranges,
-                locationNames.PICKUP_ORANGE_2: self.pickup_oranges,
-                locationNames.PICKUP_ORANGE_3: self.pickup_oranges,
-                locationNames.PICKUP_SHOP_TOMATO_1: self.pickup_tomatoes_high_street,
-                locationNames.PICKUP_SHOP_TOMATO_2: self.pickup_tomatoes_high_street,
-                locationNames.PICKUP_SHOP_TOMATO_3: self.pickup_tomatoes_high_street,
-                locationNames.PICKUP_SHOP_CARROT_1: self.pickup_carrots_high_street,
-                locationNames.PICKUP_SHOP_CARROT_2: self.pickup_carrots_high_street,
-                locationNames.PICKUP_SHOP_CARROT_3: self.pickup_carrots_high_street,
-                locationNames.PICKUP_CUCUMBER_1: self.pickup_cucumbers,
-                locationNames.PICKUP_CUCUMBER_2: self.pickup_cucumbers,
-                locationNames.PICKUP_CUCUMBER_3: self.pickup_cucumbers,
-                locationNames.PICKUP_LEEK_1: self.pickup_leeks,
-                locationNames.PICKUP_LEEK_2: self.pickup_leeks,
-                locationNames.PICKUP_LEEK_3: self.pickup_leeks,
-                locationNames.PICKUP_TOY_PLANE: self.pickup_fusilage,
-                locationNames.PICKUP_PINT_BOTTLE_1: self.pickup_pint_bottle_hub,
-                locationNames.PICKUP_PINT_BOTTLE_2: self.pickup_pint_bottle_high_street,
-                locationNames.PICKUP_PINT_BOTTLE_3: self.pickup_pint_bottle_high_street,
-                locationNames.PICKUP_SPRAY_BOTTLE: self.pickup_spray_bottle,
-                locationNames.PICKUP_WALKIE_TALKIE_1: self.pickup_walkie_talkies,
-                locationNames.PICKUP_WALKIE_TALKIE_2: self.pickup_walkie_talkies,
-                locationNames.PICKUP_APPLE_CORE_1: self.pickup_apple_cores,
-                locationNames.PICKUP_APPLE_CORE_2: self.pickup_apple_cores,
-                locationNames.PICKUP_DUSTBIN_LID: self.pickup_dustbin_lid,
-                locationNames.PICKUP_CHALK: self.pickup_chalk,
-                locationNames.PICKUP_GARDEN_FORK: self.pickup_weed_tools,
-                locationNames.PICKUP_RIBBON_RED: self.pickup_red_bow,
-                locationNames.PICKUP_BLUE_RIBBON: self.pickup_blue_bow,
-                locationNames.PICKUP_DUMMY: self.pickup_dummy,
-                locationNames.PICKUP_CRICKET_BALL: self.pickup_cricket_ball,
-                locationNames.PICKUP_BUST_PIPE: self.pickup_bust_pipe,
-                locationNames.PICKUP_BUST_HAT: self.pickup_bust_hat,
-                locationNames.PICKUP_BUST_GLASSES: self.pickup_bust_glasses,
-                locationNames.PICKUP_SLIPPER_R: self.pickup_slippers,
-                locationNames.PICKUP_SLIPPER_L: self.pickup_slippers,
-                locationNames.PICKUP_TEA_CUP: self.pickup_tea_cup,
-                locationNames.PICKUP_NEWSPAPER: self.pickup_newspaper,
-                locationNames.PICKUP_SOCK_1: self.pickup_socks,
-                locationNames.PICKUP_SOCK_2: self.pickup_socks,
-                locationNames.PICKUP_VASE: self.pickup_vase,
-                locationNames.PICKUP_POT_STACK: self.pickup_pot_stack,
-                locationNames.PICKUP_SOAP: self.pickup_soap,
-                locationNames.PICKUP_PAINTBRUSH: self.pickup_paintbrush,
-                locationNames.PICKUP_VASE_PIECE_1: self.pickup_vase_pieces,
-                locationNames.PICKUP_VASE_PIECE_2: self.pickup_vase_pieces,
-                locationNames.PICKUP_BRA: self.pickup_bra,
-                locationNames.PICKUP_BADMINTON_RACKET: self.pickup_badminton_racket,
-                locationNames.PICKUP_ROSE: self.pickup_rose,
-                locationNames.PICKUP_FISHING_BOBBER: self.pickup_fishing_bobber,
-                locationNames.PICKUP_LETTER: self.pickup_exit_letter,
-                locationNames.PICKUP_PLATE_1: self.pickup_plates,
-                locationNames.PICKUP_PLATE_2: self.pickup_plates,
-                locationNames.PICKUP_PLATE_3: self.pickup_plates,
-                locationNames.PICKUP_GREEN_QUOIT_1: self.pickup_green_quoits,
-                locationNames.PICKUP_GREEN_QUOIT_2: self.pickup_green_quoits,
-                locationNames.PICKUP_GREEN_QUOIT_3: self.pickup_green_quoits,
-                locationNames.PICKUP_RED_QUOIT_1: self.pickup_red_quoits,
-                locationNames.PICKUP_RED_QUOIT_2: self.pickup_red_quoits,
-                locationNames.PICKUP_RED_QUOIT_3: self.pickup_red_quoits,
-                locationNames.PICKUP_FORK_1: self.pickup_forks,
-                locationNames.PICKUP_FORK_2: self.pickup_forks,
-                locationNames.PICKUP_KNIFE_1: self.pickup_knives,
-                locationNames.PICKUP_KNIFE_2: self.pickup_knives,
-                locationNames.PICKUP_CORK: self.pickup_cork,
-                locationNames.PICKUP_CANDLESTICK: self.pickup_candlestick,
-                locationNames.PICKUP_FLOWER_FOR_VASE: self.pickup_vase_flower,
-                locationNames.PICKUP_DART_1: self.pickup_darts,
-                locationNames.PICKUP_DART_2: self.pickup_darts,
-                locationNames.PICKUP_DART_3: self.pickup_darts,
-                locationNames.PICKUP_HARMONICA: self.pickup_harmonica,
-                locationNames.PICKUP_PINT_GLASS: self.pickup_pint_glass,
-                locationNames.PICKUP_TOY_BOAT: self.pickup_toy_boat,
-                locationNames.PICKUP_OLD_MANS_WOOLEN_HAT: self.pickup_woolen_hat,
-                locationNames.PICKUP_PEPPER_GRINDER: self.pickup_pepper_grinder,
-                locationNames.PICKUP_PUB_WOMANS_CLOTH: self.pickup_pub_woman_cloth,
-                locationNames.PICKUP_MINI_PERSON_CHILD: self.pickup_people_miniatures,
-                locationNames.PICKUP_MINI_PERSON_JUMPSUIT: self.pickup_people_miniatures,
-                locationNames.PICKUP_MINI_PERSON_GARDENER: self.pickup_people_miniatures,
-                locationNames.PICKUP_MINI_PERSON_OLD_WOMAN: self.pickup_people_miniatures,
-                locationNames.PICKUP_MINI_PERSON_POSTIE: self.pickup_people_miniatures,
-                locationNames.PICKUP_MINI_PERSON_VEST_MAN: self.pickup_people_miniatures,
-                locationNames.PICKUP_MINI_PERSON: self.pickup_people_miniatures,
-                locationNames.PICKUP_MINI_GOOSE: self.pickup_mini_goose,
-                locationNames.PICKUP_MINI_SHOVEL: self.pickup_mini_shovel,
-                locationNames.PICKUP_POPPY_FLOWER: self.pickup_poppy,
-                locationNames.PICKUP_MINI_PHONE_DOOR: self.pickup_mini_phone_booth,
-                locationNames.PICKUP_MINI_MAIL_PILLAR: self.pickup_mini_mail_pillar,
-                locationNames.PICKUP_TIMBER_HANDLE: self.pickup_timber_handle,
-                locationNames.PICKUP_GOLDEN_BELL: self.pickup_golden_bell,
-                locationNames.PICKUP_CARROT_1: self.pickup_garden_carrots,
-                locationNames.PICKUP_CARROT_2: self.pickup_garden_carrots,
-                locationNames.PICKUP_CARROT_3: self.pickup_garden_carrots,
-                locationNames.PICKUP_CARROT_4: self.pickup_garden_carrots,
-                locationNames.PICKUP_CARROT_5: self.pickup_garden_carrots,
-                locationNames.PICKUP_CARROT_6: self.pickup_garden_carrots,
-                locationNames.PICKUP_CARROT_7: self.pickup_garden_carrots,
-                locationNames.PICKUP_CARROT_8: self.pickup_garden_carrots,
-                locationNames.PICKUP_CARROT_9: self.pickup_garden_carrots,
-                locationNames.PICKUP_CARROT_10: self.pickup_garden_carrots,
-                locationNames.PICKUP_PUB_TOMATO_1: self.pickup_pub_boxed_tomatoes,
-                locationNames.PICKUP_PUB_TOMATO_2: self.pickup_pub_boxed_tomatoes,
-                locationNames.PICKUP_PUB_TOMATO_3: self.pickup_pub_boxed_tomatoes,
-                locationNames.PICKUP_PUB_TOMATO_4: self.pickup_pub_boxed_tomatoes,
-                locationNames.PICKUP_PUB_TOMATO_5: self.pickup_pub_boxed_tomatoes,
-                locationNames.PICKUP_PUB_TOMATO_6: self.pickup_pub_boxed_tomatoes,
-                locationNames.PICKUP_PUB_TOMATO_7: self.pickup_pub_boxed_tomatoes,
-                locationNames.PICKUP_PUB_TOMATO_8: self.pickup_pub_boxed_tomatoes,
-                locationNames.PICKUP_PUB_TOMATO_9: self.pickup_pub_boxed_tomatoes,
-                locationNames.PICKUP_PUB_TOMATO_10: self.pickup_pub_open_tomatoes,
-                locationNames.PICKUP_PUB_TOMATO_11: self.pickup_pub_open_tomatoes,
-                locationNames.PICKUP_BOOT_START: self.pickup_boots,
-                locationNames.PICKUP_BOOT_HUB: self.pickup_boots,
-            }
+            # To Do (Quickly!!) Task Rules
+            locationNames.SPEEDRUN_TASK_GARDEN: self.speedrun_garden,
+            locationNames.SPEEDRUN_TASK_HIGH_STREET: self.speedrun_high_street,
+            locationNames.SPEEDRUN_TASK_BACK_GARDENS: self.speedrun_back_gardens,
+            locationNames.SPEEDRUN_TASK_PUB: self.speedrun_pub,
 
-        # Item Drag Rules
-        if self.world.options.include_drag_items.value:
-            self.drag_rules = {
-                locationNames.DRAG_RAKE: self.drag_rake,
-                locationNames.DRAG_PICNIC_BASKET: self.drag_picnic_basket,
-                locationNames.DRAG_ESKY: self.drag_esky,
-                locationNames.DRAG_SHOVEL: self.drag_shovel,
-                locationNames.DRAG_PUMKPIN_1: self.drag_pumpkins,
-                locationNames.DRAG_PUMKPIN_2: self.drag_pumpkins,
-                locationNames.DRAG_PUMKPIN_3: self.drag_pumpkins,
-                locationNames.DRAG_PUMKPIN_4: self.drag_pumpkins,
-                locationNames.DRAG_WATERING_CAN: self.drag_watering_can,
-                locationNames.DRAG_GUMBOOT_1: self.drag_gumboots,
-                locationNames.DRAG_GUMBOOT_2: self.drag_gumboots,
-                locationNames.DRAG_NO_GOOSE_SIGN_GARDEN: self.drag_gardener_sign,
-                locationNames.DRAG_WOODEN_CRATE: self.drag_wooden_crate,
-                locationNames.DRAG_FENCE_BOLT: self.drag_fence_bolt,
-                locationNames.DRAG_MALLET: self.drag_mallet,
-                locationNames.DRAG_SHOPPING_BASKET: self.drag_shopping_basket,
-                locationNames.DRAG_UMBRELLA_BLACK: self.drag_umbrellas,
-                locationNames.DRAG_UMBRELLA_RAINBOW: self.drag_umbrellas,
-                locationNames.DRAG_UMBRELLA_RED: self.drag_umbrellas,
-                locationNames.DRAG_PUSH_BROOM: self.drag_push_broom,
-                locationNames.DRAG_BROKEN_BROOM_HEAD: self.drag_broom_head,
-                locationNames.DRAG_DUSTBIN: self.drag_dustbin,
-                locationNames.DRAG_BABY_DOLL: self.drag_baby_doll,
-                locationNames.DRAG_PRICING_GUN: self.drag_pricing_gun,
-                locationNames.DRAG_ADDING_MACHINE: self.drag_adding_machine,
-                locationNames.DRAG_ROSE_BOX: self.drag_rose_box,
-                locationNames.DRAG_CRICKET_BAT: self.drag_cricket_bat,
-                locationNames.DRAG_TEA_POT: self.drag_tea_pot,
-                locationNames.DRAG_CLIPPERS: self.drag_clippers,
-                locationNames.DRAG_DUCK_STATUE: self.drag_duck_statue,
-                locationNames.DRAG_FROG_STATUE: self.drag_frog_statue,
-                locationNames.DRAG_JEREMY_FISH: self.drag_jeremy_fish,
-                locationNames.DRAG_NO_GOOSE_SIGN_MESSY: self.drag_messy_sign,
-                locationNames.DRAG_DRAWER: self.drag_drawer,
-                locationNames.DRAG_ENAMEL_JUG: self.drag_enamel_jug,
-                locationNames.DRAG_NO_GOOSE_SIGN_CLEAN: self.drag_clean_sign,
-                locationNames.DRAG_TACKLE_BOX: self.drag_tackle_box,
-                locationNames.DRAG_TRAFFIC_CONE: self.drag_traffic_cone,
-                locationNames.DRAG_PARCEL: self.drag_exit_parcel,
-                locationNames.DRAG_STEALTH_BOX: self.drag_stealth_box,
-                locationNames.DRAG_NO_GOOSE_SIGN_PUB: self.drag_no_goose_sign,
-                locationNames.DRAG_PORTABLE_STOOL: self.drag_portable_stool,
-                locationNames.DRAG_DARTBOARD: self.drag_dartboard,
-                locationNames.DRAG_MOP_BUCKET: self.drag_mop_bucket,
-                locationNames.DRAG_MOP: self.drag_mop,
-                locationNames.DRAG_DELIVERY_BOX: self.drag_delivery_box,
-                locationNames.DRAG_BUCKET: self.drag_burly_mans_bucket,
-                locationNames.DRAG_MINI_BENCH: self.drag_mini_benches,
-                locationNames.DRAG_MINI_PUMP: self.drag_mini_pump,
-                locationNames.DRAG_MINI_STREET_BENCH: self.drag_mini_benches,
-                locationNames.DRAG_MINI_BIRDBATH: self.drag_mini_birdbath,
-                locationNames.DRAG_MINI_EASEL: self.drag_mini_easel,
-                locationNames.DRAG_MINI_SUN_LOUNGE: self.drag_sun_lounge,
-                locationNames.DRAG_TOPSOIL_BAG_1: self.drag_topsoil_bags,
-                locationNames.DRAG_TOPSOIL_BAG_2: self.drag_topsoil_bags,
-                locationNames.DRAG_TOPSOIL_BAG_3: self.drag_topsoil_bags,
-            }
+            # Item Pickup Rules
+            locationNames.PICKUP_RADIO: self.pickup_radio,
+            locationNames.PICKUP_TROWEL: self.pickup_trowel,
+            locationNames.PICKUP_KEYS: self.pickup_keys,
+            locationNames.PICKUP_TULIP: self.pickup_tulip,
+            locationNames.PICKUP_APPLE_1: self.pickup_apples,
+            locationNames.PICKUP_JAM: self.pickup_jam,
+            locationNames.PICKUP_PICNIC_MUG: self.pickup_picnic_mug,
+            locationNames.PICKUP_THERMOS: self.pickup_thermos,
+            locationNames.PICKUP_SANDWICH_R: self.pickup_sandwich,
+            locationNames.PICKUP_SANDWICH_L: self.pickup_sandwich,
+            locationNames.PICKUP_STRAW_HAT: self.pickup_straw_hat,
+            locationNames.PICKUP_DRINK_CAN: self.pickup_drink_can,
+            locationNames.PICKUP_TENNIS_BALL: self.pickup_tennis_ball,
+            locationNames.PICKUP_GROUNDSKEEPERS_HAT: self.pickup_grounsdkeepers_hat,
+            locationNames.PICKUP_APPLE_2: self.pickup_apples,
+            locationNames.PICKUP_BOYS_GLASSES: self.pickup_boys_glasses,
+            locationNames.PICKUP_HORN_RIMMED_GLASSES: self.pickup_horn_rimmed_glasses,
+            locationNames.PICKUP_RED_GLASSES: self.pickup_red_glasses,
+            locationNames.PICKUP_SUNGLASSES: self.pickup_sunglasses,
+            locationNames.PICKUP_LOO_PAPER: self.pickup_loo_paper,
+            locationNames.PICKUP_TOY_CAR: self.pickup_toy_car,
+            locationNames.PICKUP_HAIRBRUSH: self.pickup_hairbrush,
+            locationNames.PICKUP_TOOTHBRUSH: self.pickup_toothbrush,
+            locationNames.PICKUP_STEREOSCOPE: self.pickup_stereoscope,
+            locationNames.PICKUP_DISH_SOAP_BOTTLE: self.pickup_dish_soap_bottle,
+            locationNames.PICKUP_TINNED_FOOD_BLUE: self.pickup_food_cans,
+            locationNames.PICKUP_TINNED_FOOD_YELLOW: self.pickup_food_cans,
+            locationNames.PICKUP_TINNED_FOOD_ORANGE: self.pickup_food_cans,
+            locationNames.PICKUP_WEED_TOOL: self.pickup_weed_tools,
+            locationNames.PICKUP_LILY_FLOWER: self.pickup_lily_flower,
+            locationNames.PICKUP_ORANGE_1: self.pickup_oranges,
+            locationNames.PICKUP_ORANGE_2: self.pickup_oranges,
+            locationNames.PICKUP_ORANGE_3: self.pickup_oranges,
+            locationNames.PICKUP_SHOP_TOMATO_1: self.pickup_tomatoes_high_street,
+            locationNames.PICKUP_SHOP_TOMATO_2: self.pickup_tomatoes_high_street,
+            locationNames.PICKUP_SHOP_TOMATO_3: self.pickup_tomatoes_high_street,
+            locationNames.PICKUP_SHOP_CARROT_1: self.pickup_carrots_high_street,
+            locationNames.PICKUP_SHOP_CARROT_2: self.pickup_carrots_high_street,
+            locationNames.PICKUP_SHOP_CARROT_3: self.pickup_carrots_high_street,
+            locationNames.PICKUP_CUCUMBER_1: self.pickup_cucumbers,
+            locationNames.PICKUP_CUCUMBER_2: self.pickup_cucumbers,
+            locationNames.PICKUP_CUCUMBER_3: self.pickup_cucumbers,
+            locationNames.PICKUP_LEEK_1: self.pickup_leeks,
+            locationNames.PICKUP_LEEK_2: self.pickup_leeks,
+            locationNames.PICKUP_LEEK_3: self.pickup_leeks,
+            locationNames.PICKUP_TOY_PLANE: self.pickup_fusilage,
+            locationNames.PICKUP_PINT_BOTTLE_1: self.pickup_pint_bottle_hub,
+            locationNames.PICKUP_PINT_BOTTLE_2: self.pickup_pint_bottle_high_street,
+            locationNames.PICKUP_PINT_BOTTLE_3: self.pickup_pint_bottle_high_street,
+            locationNames.PICKUP_SPRAY_BOTTLE: self.pickup_spray_bottle,
+            locationNames.PICKUP_WALKIE_TALKIE_1: self.pickup_walkie_talkies,
+            locationNames.PICKUP_WALKIE_TALKIE_2: self.pickup_walkie_talkies,
+            locationNames.PICKUP_APPLE_CORE_1: self.pickup_apple_cores,
+            locationNames.PICKUP_APPLE_CORE_2: self.pickup_apple_cores,
+            locationNames.PICKUP_DUSTBIN_LID: self.pickup_dustbin_lid,
+            locationNames.PICKUP_CHALK: self.pickup_chalk,
+            locationNames.PICKUP_GARDEN_FORK: self.pickup_weed_tools,
+            locationNames.PICKUP_RIBBON_RED: self.pickup_red_bow,
+            locationNames.PICKUP_BLUE_RIBBON: self.pickup_blue_bow,
+            locationNames.PICKUP_DUMMY: self.pickup_dummy,
+            locationNames.PICKUP_CRICKET_BALL: self.pickup_cricket_ball,
+            locationNames.PICKUP_BUST_PIPE: self.pickup_bust_pipe,
+            locationNames.PICKUP_BUST_HAT: self.pickup_bust_hat,
+            locationNames.PICKUP_BUST_GLASSES: self.pickup_bust_glasses,
+            locationNames.PICKUP_SLIPPER_R: self.pickup_slippers,
+            locationNames.PICKUP_SLIPPER_L: self.pickup_slippers,
+            locationNames.PICKUP_TEA_CUP: self.pickup_tea_cup,
+            locationNames.PICKUP_NEWSPAPER: self.pickup_newspaper,
+            locationNames.PICKUP_SOCK_1: self.pickup_socks,
+            locationNames.PICKUP_SOCK_2: self.pickup_socks,
+            locationNames.PICKUP_VASE: self.pickup_vase,
+            locationNames.PICKUP_POT_STACK: self.pickup_pot_stack,
+            locationNames.PICKUP_SOAP: self.pickup_soap,
+            locationNames.PICKUP_PAINTBRUSH: self.pickup_paintbrush,
+            locationNames.PICKUP_VASE_PIECE_1: self.pickup_vase_pieces,
+            locationNames.PICKUP_VASE_PIECE_2: self.pickup_vase_pieces,
+            locationNames.PICKUP_BRA: self.pickup_bra,
+            locationNames.PICKUP_BADMINTON_RACKET: self.pickup_badminton_racket,
+            locationNames.PICKUP_ROSE: self.pickup_rose,
+            locationNames.PICKUP_FISHING_BOBBER: self.pickup_fishing_bobber,
+            locationNames.PICKUP_LETTER: self.pickup_exit_letter,
+            locationNames.PICKUP_PLATE_1: self.pickup_plates,
+            locationNames.PICKUP_PLATE_2: self.pickup_plates,
+            locationNames.PICKUP_PLATE_3: self.pickup_plates,
+            locationNames.PICKUP_GREEN_QUOIT_1: self.pickup_green_quoits,
+            locationNames.PICKUP_GREEN_QUOIT_2: self.pickup_green_quoits,
+            locationNames.PICKUP_GREEN_QUOIT_3: self.pickup_green_quoits,
+            locationNames.PICKUP_RED_QUOIT_1: self.pickup_red_quoits,
+            locationNames.PICKUP_RED_QUOIT_2: self.pickup_red_quoits,
+            locationNames.PICKUP_RED_QUOIT_3: self.pickup_red_quoits,
+            locationNames.PICKUP_FORK_1: self.pickup_forks,
+            locationNames.PICKUP_FORK_2: self.pickup_forks,
+            locationNames.PICKUP_KNIFE_1: self.pickup_knives,
+            locationNames.PICKUP_KNIFE_2: self.pickup_knives,
+            locationNames.PICKUP_CORK: self.pickup_cork,
+            locationNames.PICKUP_CANDLESTICK: self.pickup_candlestick,
+            locationNames.PICKUP_FLOWER_FOR_VASE: self.pickup_vase_flower,
+            locationNames.PICKUP_DART_1: self.pickup_darts,
+            locationNames.PICKUP_DART_2: self.pickup_darts,
+            locationNames.PICKUP_DART_3: self.pickup_darts,
+            locationNames.PICKUP_HARMONICA: self.pickup_harmonica,
+            locationNames.PICKUP_PINT_GLASS: self.pickup_pint_glass,
+            locationNames.PICKUP_TOY_BOAT: self.pickup_toy_boat,
+            locationNames.PICKUP_OLD_MANS_WOOLEN_HAT: self.pickup_woolen_hat,
+            locationNames.PICKUP_PEPPER_GRINDER: self.pickup_pepper_grinder,
+            locationNames.PICKUP_PUB_WOMANS_CLOTH: self.pickup_pub_woman_cloth,
+            locationNames.PICKUP_MINI_PERSON_CHILD: self.pickup_people_miniatures,
+            locationNames.PICKUP_MINI_PERSON_JUMPSUIT: self.pickup_people_miniatures,
+            locationNames.PICKUP_MINI_PERSON_GARDENER: self.pickup_people_miniatures,
+            locationNames.PICKUP_MINI_PERSON_OLD_WOMAN: self.pickup_people_miniatures,
+            locationNames.PICKUP_MINI_PERSON_POSTIE: self.pickup_people_miniatures,
+            locationNames.PICKUP_MINI_PERSON_VEST_MAN: self.pickup_people_miniatures,
+            locationNames.PICKUP_MINI_PERSON: self.pickup_people_miniatures,
+            locationNames.PICKUP_MINI_GOOSE: self.pickup_mini_goose,
+            locationNames.PICKUP_MINI_SHOVEL: self.pickup_mini_shovel,
+            locationNames.PICKUP_POPPY_FLOWER: self.pickup_poppy,
+            locationNames.PICKUP_MINI_PHONE_DOOR: self.pickup_mini_phone_booth,
+            locationNames.PICKUP_MINI_MAIL_PILLAR: self.pickup_mini_mail_pillar,
+            locationNames.PICKUP_TIMBER_HANDLE: self.pickup_timber_handle,
+            locationNames.PICKUP_GOLDEN_BELL: self.pickup_golden_bell,
+            locationNames.PICKUP_CARROT_1: self.pickup_garden_carrots,
+            locationNames.PICKUP_CARROT_2: self.pickup_garden_carrots,
+            locationNames.PICKUP_CARROT_3: self.pickup_garden_carrots,
+            locationNames.PICKUP_CARROT_4: self.pickup_garden_carrots,
+            locationNames.PICKUP_CARROT_5: self.pickup_garden_carrots,
+            locationNames.PICKUP_CARROT_6: self.pickup_garden_carrots,
+            locationNames.PICKUP_CARROT_7: self.pickup_garden_carrots,
+            locationNames.PICKUP_CARROT_8: self.pickup_garden_carrots,
+            locationNames.PICKUP_CARROT_9: self.pickup_garden_carrots,
+            locationNames.PICKUP_CARROT_10: self.pickup_garden_carrots,
+            locationNames.PICKUP_PUB_TOMATO_1: self.pickup_pub_boxed_tomatoes,
+            locationNames.PICKUP_PUB_TOMATO_2: self.pickup_pub_boxed_tomatoes,
+            locationNames.PICKUP_PUB_TOMATO_3: self.pickup_pub_boxed_tomatoes,
+            locationNames.PICKUP_PUB_TOMATO_4: self.pickup_pub_boxed_tomatoes,
+            locationNames.PICKUP_PUB_TOMATO_5: self.pickup_pub_boxed_tomatoes,
+            locationNames.PICKUP_PUB_TOMATO_6: self.pickup_pub_boxed_tomatoes,
+            locationNames.PICKUP_PUB_TOMATO_7: self.pickup_pub_boxed_tomatoes,
+            locationNames.PICKUP_PUB_TOMATO_8: self.pickup_pub_boxed_tomatoes,
+            locationNames.PICKUP_PUB_TOMATO_9: self.pickup_pub_boxed_tomatoes,
+            locationNames.PICKUP_PUB_TOMATO_10: self.pickup_pub_open_tomatoes,
+            locationNames.PICKUP_PUB_TOMATO_11: self.pickup_pub_open_tomatoes,
+            locationNames.PICKUP_BOOT_START: self.pickup_boots,
+            locationNames.PICKUP_BOOT_HUB: self.pickup_boots,
 
-        # Interaction Rules
-        if self.world.options.include_interactions.value:
-            self.interaction_rules = {
-                locationNames.INTERACT_BIKE_BELL: self.interact_bike_bell,
-                locationNames.INTERACT_GARDEN_TAP: self.interact_garden_water,
-                locationNames.INTERACT_SPRINKLER: self.interact_garden_water,
-                locationNames.INTERACT_UNPLUG_RADIO: self.interact_radio,
-                locationNames.INTERACT_UMBRELLA_BLACK: self.interact_umbrellas,
-                locationNames.INTERACT_UMBRELLA_RAINBOW: self.interact_umbrellas,
-                locationNames.INTERACT_UMBRELLA_RED: self.interact_umbrellas,
-                locationNames.INTERACT_BOYS_LACES_L: self.interact_boys_laces,
-                locationNames.INTERACT_BOYS_LACES_R: self.interact_boys_laces,
-                locationNames.INTERACT_FOOTBALL: self.interact_football,
-                locationNames.INTERACT_RING_BELL: self.interact_back_gardens_objects,
-                locationNames.INTERACT_WINDMILL: self.interact_back_gardens_objects,
-                locationNames.INTERACT_PURPLE_FLOWER: self.interact_back_gardens_objects,
-                locationNames.INTERACT_TRELLIS: self.interact_trellis,
-                locationNames.INTERACT_SUNFLOWER: self.interact_back_gardens_objects,
-                locationNames.INTERACT_TOPIARY: self.interact_back_gardens_objects,
-                locationNames.INTERACT_WIND_CHIME_C: self.interact_back_gardens_objects,
-                locationNames.INTERACT_WIND_CHIME_D: self.interact_back_gardens_objects,
-                locationNames.INTERACT_WIND_CHIME_E: self.interact_back_gardens_objects,
-                locationNames.INTERACT_WIND_CHIME_F: self.interact_back_gardens_objects,
-                locationNames.INTERACT_WIND_CHIME_G: self.interact_back_gardens_objects,
-                locationNames.INTERACT_WIND_CHIME_A: self.interact_back_gardens_objects,
-                locationNames.INTERACT_WIND_CHIME_B: self.interact_back_gardens_objects,
-                locationNames.INTERACT_VAN_DOOR_L: self.interact_van_doors,
-                locationNames.INTERACT_VAN_DOOR_R: self.interact_van_doors,
-                locationNames.INTERACT_BURLY_MANS_LACES_L: self.interact_burly_laces,
-                locationNames.INTERACT_BURLY_MANS_LACES_R: self.interact_burly_laces,
-                locationNames.INTERACT_PUB_TAP: self.interact_pub_tap,
-                locationNames.INTERACT_WELL: self.interact_well,
-            }
+            # Item Drag Rules
+            locationNames.DRAG_RAKE: self.drag_rake,
+            locationNames.DRAG_PICNIC_BASKET: self.drag_picnic_basket,
+            locationNames.DRAG_ESKY: self.drag_esky,
+            locationNames.DRAG_SHOVEL: self.drag_shovel,
+            locationNames.DRAG_PUMKPIN_1: self.drag_pumpkins,
+            locationNames.DRAG_PUMKPIN_2: self.drag_pumpkins,
+            locationNames.DRAG_PUMKPIN_3: self.drag_pumpkins,
+            locationNames.DRAG_PUMKPIN_4: self.drag_pumpkins,
+            locationNames.DRAG_WATERING_CAN: self.drag_watering_can,
+            locationNames.DRAG_GUMBOOT_1: self.drag_gumboots,
+            locationNames.DRAG_GUMBOOT_2: self.drag_gumboots,
+            locationNames.DRAG_NO_GOOSE_SIGN_GARDEN: self.drag_gardener_sign,
+            locationNames.DRAG_WOODEN_CRATE: self.drag_wooden_crate,
+            locationNames.DRAG_FENCE_BOLT: self.drag_fence_bolt,
+            locationNames.DRAG_MALLET: self.drag_mallet,
+            locationNames.DRAG_SHOPPING_BASKET: self.drag_shopping_basket,
+            locationNames.DRAG_UMBRELLA_BLACK: self.drag_umbrellas,
+            locationNames.DRAG_UMBRELLA_RAINBOW: self.drag_umbrellas,
+            locationNames.DRAG_UMBRELLA_RED: self.drag_umbrellas,
+            locationNames.DRAG_PUSH_BROOM: self.drag_push_broom,
+            locationNames.DRAG_BROKEN_BROOM_HEAD: self.drag_broom_head,
+            locationNames.DRAG_DUSTBIN: self.drag_dustbin,
+            locationNames.DRAG_BABY_DOLL: self.drag_baby_doll,
+            locationNames.DRAG_PRICING_GUN: self.drag_pricing_gun,
+            locationNames.DRAG_ADDING_MACHINE: self.drag_adding_machine,
+            locationNames.DRAG_ROSE_BOX: self.drag_rose_box,
+            locationNames.DRAG_CRICKET_BAT: self.drag_cricket_bat,
+            locationNames.DRAG_TEA_POT: self.drag_tea_pot,
+            locationNames.DRAG_CLIPPERS: self.drag_clippers,
+            locationNames.DRAG_DUCK_STATUE: self.drag_duck_statue,
+            locationNames.DRAG_FROG_STATUE: self.drag_frog_statue,
+            locationNames.DRAG_JEREMY_FISH: self.drag_jeremy_fish,
+            locationNames.DRAG_NO_GOOSE_SIGN_MESSY: self.drag_messy_sign,
+            locationNames.DRAG_DRAWER: self.drag_drawer,
+            locationNames.DRAG_ENAMEL_JUG: self.drag_enamel_jug,
+            locationNames.DRAG_NO_GOOSE_SIGN_CLEAN: self.drag_clean_sign,
+            locationNames.DRAG_TACKLE_BOX: self.drag_tackle_box,
+            locationNames.DRAG_TRAFFIC_CONE: self.drag_traffic_cone,
+            locationNames.DRAG_PARCEL: self.drag_exit_parcel,
+            locationNames.DRAG_STEALTH_BOX: self.drag_stealth_box,
+            locationNames.DRAG_NO_GOOSE_SIGN_PUB: self.drag_no_goose_sign,
+            locationNames.DRAG_PORTABLE_STOOL: self.drag_portable_stool,
+            locationNames.DRAG_DARTBOARD: self.drag_dartboard,
+            locationNames.DRAG_MOP_BUCKET: self.drag_mop_bucket,
+            locationNames.DRAG_MOP: self.drag_mop,
+            locationNames.DRAG_DELIVERY_BOX: self.drag_delivery_box,
+            locationNames.DRAG_BUCKET: self.drag_burly_mans_bucket,
+            locationNames.DRAG_MINI_BENCH: self.drag_mini_benches,
+            locationNames.DRAG_MINI_PUMP: self.drag_mini_pump,
+            locationNames.DRAG_MINI_STREET_BENCH: self.drag_mini_benches,
+            locationNames.DRAG_MINI_BIRDBATH: self.drag_mini_birdbath,
+            locationNames.DRAG_MINI_EASEL: self.drag_mini_easel,
+            locationNames.DRAG_MINI_SUN_LOUNGE: self.drag_sun_lounge,
+            locationNames.DRAG_TOPSOIL_BAG_1: self.drag_topsoil_bags,
+            locationNames.DRAG_TOPSOIL_BAG_2: self.drag_topsoil_bags,
+            locationNames.DRAG_TOPSOIL_BAG_3: self.drag_topsoil_bags,
 
-        # New Tasks Rules
-        if self.world.options.include_new_tasks.value:
-            self.new_tasks_rules = {
-                locationNames.SHORT_OUT_RADIO: self.short_out_radio,
-                locationNames.LOCK_GROUNDSKEEPER_IN: self.lock_groundskeeper_out,
-                locationNames.OPEN_INTRO_GATE: self.interact_intro_gate,
-                locationNames.DROP_MAIL_IN_WELL: self.drop_mail_in_well,
-                locationNames.BREAK_THROUGH_BOARDS: self.interact_boards,
-                locationNames.MAKE_WOMAN_FIX_TOPIARY: self.interact_make_woman_fix_topiary,
-                locationNames.POSE_AS_DUCK: self.pose_as_duck_statue,
-                locationNames.DRESS_UP_BUSH: self.dress_up_bush,
-                locationNames.INTERIOR_REDECORATING: self.drag_messy_sign,
-                locationNames.TRIP_BURLY_MAN: self.interact_burly_laces,
-                locationNames.BREAK_PINT_GLASS: self.pickup_pint_glass,
-                locationNames.TRAP_TV_SHOP_OWNER_GARAGE: self.trap_tv_shop_owner_in_garage,
-                locationNames.PERFORM_WITH_HARMONICA: self.perform_with_harmonica,
-            }
+            # Interaction Rules
+            locationNames.INTERACT_BIKE_BELL: self.interact_bike_bell,
+            locationNames.INTERACT_GARDEN_TAP: self.interact_garden_water,
+            locationNames.INTERACT_SPRINKLER: self.interact_garden_water,
+            locationNames.INTERACT_UNPLUG_RADIO: self.interact_radio,
+            locationNames.INTERACT_UMBRELLA_BLACK: self.interact_umbrellas,
+            locationNames.INTERACT_UMBRELLA_RAINBOW: self.interact_umbrellas,
+            locationNames.INTERACT_UMBRELLA_RED: self.interact_umbrellas,
+            locationNames.INTERACT_BOYS_LACES_L: self.interact_boys_laces,
+            locationNames.INTERACT_BOYS_LACES_R: self.interact_boys_laces,
+            locationNames.INTERACT_FOOTBALL: self.interact_football,
+            locationNames.INTERACT_RING_BELL: self.interact_back_gardens_objects,
+            locationNames.INTERACT_WINDMILL: self.interact_back_gardens_objects,
+            locationNames.INTERACT_PURPLE_FLOWER: self.interact_back_gardens_objects,
+            locationNames.INTERACT_TRELLIS: self.interact_trellis,
+            locationNames.INTERACT_SUNFLOWER: self.interact_back_gardens_objects,
+            locationNames.INTERACT_TOPIARY: self.interact_back_gardens_objects,
+            locationNames.INTERACT_WIND_CHIME_C: self.interact_back_gardens_objects,
+            locationNames.INTERACT_WIND_CHIME_D: self.interact_back_gardens_objects,
+            locationNames.INTERACT_WIND_CHIME_E: self.interact_back_gardens_objects,
+            locationNames.INTERACT_WIND_CHIME_F: self.interact_back_gardens_objects,
+            locationNames.INTERACT_WIND_CHIME_G: self.interact_back_gardens_objects,
+            locationNames.INTERACT_WIND_CHIME_A: self.interact_back_gardens_objects,
+            locationNames.INTERACT_WIND_CHIME_B: self.interact_back_gardens_objects,
+            locationNames.INTERACT_VAN_DOOR_L: self.interact_van_doors,
+            locationNames.INTERACT_VAN_DOOR_R: self.interact_van_doors,
+            locationNames.INTERACT_BURLY_MANS_LACES_L: self.interact_burly_laces,
+            locationNames.INTERACT_BURLY_MANS_LACES_R: self.interact_burly_laces,
+            locationNames.INTERACT_PUB_TAP: self.interact_pub_tap,
+            locationNames.INTERACT_WELL: self.interact_well,
 
-        # Model Church Pecking Rules
-        if self.world.options.include_model_church_pecks.value == 1:
-            self.church_first_peck_rules = {
-                locationNames.PECK_DOORWAY: self.peck_church,
-                locationNames.PECK_TOWER: self.peck_church,
-            }
-        elif self.world.options.include_model_church_pecks.value == 2:
-            self.church_all_peck_rules = {
-                locationNames.PECK_DOORWAY_1: self.peck_church,
-                locationNames.PECK_DOORWAY_2: self.peck_church,
-                locationNames.PECK_DOORWAY_3: self.peck_church,
-                locationNames.PECK_DOORWAY_4: self.peck_church,
-                locationNames.PECK_DOORWAY_5: self.peck_church,
-                locationNames.PECK_DOORWAY_6: self.peck_church,
-                locationNames.PECK_DOORWAY_7: self.peck_church,
-                locationNames.PECK_DOORWAY_8: self.peck_church,
-                locationNames.PECK_DOORWAY_9: self.peck_church,
-                locationNames.PECK_DOORWAY_10: self.peck_church,
-                locationNames.PECK_DOORWAY_11: self.peck_church,
-                locationNames.PECK_DOORWAY_12: self.peck_church,
-                locationNames.PECK_DOORWAY_13: self.peck_church,
-                locationNames.PECK_DOORWAY_14: self.peck_church,
-                locationNames.PECK_DOORWAY_15: self.peck_church,
-                locationNames.PECK_DOORWAY_16: self.peck_church,
-                locationNames.PECK_DOORWAY_17: self.peck_church,
-                locationNames.PECK_DOORWAY_18: self.peck_church,
-                locationNames.PECK_DOORWAY_19: self.peck_church,
-                locationNames.PECK_TOWER_1: self.peck_church,
-                locationNames.PECK_TOWER_2: self.peck_church,
-                locationNames.PECK_TOWER_3: self.peck_church,
-                locationNames.PECK_TOWER_4: self.peck_church,
-                locationNames.PECK_TOWER_5: self.peck_church,
-                locationNames.PECK_TOWER_6: self.peck_church,
-                locationNames.PECK_TOWER_7: self.peck_church,
-                locationNames.PECK_TOWER_8: self.peck_church,
-                locationNames.PECK_TOWER_9: self.peck_church,
-                locationNames.PECK_TOWER_10: self.peck_church,
-                locationNames.PECK_TOWER_11: self.peck_church,
-                locationNames.PECK_TOWER_12: self.peck_church,
-                locationNames.PECK_TOWER_13: self.peck_church,
-                locationNames.PECK_TOWER_14: self.peck_church,
-                locationNames.PECK_TOWER_15: self.peck_church,
-                locationNames.PECK_TOWER_16: self.peck_church,
-            }
+            # New Tasks Rules
+            locationNames.SHORT_OUT_RADIO: self.short_out_radio,
+            locationNames.LOCK_GROUNDSKEEPER_IN: self.lock_groundskeeper_out,
+            locationNames.OPEN_INTRO_GATE: self.interact_intro_gate,
+            locationNames.DROP_MAIL_IN_WELL: self.drop_mail_in_well,
+            locationNames.BREAK_THROUGH_BOARDS: self.interact_boards,
+            locationNames.MAKE_WOMAN_FIX_TOPIARY: self.interact_make_woman_fix_topiary,
+            locationNames.POSE_AS_DUCK: self.pose_as_duck_statue,
+            locationNames.DRESS_UP_BUSH: self.dress_up_bush,
+            locationNames.INTERIOR_REDECORATING: self.drag_messy_sign,
+            locationNames.TRIP_BURLY_MAN: self.interact_burly_laces,
+            locationNames.BREAK_PINT_GLASS: self.pickup_pint_glass,
+            locationNames.TRAP_TV_SHOP_OWNER_GARAGE: self.trap_tv_shop_owner_in_garage,
+            locationNames.PERFORM_WITH_HARMONICA: self.perform_with_harmonica,
 
-        # Milestone Rules
-        if self.world.options.include_milestone_locations.value and self.world.options.include_extra_tasks.value and self.world.options.include_speedrun_tasks.value:
-            self.all_milestone_rules = {
-                locationNames.MILESTONE_ALL_GARDEN: self.all_garden_tasks,
-                locationNames.MILESTONE_ALL_HIGH_STREET: self.all_high_street_tasks,
-                locationNames.MILESTONE_ALL_BACK_GARDENS: self.all_back_gardens_tasks,
-                locationNames.MILESTONE_ALL_PUB: self.all_pub_tasks,
-                locationNames.MILESTONE_ALL_MAIN: self.all_main_task_lists,
-                locationNames.MILESTONE_ALL_EXTRA: self.all_to_do_as_well_tasks,
-                locationNames.MILESTONE_ALL_SPEEDRUN: self.all_speedrun_tasks,
-                locationNames.MILESTONE_ALL_TASKS: self.all_tasks_complete,
-            }
-        elif self.world.options.include_milestone_locations.value and self.world.options.include_extra_tasks.value:
-            self.non_speedrun_milestone_rules = {
-                locationNames.MILESTONE_ALL_GARDEN: self.all_garden_tasks,
-                locationNames.MILESTONE_ALL_HIGH_STREET: self.all_high_street_tasks,
-                locationNames.MILESTONE_ALL_BACK_GARDENS: self.all_back_gardens_tasks,
-                locationNames.MILESTONE_ALL_PUB: self.all_pub_tasks,
-                locationNames.MILESTONE_ALL_MAIN: self.all_main_task_lists,
-                locationNames.MILESTONE_ALL_EXTRA: self.all_to_do_as_well_tasks,
-            }
-        elif self.world.options.include_milestone_locations.value and self.world.options.include_speedrun_tasks.value:
-            self.non_to_do_as_well_milestone_rules = {
-                locationNames.MILESTONE_ALL_GARDEN: self.all_garden_tasks,
-                locationNames.MILESTONE_ALL_HIGH_STREET: self.all_high_street_tasks,
-                locationNames.MILESTONE_ALL_BACK_GARDENS: self.all_back_gardens_tasks,
-                locationNames.MILESTONE_ALL_PUB: self.all_pub_tasks,
-                locationNames.MILESTONE_ALL_MAIN: self.all_main_task_lists,
-                locationNames.MILESTONE_ALL_SPEEDRUN: self.all_speedrun_tasks,
-            }
-        elif self.world.options.include_milestone_locations.value:
-            self.basic_milestone_rules = {
-                locationNames.MILESTONE_ALL_GARDEN: self.all_garden_tasks,
-                locationNames.MILESTONE_ALL_HIGH_STREET: self.all_high_street_tasks,
-                locationNames.MILESTONE_ALL_BACK_GARDENS: self.all_back_gardens_tasks,
-                locationNames.MILESTONE_ALL_PUB: self.all_pub_tasks,
-                locationNames.MILESTONE_ALL_MAIN: self.all_main_task_lists,
-            }
+            # Model Church Pecking Rules
+            locationNames.PECK_DOORWAY: self.peck_church,
+            locationNames.PECK_TOWER: self.peck_church,
+            locationNames.PECK_DOORWAY_1: self.peck_church,
+            locationNames.PECK_DOORWAY_2: self.peck_church,
+            locationNames.PECK_DOORWAY_3: self.peck_church,
+            locationNames.PECK_DOORWAY_4: self.peck_church,
+            locationNames.PECK_DOORWAY_5: self.peck_church,
+            locationNames.PECK_DOORWAY_6: self.peck_church,
+            locationNames.PECK_DOORWAY_7: self.peck_church,
+            locationNames.PECK_DOORWAY_8: self.peck_church,
+            locationNames.PECK_DOORWAY_9: self.peck_church,
+            locationNames.PECK_DOORWAY_10: self.peck_church,
+            locationNames.PECK_DOORWAY_11: self.peck_church,
+            locationNames.PECK_DOORWAY_12: self.peck_church,
+            locationNames.PECK_DOORWAY_13: self.peck_church,
+            locationNames.PECK_DOORWAY_14: self.peck_church,
+            locationNames.PECK_DOORWAY_15: self.peck_church,
+            locationNames.PECK_DOORWAY_16: self.peck_church,
+            locationNames.PECK_DOORWAY_17: self.peck_church,
+            locationNames.PECK_DOORWAY_18: self.peck_church,
+            locationNames.PECK_DOORWAY_19: self.peck_church,
+            locationNames.PECK_TOWER_1: self.peck_church,
+            locationNames.PECK_TOWER_2: self.peck_church,
+            locationNames.PECK_TOWER_3: self.peck_church,
+            locationNames.PECK_TOWER_4: self.peck_church,
+            locationNames.PECK_TOWER_5: self.peck_church,
+            locationNames.PECK_TOWER_6: self.peck_church,
+            locationNames.PECK_TOWER_7: self.peck_church,
+            locationNames.PECK_TOWER_8: self.peck_church,
+            locationNames.PECK_TOWER_9: self.peck_church,
+            locationNames.PECK_TOWER_10: self.peck_church,
+            locationNames.PECK_TOWER_11: self.peck_church,
+            locationNames.PECK_TOWER_12: self.peck_church,
+            locationNames.PECK_TOWER_13: self.peck_church,
+            locationNames.PECK_TOWER_14: self.peck_church,
+            locationNames.PECK_TOWER_15: self.peck_church,
+            locationNames.PECK_TOWER_16: self.peck_church,
 
-        # Goals
-        if self.world.options.goal.value == 0:
-            self.simple_goal_rules = {
-                locationNames.GOAL_MODEL_VILLAGE_ENTRY: self.get_into_model_village,
-            }
-        # elif self.world.options.goal.value == 1:\
-            # No special locations
-        elif self.world.options.goal.value == 2:
-            self.all_main_tasks_goal_rules = {
-                locationNames.GOAL_ALL_MAIN: self.all_main_task_lists,
-            }
-        elif self.world.options.goal.value == 3:
-            self.all_speedrun_tasks_goal_rules = {
-                locationNames.GOAL_ALL_SPEEDRUN: self.all_speedrun_tasks,
-            }
-        elif self.world.options.goal.value == 4:
-            self.all_non_speedrun_tasks_goal_rules = {
-                locationNames.GOAL_ALL_NON_SPEEDRUN: self.all_non_speedrun_tasks,
-            }
-        elif self.world.options.goal.value == 5:
-            self.all_tasks_goal_rules = {
-                locationNames.GOAL_ALL_TASKS: self.all_tasks_complete,
-            }
-        elif self.world.options.goal.value == 6:
-            self.four_final_tasks_rules = {
-                locationNames.GOAL_ALL_FINAL_TASKS: self.four_final_tasks,
-            }
-        
-        # Main Task Rules
-        self.main_tasks_rules = {
+            # Milestone Rules
+            locationNames.MILESTONE_ALL_GARDEN: self.all_garden_tasks,
+            locationNames.MILESTONE_ALL_HIGH_STREET: self.all_high_street_tasks,
+            locationNames.MILESTONE_ALL_BACK_GARDENS: self.all_back_gardens_tasks,
+            locationNames.MILESTONE_ALL_PUB: self.all_pub_tasks,
+            locationNames.MILESTONE_ALL_MAIN: self.all_main_task_lists,
+            locationNames.MILESTONE_ALL_EXTRA: self.all_to_do_as_well_tasks,
+            locationNames.MILESTONE_ALL_SPEEDRUN: self.all_speedrun_tasks,
+            locationNames.MILESTONE_ALL_TASKS: self.all_tasks_complete,
+
+            # Goals
+            locationNames.GOAL_MODEL_VILLAGE_ENTRY: self.get_into_model_village,
+            locationNames.GOAL_ALL_MAIN: self.all_main_task_lists,
+            locationNames.GOAL_ALL_SPEEDRUN: self.all_speedrun_tasks,
+            locationNames.GOAL_ALL_NON_SPEEDRUN: self.all_non_speedrun_tasks,
+            locationNames.GOAL_ALL_TASKS: self.all_tasks_complete,
+            locationNames.GOAL_ALL_FINAL_TASKS: self.four_final_tasks,
+
+            # Main Task Rules
             locationNames.TASK_GARDEN_ENTRY: self.get_into_garden,
             locationNames.TASK_GARDEN_WET: self.get_groundskeeper_wet,
             locationNames.TASK_GARDEN_KEYS: self.steal_groundskeepers_keys,
@@ -447,2113 +515,1903 @@ class UntitledGooseRules:
             locationNames.TASK_PUB_PINT: self.drop_pint_glass_in_canal,
             locationNames.TASK_PUB_TABLE: self.set_table,
             locationNames.TASK_PUB_FINAL: self.drop_bucket_on_burly_man,
-        }
-        
-        # Model Village Rules/Victory Rules
-        self.victory_rules = {
+
+            # Model Village Rules/Victory Rules
             locationNames.TASK_MODEL_VILLAGE_ENTRY: self.get_into_model_village,
             locationNames.TASK_MODEL_VILLAGE_BELL: self.steal_bell,
             locationNames.TASK_MODEL_VILLAGE_VICTORY: self.steal_bell,
         }
+        for name, option in OPTION_GATED_RULES.items():
+            if not getattr(self.world.options, option).value:
+                del location_rules[name]
+        return location_rules
+    
+    
+    # ----- Compilation -----
+    
+    def rule(self, builder: Callable[[], Requirement]) -> Rule:
+        """Compiles a rule method into a CollectionState predicate, once per rule"""
+        name = builder.__name__
+        compiled = self.compiled_rules.get(name)
+        if compiled is None:
+            compiled = self.compiled_rules[name] = profile_compiled_rule(
+                self.world, name, self.compiler.compile(builder())
+            )
+        return compiled
+    
+    def location_rule(self, location: Location, builder: Callable[[], Requirement], flags: Tuple[str, ...] = ()) -> Rule:
+        """Compiles the rule for a location, leaving out the item checks its region's entrance already made.
+
+        A location can only be reached through its parent region, so the compiled rule is only
+        correct together with that region being reachable, which is how Location.can_reach uses it."""
+        region_items = self.region_items(location.parent_region.name)
+        requirement = builder()
+        
+        # Reaching the region counts as a dependency too, even though the compiled rule skips it
+        self.location_dependencies[location.name] = self.compiler.items_of(requirement).union(
+            check.item for check in region_items
+        )
+        return profile_compiled_rule(
+            self.world, builder.__name__, self.compiler.compile(self.compiler.assume(requirement, region_items)),
+            location.name, flags,
+        )
+    
+    def region_items(self, region: str) -> FrozenSet[Has]:
+        """Items every way into the region needs, matching the hub entrances made in Regions.py"""
+        clauses = self.compiler.to_dnf(self.has_region(region))
+        if not clauses or len(clauses) > 1:
+            return frozenset()
+        return clauses[0]
     
     
     # ----- Region Defs -----
     
-    def has_area(self, state: CollectionState, area) -> bool:
-        return state.has(f"{area} Access", self.player)
+    def has_area(self, area) -> Requirement:
+        if self.area_counts:
+            return Has(itemNames.PROGRESSIVE_AREA_ACCESS, self.area_counts[f"{area} Access"])
+        return Has(f"{area} Access")
 
-    def has_garden(self, state: CollectionState) -> bool:
-        return self.has_area(state, regionNames.GARDEN)
+    def has_garden(self) -> Requirement:
+        return self.has_area(regionNames.GARDEN)
 
-    def has_high_street(self, state: CollectionState) -> bool:
-        return self.has_area(state, regionNames.HIGH_STREET)
+    def has_high_street(self) -> Requirement:
+        return self.has_area(regionNames.HIGH_STREET)
 
-    def has_back_gardens(self, state: CollectionState) -> bool:
-        return self.has_area(state, regionNames.BACK_GARDENS)
+    def has_back_gardens(self) -> Requirement:
+        return self.has_area(regionNames.BACK_GARDENS)
 
-    def has_pub(self, state: CollectionState) -> bool:
-        return self.has_area(state, regionNames.PUB)
+    def has_pub(self) -> Requirement:
+        return self.has_area(regionNames.PUB)
 
-    def has_model_village(self, state: CollectionState) -> bool:
+    def has_model_village(self) -> Requirement:
+        if self.area_counts:
+            # The Model Village is the last progressive area, so reaching it means the Pub is open too
+            return self.has_area(regionNames.MODEL_VILLAGE)
         return (
-            self.has_area(state, regionNames.PUB)
-            and self.has_area(state, regionNames.MODEL_VILLAGE)
+            self.has_area(regionNames.PUB)
+            & self.has_area(regionNames.MODEL_VILLAGE)
         )
     
     
+    def has_region(self, area) -> Requirement:
+        if area == regionNames.HUB:
+            return ALWAYS
+        if area == regionNames.MODEL_VILLAGE:
+            return self.has_model_village()
+        return self.has_area(area)
+    
+    
     # ----- Souls Defs -----
 
-    def has_npc(self, state: CollectionState, npc_soul) -> bool:
+    def has_npc(self, npc_soul) -> Requirement:
         if self.world.options.include_npc_souls.value:
-            return state.has(f"{npc_soul}", self.player)
-        return True
+            return Has(npc_soul)
+        return ALWAYS
     
-    def has_prop(self, state: CollectionState, prop) -> bool:
+    def has_prop(self, prop) -> Requirement:
         if self.world.options.include_prop_souls.value:
-            return state.has(f"{prop}", self.player)
-        return True
+            return Has(prop)
+        return ALWAYS
+    
+    def has_soul(self, soul) -> Requirement:
+        if soul in ITEM_GROUPS["NPC Souls"]:
+            return self.has_npc(soul)
+        return self.has_prop(soul)
+    
+    def weighted_items(self, threshold: int, table: Iterable[WeightedItem]) -> Requirement:
+        """Passes when the weights of the reachable items in the table add up to at least the threshold"""
+        return weighted_at_least(threshold, (
+            (
+                self.has_region(entry.area)
+                & (self.has_prop(entry.needs) if entry.needs else ALWAYS)
+                & self.has_soul(entry.item),
+                entry.weight,
+            )
+            for entry in table
+        ))
+    
+    
+    # ----- Task Lists -----
+    # The tasks on each area's list before its final task, which needs most of them done first
+    
+    def garden_tasks(self) -> Tuple[Requirement, ...]:
+        return (
+            self.get_into_garden(),
+            self.get_groundskeeper_wet(),
+            self.steal_groundskeepers_keys(),
+            self.make_groundskeeper_wear_sun_hat(),
+            self.rake_in_lake(),
+            self.picnic(),
+        )
+    
+    def high_street_tasks(self) -> Tuple[Requirement, ...]:
+        return (
+            self.break_broom(),
+            self.trap_boy_in_phone_booth(),
+            self.make_boy_wear_wrong_glasses(),
+            self.make_someone_buyback(),
+            self.get_on_tv(),
+            self.go_shopping(),
+        )
+    
+    def back_gardens_tasks(self) -> Tuple[Requirement, ...]:
+        return (
+            self.make_someone_break_vase(),
+            self.make_man_spit_out_tea(),
+            self.get_dressed_up(),
+            self.make_man_barefoot(),
+            self.do_washing(),
+            self.dress_up_bust(),
+        )
+    
+    def pub_tasks(self) -> Tuple[Requirement, ...]:
+        return (
+            self.get_into_pub(),
+            self.break_dartboard(),
+            self.get_toy_boat(),
+            self.make_old_man_fall_on_bum(),
+            self.be_awarded_flower(),
+            self.drop_pint_glass_in_canal(),
+            self.set_table(),
+        )
     
     
     # ----- Garden Task Rule Defs -----
     
-    def get_into_garden(self, state: CollectionState) -> bool:
-        return self.has_garden(state)
+    @task
+    def get_into_garden(self) -> Requirement:
+        return self.has_garden()
     
-    def get_groundskeeper_wet(self, state: CollectionState) -> bool:
+    @task
+    def get_groundskeeper_wet(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_npc(state, itemNames.NPC_GROUNDSKEEPER)
+            self.has_garden()
+            & self.has_npc(itemNames.NPC_GROUNDSKEEPER)
         )
     
-    def steal_groundskeepers_keys(self, state: CollectionState) -> bool:
+    @task
+    def steal_groundskeepers_keys(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_npc(state, itemNames.NPC_GROUNDSKEEPER)
+            self.has_garden()
+            & self.has_npc(itemNames.NPC_GROUNDSKEEPER)
         )
     
-    def make_groundskeeper_wear_sun_hat(self, state: CollectionState) -> bool:
+    @task
+    def make_groundskeeper_wear_sun_hat(self) -> Requirement:
         return (
-            self.pickup_grounsdkeepers_hat(state)
-            and self.has_prop(state, itemNames.PROP_STRAW_HAT)
+            self.pickup_grounsdkeepers_hat()
+            & self.has_prop(itemNames.PROP_STRAW_HAT)
         )
     
-    def rake_in_lake(self, state: CollectionState) -> bool:
+    @task
+    def rake_in_lake(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_prop(state, itemNames.PROP_RAKE)
+            self.has_garden()
+            & self.has_prop(itemNames.PROP_RAKE)
         )
     
-    def picnic(self, state: CollectionState) -> bool:
+    @task
+    def picnic(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_prop(state, itemNames.PROP_SANDWICH)
-            and self.has_prop(state, itemNames.PROP_APPLES)
-            and self.has_prop(state, itemNames.PROP_PUMPKINS)
-            and self.has_prop(state, itemNames.PROP_CARROTS)
-            and self.has_prop(state, itemNames.PROP_JAM)
-            and self.has_prop(state, itemNames.PROP_THERMOS)
-            and self.has_prop(state, itemNames.PROP_RADIO)
-            and self.has_prop(state, itemNames.PROP_PICNIC_BASKET)
+            self.has_garden()
+            & self.has_prop(itemNames.PROP_SANDWICH)
+            & self.has_prop(itemNames.PROP_APPLES)
+            & self.has_prop(itemNames.PROP_PUMPKINS)
+            & self.has_prop(itemNames.PROP_CARROTS)
+            & self.has_prop(itemNames.PROP_JAM)
+            & self.has_prop(itemNames.PROP_THERMOS)
+            & self.has_prop(itemNames.PROP_RADIO)
+            & self.has_prop(itemNames.PROP_PICNIC_BASKET)
         )
     
-    def make_groundskeeper_hammer_thumb(self, state: CollectionState) -> bool:
-        task_count = 0
-        
-        if self.get_into_garden(state):
-            task_count += 1
-        if self.get_groundskeeper_wet(state):
-            task_count += 1
-        if self.steal_groundskeepers_keys(state):
-            task_count += 1
-        if self.make_groundskeeper_wear_sun_hat(state):
-            task_count += 1
-        if self.rake_in_lake(state):
-            task_count += 1
-        if self.picnic(state):
-            task_count += 1
-        
+    @task
+    def make_groundskeeper_hammer_thumb(self) -> Requirement:
         return (
-            self.has_npc(state, itemNames.NPC_GROUNDSKEEPER)
-            and self.has_prop(state, itemNames.PROP_MALLET)
-            and task_count >= 5
+            self.has_npc(itemNames.NPC_GROUNDSKEEPER)
+            & self.has_prop(itemNames.PROP_MALLET)
+            & at_least(5, *self.garden_tasks())
         )
     
     
     # ----- High Street Task Rule Defs -----
     
-    def break_broom(self, state: CollectionState) -> bool:
+    @task
+    def break_broom(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_npc(state, itemNames.NPC_MARKET_LADY)
-            and self.has_prop(state, itemNames.PROP_PUSH_BROOM)
+            self.has_high_street()
+            & self.has_npc(itemNames.NPC_MARKET_LADY)
+            & self.has_prop(itemNames.PROP_PUSH_BROOM)
         )
     
-    def trap_boy_in_phone_booth(self, state: CollectionState) -> bool:
+    @task
+    def trap_boy_in_phone_booth(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_npc(state, itemNames.NPC_BOY)
-            and self.has_npc(state, itemNames.NPC_TV_SHOP_OWNER)
-            and self.has_prop(state, itemNames.PROP_GARAGE_ROPE)
+            self.has_high_street()
+            & self.has_npc(itemNames.NPC_BOY)
+            & self.has_npc(itemNames.NPC_TV_SHOP_OWNER)
+            & self.has_prop(itemNames.PROP_GARAGE_ROPE)
         )
     
-    def make_boy_wear_wrong_glasses(self, state: CollectionState) -> bool:
+    @task
+    def make_boy_wear_wrong_glasses(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_npc(state, itemNames.NPC_BOY)
-            and (
-                self.has_prop(state, itemNames.PROP_HORN_RIMMED_GLASSES)
-                or self.has_prop(state, itemNames.PROP_RED_GLASSES) 
-                or self.has_prop(state, itemNames.PROP_SUNGLASSES)
+            self.has_high_street()
+            & self.has_npc(itemNames.NPC_BOY)
+            & (
+                self.has_prop(itemNames.PROP_HORN_RIMMED_GLASSES)
+                | self.has_prop(itemNames.PROP_RED_GLASSES) 
+                | self.has_prop(itemNames.PROP_SUNGLASSES)
             )
         )
     
-    def make_someone_buyback(self, state: CollectionState) -> bool:
+    @task
+    def make_someone_buyback(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_npc(state, itemNames.NPC_MARKET_LADY)
-            and (
-                self.has_npc(state, itemNames.NPC_BOY) and self.has_prop(state, itemNames.PROP_TOY_PLANE)
-                or self.has_garden(state) and self.has_npc(state, itemNames.NPC_GROUNDSKEEPER) and self.has_prop(state, itemNames.PROP_TROWEL)
+            self.has_high_street()
+            & self.has_npc(itemNames.NPC_MARKET_LADY)
+            & (
+                self.has_npc(itemNames.NPC_BOY) & self.has_prop(itemNames.PROP_TOY_PLANE)
+                | self.has_garden() & self.has_npc(itemNames.NPC_GROUNDSKEEPER) & self.has_prop(itemNames.PROP_TROWEL)
             )
         )
     
-    def get_on_tv(self, state: CollectionState) -> bool:
+    @task
+    def get_on_tv(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_npc(state, itemNames.NPC_TV_SHOP_OWNER)
-            and (
-                self.has_npc(state, itemNames.NPC_BOY)
-                or self.has_prop(state, itemNames.PROP_WALKIE_TALKIES)
+            self.has_high_street()
+            & self.has_npc(itemNames.NPC_TV_SHOP_OWNER)
+            & (
+                self.has_npc(itemNames.NPC_BOY)
+                | self.has_prop(itemNames.PROP_WALKIE_TALKIES)
             )
         )
     
-    def go_shopping(self, state: CollectionState) -> bool:
+    @task
+    def go_shopping(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_SHOPPING_BASKET)
-            and self.has_prop(state, itemNames.PROP_TOOTHRBRUSH)
-            and self.has_prop(state, itemNames.PROP_HAIRBRUSH)
-            and self.has_prop(state, itemNames.PROP_LOO_PAPER)
-            and self.has_prop(state, itemNames.PROP_TINNED_FOOD)
-            and (
-                self.has_prop(state, itemNames.PROP_DISH_SOAP_BOTTLE)
-                or self.has_prop(state, itemNames.PROP_SPRAY_BOTTLE)
+            self.has_high_street()
+            & self.has_prop(itemNames.PROP_SHOPPING_BASKET)
+            & self.has_prop(itemNames.PROP_TOOTHRBRUSH)
+            & self.has_prop(itemNames.PROP_HAIRBRUSH)
+            & self.has_prop(itemNames.PROP_LOO_PAPER)
+            & self.has_prop(itemNames.PROP_TINNED_FOOD)
+            & (
+                self.has_prop(itemNames.PROP_DISH_SOAP_BOTTLE)
+                | self.has_prop(itemNames.PROP_SPRAY_BOTTLE)
             )
-            and (
-                self.has_prop(state, itemNames.PROP_ORANGES)
-                or self.has_prop(state, itemNames.PROP_CUCUMBERS)
-                or self.has_prop(state, itemNames.PROP_LEEKS)
-                or self.has_prop(state, itemNames.PROP_CARROTS)
-                or self.has_prop(state, itemNames.PROP_TOMATOES)
+            & (
+                self.has_prop(itemNames.PROP_ORANGES)
+                | self.has_prop(itemNames.PROP_CUCUMBERS)
+                | self.has_prop(itemNames.PROP_LEEKS)
+                | self.has_prop(itemNames.PROP_CARROTS)
+                | self.has_prop(itemNames.PROP_TOMATOES)
                 # TO DO: Test if apple cores work
-                or self.has_garden(state) and self.has_prop(state, itemNames.PROP_APPLES)
+                | self.has_garden() & self.has_prop(itemNames.PROP_APPLES)
             )
         )
     
-    def trap_shopkeep_in_garage(self, state: CollectionState) -> bool:
-        task_count = 0
-        
-        if self.break_broom(state):
-            task_count += 1
-        if self.trap_boy_in_phone_booth(state):
-            task_count += 1
-        if self.make_boy_wear_wrong_glasses(state):
-            task_count += 1
-        if self.make_someone_buyback(state):
-            task_count += 1
-        if self.get_on_tv(state):
-            task_count += 1
-        if self.go_shopping(state):
-            task_count += 1
-        
+    @task
+    def trap_shopkeep_in_garage(self) -> Requirement:
         return (
-            self.has_npc(state, itemNames.NPC_MARKET_LADY)
-            and self.has_prop(state, itemNames.PROP_CHALK)
-            and self.has_prop(state, itemNames.PROP_GARAGE_ROPE)
-            and task_count >= 5
+            self.has_npc(itemNames.NPC_MARKET_LADY)
+            & self.has_prop(itemNames.PROP_CHALK)
+            & self.has_prop(itemNames.PROP_GARAGE_ROPE)
+            & at_least(5, *self.high_street_tasks())
         )
     
     
     # ----- Back Gardens Task Rule Defs -----
     
-    def make_someone_break_vase(self, state: CollectionState) -> bool:
+    @task
+    def make_someone_break_vase(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_npc(state, itemNames.NPC_TIDY_NEIGHBOUR)
-            and self.has_prop(state, itemNames.PROP_VASE)
-            and self.has_prop(state, itemNames.PROP_DRAWER)
+            self.has_back_gardens()
+            & self.has_npc(itemNames.NPC_TIDY_NEIGHBOUR)
+            & self.has_prop(itemNames.PROP_VASE)
+            & self.has_prop(itemNames.PROP_DRAWER)
         )
     
-    def make_man_spit_out_tea(self, state: CollectionState) -> bool:
+    @task
+    def make_man_spit_out_tea(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_npc(state, itemNames.NPC_TIDY_NEIGHBOUR)
-            and self.has_prop(state, itemNames.NPC_MESSY_NEIGHBOUR)
-            and self.has_prop(state, itemNames.PROP_TEA_CUP)
+            self.has_back_gardens()
+            & self.has_npc(itemNames.NPC_TIDY_NEIGHBOUR)
+            & self.has_prop(itemNames.NPC_MESSY_NEIGHBOUR)
+            & self.has_prop(itemNames.PROP_TEA_CUP)
         )
     
-    def get_dressed_up(self, state: CollectionState) -> bool:
+    @task
+    def get_dressed_up(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_npc(state, itemNames.NPC_MESSY_NEIGHBOUR)
-            and self.has_prop(state, itemNames.PROP_DUCK_STATUE)
-            and self.has_prop(state, itemNames.PROP_RIBBONS)
+            self.has_back_gardens()
+            & self.has_npc(itemNames.NPC_MESSY_NEIGHBOUR)
+            & self.has_prop(itemNames.PROP_DUCK_STATUE)
+            & self.has_prop(itemNames.PROP_RIBBONS)
         )
     
-    def make_man_barefoot(self, state: CollectionState) -> bool:
+    @task
+    def make_man_barefoot(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_npc(state, itemNames.NPC_TIDY_NEIGHBOUR)
+            self.has_back_gardens()
+            & self.has_npc(itemNames.NPC_TIDY_NEIGHBOUR)
         )
     
-    def do_washing(self, state: CollectionState) -> bool:
+    @task
+    def do_washing(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_npc(state, itemNames.NPC_TIDY_NEIGHBOUR)
-            and self.has_prop(state, itemNames.PROP_DRAWER)
-            and self.has_prop(state, itemNames.PROP_SOCKS)
-            and self.has_prop(state, itemNames.PROP_BRA)
-            and self.has_prop(state, itemNames.PROP_SOAP)
+            self.has_back_gardens()
+            & self.has_npc(itemNames.NPC_TIDY_NEIGHBOUR)
+            & self.has_prop(itemNames.PROP_DRAWER)
+            & self.has_prop(itemNames.PROP_SOCKS)
+            & self.has_prop(itemNames.PROP_BRA)
+            & self.has_prop(itemNames.PROP_SOAP)
         )
     
-    def dress_up_bust(self, state: CollectionState) -> bool:
+    @task
+    def dress_up_bust(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_npc(state, itemNames.NPC_MESSY_NEIGHBOUR)
-            and self.has_prop(state, itemNames.PROP_DRAWER)
-            and (
-                self.has_prop(state, itemNames.PROP_BUST_HAT)
-                or self.has_garden(state) and self.has_npc(state, itemNames.NPC_GROUNDSKEEPER)
-                or self.has_pub(state) and (
-                    self.has_prop(state, itemNames.PROP_TRAFFIC_CONE)
-                    or self.has_npc(state, itemNames.NPC_OLD_MAN)
+            self.has_back_gardens()
+            & self.has_npc(itemNames.NPC_MESSY_NEIGHBOUR)
+            & self.has_prop(itemNames.PROP_DRAWER)
+            & (
+                self.has_prop(itemNames.PROP_BUST_HAT)
+                | self.has_garden() & self.has_npc(itemNames.NPC_GROUNDSKEEPER)
+                | self.has_pub() & (
+                    self.has_prop(itemNames.PROP_TRAFFIC_CONE)
+                    | self.has_npc(itemNames.NPC_OLD_MAN)
                 )
             )
-            and (
-                self.has_prop(state, itemNames.PROP_BUST_GLASSES)
-                or self.has_high_street(state) and (
-                    self.has_prop(state, itemNames.PROP_HORN_RIMMED_GLASSES)
-                    or self.has_prop(state, itemNames.PROP_RED_GLASSES)
-                    or self.has_prop(state, itemNames.PROP_SUNGLASSES)
-                    or self.has_prop(state, itemNames.PROP_STEREOSCOPE)
-                    or self.has_npc(state, itemNames.NPC_BOY)
+            & (
+                self.has_prop(itemNames.PROP_BUST_GLASSES)
+                | self.has_high_street() & (
+                    self.has_prop(itemNames.PROP_HORN_RIMMED_GLASSES)
+                    | self.has_prop(itemNames.PROP_RED_GLASSES)
+                    | self.has_prop(itemNames.PROP_SUNGLASSES)
+                    | self.has_prop(itemNames.PROP_STEREOSCOPE)
+                    | self.has_npc(itemNames.NPC_BOY)
                 )
             )
-            and (
-                self.has_prop(state, itemNames.PROP_BUST_PIPE)
-                or self.has_prop(state, itemNames.PROP_DUMMY)
-                or self.has_garden(state) and self.has_prop(state, itemNames.PROP_TULIP)
-                or self.has_high_street(state) and (
-                    self.has_prop(state, itemNames.PROP_TOOTHRBRUSH)
-                    or self.has_prop(state, itemNames.PROP_LILY_FLOWER)
+            & (
+                self.has_prop(itemNames.PROP_BUST_PIPE)
+                | self.has_prop(itemNames.PROP_DUMMY)
+                | self.has_garden() & self.has_prop(itemNames.PROP_TULIP)
+                | self.has_high_street() & (
+                    self.has_prop(itemNames.PROP_TOOTHRBRUSH)
+                    | self.has_prop(itemNames.PROP_LILY_FLOWER)
                 )
-                or self.has_pub(state) and (
-                    self.has_prop(state, itemNames.PROP_KNIVES)
-                    or self.has_prop(state, itemNames.PROP_FORKS)
-                    or self.has_prop(state, itemNames.PROP_HARMONICA)
-                    or self.has_npc(state, itemNames.NPC_FANCY_LADIES) and self.has_prop(state, itemNames.PROP_FLOWER_FOR_VASE)
+                | self.has_pub() & (
+                    self.has_prop(itemNames.PROP_KNIVES)
+                    | self.has_prop(itemNames.PROP_FORKS)
+                    | self.has_prop(itemNames.PROP_HARMONICA)
+                    | self.has_npc(itemNames.NPC_FANCY_LADIES) & self.has_prop(itemNames.PROP_FLOWER_FOR_VASE)
                 )
-                or self.has_model_village(state) and self.has_prop(state, itemNames.PROP_POPPY_FLOWER)
-                or ( # Rose from completing all other Back Gardens tasks
-                    self.make_someone_break_vase(state)
-                    and self.make_man_spit_out_tea(state)
-                    and self.get_dressed_up(state)
-                    and self.make_man_barefoot(state)
-                    and self.do_washing(state)
-                    and self.has_prop(state, itemNames.PROP_ROSE)
-                    and self.has_prop(state, itemNames.PROP_ROSE_BOX)
-                    and self.has_prop(state, itemNames.PROP_CLIPPERS)
-                    and self.has_prop(state, itemNames.PROP_NO_GOOSE_SIGN_CLEAN)
+                | self.has_model_village() & self.has_prop(itemNames.PROP_POPPY_FLOWER)
+                | ( # Rose from completing all other Back Gardens tasks
+                    self.make_someone_break_vase()
+                    & self.make_man_spit_out_tea()
+                    & self.get_dressed_up()
+                    & self.make_man_barefoot()
+                    & self.do_washing()
+                    & self.has_prop(itemNames.PROP_ROSE)
+                    & self.has_prop(itemNames.PROP_ROSE_BOX)
+                    & self.has_prop(itemNames.PROP_CLIPPERS)
+                    & self.has_prop(itemNames.PROP_NO_GOOSE_SIGN_CLEAN)
                 )
             )
         )
     
-    def make_someone_prune_rose(self, state: CollectionState) -> bool:
-        task_count = 0
-        
-        if self.make_someone_break_vase(state):
-            task_count += 1
-        if self.make_man_spit_out_tea(state):
-            task_count += 1
-        if self.get_dressed_up(state):
-            task_count += 1
-        if self.make_man_barefoot(state):
-            task_count += 1
-        if self.do_washing(state):
-            task_count += 1
-        if self.dress_up_bust(state):
-            task_count += 1
-        
+    @task
+    def make_someone_prune_rose(self) -> Requirement:
         return (
-            self.has_npc(state, itemNames.NPC_TIDY_NEIGHBOUR)
-            and self.has_npc(state, itemNames.NPC_MESSY_NEIGHBOUR)
-            and self.has_prop(state, itemNames.PROP_DRAWER)
-            and self.has_prop(state, itemNames.PROP_ROSE)
-            and self.has_prop(state, itemNames.PROP_ROSE_BOX)
-            and self.has_prop(state, itemNames.PROP_CLIPPERS)
-            and self.has_prop(state, itemNames.PROP_NO_GOOSE_SIGN_CLEAN)
-            and task_count >= 5
+            self.has_npc(itemNames.NPC_TIDY_NEIGHBOUR)
+            & self.has_npc(itemNames.NPC_MESSY_NEIGHBOUR)
+            & self.has_prop(itemNames.PROP_DRAWER)
+            & self.has_prop(itemNames.PROP_ROSE)
+            & self.has_prop(itemNames.PROP_ROSE_BOX)
+            & self.has_prop(itemNames.PROP_CLIPPERS)
+            & self.has_prop(itemNames.PROP_NO_GOOSE_SIGN_CLEAN)
+            & at_least(5, *self.back_gardens_tasks())
         )
     
     
     # ----- Pub Task Rule Defs -----
     
-    def get_into_pub(self, state: CollectionState) -> bool:
-        return self.has_pub(state)
+    @task
+    def get_into_pub(self) -> Requirement:
+        return self.has_pub()
     
-    def break_dartboard(self, state: CollectionState) -> bool:
+    @task
+    def break_dartboard(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_npc(state, itemNames.NPC_OLD_MAN)
-            and self.has_prop(state, itemNames.PROP_DARTBOARD)
+            self.has_pub()
+            & self.has_npc(itemNames.NPC_OLD_MAN)
+            & self.has_prop(itemNames.PROP_DARTBOARD)
         )
     
-    def get_toy_boat(self, state: CollectionState) -> bool:
+    @task
+    def get_toy_boat(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_prop(state, itemNames.PROP_TOY_BOAT)
+            self.has_pub()
+            & self.has_prop(itemNames.PROP_TOY_BOAT)
         )
     
-    def make_old_man_fall_on_bum(self, state: CollectionState) -> bool:
+    @task
+    def make_old_man_fall_on_bum(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_npc(state, itemNames.NPC_OLD_MAN)
-            and self.has_prop(state, itemNames.PROP_PORTABLE_STOOL)
-            and (
-                self.has_prop(state, itemNames.PROP_DARTBOARD)
-                or self.has_prop(state, itemNames.PROP_GREEN_QUOITS)
-                or self.has_prop(state, itemNames.PROP_RED_QUOITS)
+            self.has_pub()
+            & self.has_npc(itemNames.NPC_OLD_MAN)
+            & self.has_prop(itemNames.PROP_PORTABLE_STOOL)
+            & (
+                self.has_prop(itemNames.PROP_DARTBOARD)
+                | self.has_prop(itemNames.PROP_GREEN_QUOITS)
+                | self.has_prop(itemNames.PROP_RED_QUOITS)
             )
         )
     
-    def be_awarded_flower(self, state: CollectionState) -> bool:
+    @task
+    def be_awarded_flower(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_npc(state, itemNames.NPC_FANCY_LADIES)
-            and self.has_prop(state, itemNames.PROP_FLOWER_FOR_VASE)
+            self.has_pub()
+            & self.has_npc(itemNames.NPC_FANCY_LADIES)
+            & self.has_prop(itemNames.PROP_FLOWER_FOR_VASE)
         )
     
-    def drop_pint_glass_in_canal(self, state: CollectionState) -> bool:
+    @task
+    def drop_pint_glass_in_canal(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_prop(state, itemNames.PROP_PINT_GLASSES)
+            self.has_pub()
+            & self.has_prop(itemNames.PROP_PINT_GLASSES)
         )
     
-    def set_table(self, state: CollectionState) -> bool:
+    @task
+    def set_table(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_prop(state, itemNames.PROP_PLATES)
-            and self.has_prop(state, itemNames.PROP_FORKS)
-            and self.has_prop(state, itemNames.PROP_KNIVES)
-            and self.has_prop(state, itemNames.PROP_PEPPER_GRINDER)
-            and self.has_prop(state, itemNames.PROP_CANDLESTICK)
+            self.has_pub()
+            & self.has_prop(itemNames.PROP_PLATES)
+            & self.has_prop(itemNames.PROP_FORKS)
+            & self.has_prop(itemNames.PROP_KNIVES)
+            & self.has_prop(itemNames.PROP_PEPPER_GRINDER)
+            & self.has_prop(itemNames.PROP_CANDLESTICK)
         )
     
-    def drop_bucket_on_burly_man(self, state: CollectionState) -> bool:
-        task_count = 0
-        
-        if self.get_into_pub(state):
-            task_count += 1
-        if self.break_dartboard(state):
-            task_count += 1
-        if self.get_toy_boat(state):
-            task_count += 1
-        if self.make_old_man_fall_on_bum(state):
-            task_count += 1
-        if self.be_awarded_flower(state):
-            task_count += 1
-        if self.drop_pint_glass_in_canal(state):
-            task_count += 1
-        if self.set_table(state):
-            task_count += 1
-        
+    @task
+    def drop_bucket_on_burly_man(self) -> Requirement:
         return (
-            self.has_npc(state, itemNames.NPC_BURLY_MAN)
-            and self.has_npc(state, itemNames.NPC_PUB_LADY)
-            and self.has_prop(state, itemNames.PROP_BUCKET)
-            and self.has_prop(state, itemNames.PROP_TOMATOES)
-            and self.has_prop(state, itemNames.PROP_NO_GOOSE_SIGN_PUB)
-            and task_count >= 6
+            self.has_npc(itemNames.NPC_BURLY_MAN)
+            & self.has_npc(itemNames.NPC_PUB_LADY)
+            & self.has_prop(itemNames.PROP_BUCKET)
+            & self.has_prop(itemNames.PROP_TOMATOES)
+            & self.has_prop(itemNames.PROP_NO_GOOSE_SIGN_PUB)
+            & at_least(6, *self.pub_tasks())
         )
     
     
     # ----- To Do (As Well) Task Rule Defs -----
     
-    def lock_groundskeeper_out(self, state: CollectionState) -> bool:
+    @task
+    def lock_groundskeeper_out(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_npc(state, itemNames.NPC_GROUNDSKEEPER)
+            self.has_garden()
+            & self.has_npc(itemNames.NPC_GROUNDSKEEPER)
         )
     
-    def cabbage_picnic(self, state: CollectionState) -> bool:
+    @task
+    def cabbage_picnic(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_prop(state, itemNames.PROP_CABBAGES)
+            self.has_garden()
+            & self.has_prop(itemNames.PROP_CABBAGES)
         )
     
-    def trip_boy_in_puddle(self, state: CollectionState) -> bool:
+    @task
+    def trip_boy_in_puddle(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_npc(state, itemNames.NPC_BOY)
+            self.has_high_street()
+            & self.has_npc(itemNames.NPC_BOY)
         )
     
-    def make_scales_ding(self, state: CollectionState) -> bool:
-        if not self.has_high_street(state):
-            return False
-        
-        # Any of these provides enough items to complete the task alone
-        if self.has_prop(state, itemNames.PROP_CARROTS):
-            return True
-        if self.has_prop(state, itemNames.PROP_TOMATOES):
-            return True
-        if self.has_prop(state, itemNames.PROP_ORANGES):
-            return True
-        if self.has_prop(state, itemNames.PROP_LEEKS):
-            return True
-        if self.has_prop(state, itemNames.PROP_CUCUMBERS):
-            return True
-        if self.has_prop(state, itemNames.PROP_TINNED_FOOD):
-            return True
-        if self.has_pub(state) and self.has_prop(state, itemNames.PROP_GREEN_QUOITS):
-            return True
-        if self.has_pub(state) and self.has_prop(state, itemNames.PROP_RED_QUOITS):
-            return True
-        if self.has_pub(state) and self.has_prop(state, itemNames.PROP_PLATES):
-            return True
-        if self.has_pub(state) and self.has_prop(state, itemNames.PROP_DARTBOARD):
-            return True
-        if self.has_pub(state) and self.has_model_village(state) and self.has_prop(state, itemNames.PROP_MINI_PEOPLE):
-            return True
-        if self.has_prop(state, itemNames.PROP_PINT_BOTTLES):
-            return True # Two in High Street, one in the hub near the dummy
-            
-        item_count = 0
-        
-        # High Street items (1 each)
-        if self.has_prop(state, itemNames.PROP_TOOTHRBRUSH):
-            item_count += 1
-        if self.has_prop(state, itemNames.PROP_HAIRBRUSH):
-            item_count += 1
-        if self.has_prop(state, itemNames.PROP_LOO_PAPER):
-            item_count += 1
-        if self.has_prop(state, itemNames.PROP_DISH_SOAP_BOTTLE):
-            item_count += 1
-        if self.has_prop(state, itemNames.PROP_SPRAY_BOTTLE):
-            item_count += 1
-        if self.has_prop(state, itemNames.PROP_TOY_CAR):
-            item_count += 1
-        if self.has_prop(state, itemNames.PROP_HORN_RIMMED_GLASSES):
-            item_count += 1
-        if self.has_prop(state, itemNames.PROP_RED_GLASSES):
-            item_count += 1
-        if self.has_prop(state, itemNames.PROP_SUNGLASSES):
-            item_count += 1
-        if self.has_npc(state, itemNames.NPC_BOY):
-            item_count += 1
-        if self.has_prop(state, itemNames.PROP_TOY_PLANE):
-            item_count += 1
-        if self.has_prop(state, itemNames.PROP_LILY_FLOWER):
-            item_count += 1
-        if self.has_prop(state, itemNames.PROP_STEREOSCOPE):
-            item_count += 1
-        if self.has_prop(state, itemNames.PROP_DUSTBIN_LID):
-            item_count += 1
-        
-        # High Street items (2 each)
-        if self.has_prop(state, itemNames.PROP_APPLE_CORES):
-            item_count += 2
-        if self.has_prop(state, itemNames.PROP_WALKIE_TALKIES):
-            item_count += 2
-        if self.has_prop(state, itemNames.PROP_WEED_TOOLS):
-            item_count += 2
-        
-        # Hub items (1 each)
-        if self.has_prop(state, itemNames.PROP_TENNIS_BALL):
-            item_count += 1
-        if self.has_prop(state, itemNames.PROP_DUMMY):
-            item_count += 1
-        if self.has_prop(state, itemNames.PROP_FISHING_BOBBER):
-            item_count += 1
-        if self.has_prop(state, itemNames.PROP_DRINK_CAN):
-            item_count += 1
-        if self.has_prop(state, itemNames.PROP_RIBBONS):
-            item_count += 1
-        
-        # Hub items (2 each)
-        if self.has_prop(state, itemNames.PROP_BOOTS):
-            item_count += 2
-        
-        if self.has_garden(state):
-            # Garden items (1 each)
-            if self.has_prop(state, itemNames.PROP_JAM):
-                item_count += 1
-            if self.has_prop(state, itemNames.PROP_TULIP):
-                item_count += 1
-            if self.has_prop(state, itemNames.PROP_PICNIC_MUG):
-                item_count += 1
-            if self.has_prop(state, itemNames.PROP_THERMOS):
-                item_count += 1
-            if self.has_prop(state, itemNames.PROP_TROWEL):
-                item_count += 1
-            if self.has_prop(state, itemNames.PROP_RADIO):
-                item_count += 1
-                
-            # Garden items (2 each)
-            if self.has_prop(state, itemNames.PROP_APPLES):
-                item_count += 2
-            if self.has_prop(state, itemNames.PROP_SANDWICH):
-                item_count += 2
-        
-        if self.has_back_gardens(state):
-            # Back Garden front items (1 each)
-            if self.has_prop(state, itemNames.PROP_TEA_CUP):
-                item_count += 1
-            if self.has_prop(state, itemNames.PROP_CRICKET_BALL):
-                item_count += 1
-            if self.has_prop(state, itemNames.PROP_BUST_PIPE):
-                item_count += 1
-            if self.has_prop(state, itemNames.PROP_BUST_HAT):
-                item_count += 1
-            if self.has_prop(state, itemNames.PROP_BUST_GLASSES):
-                item_count += 1
-            if self.has_prop(state, itemNames.PROP_NEWSPAPER):
-                item_count += 1
-                
-            # Back Garden back items (mostly 1 each)
-            if self.has_prop(state, itemNames.PROP_DRAWER):
-                if self.has_prop(state, itemNames.PROP_SOAP):
-                    item_count += 1
-                if self.has_prop(state, itemNames.PROP_POT_STACK):
-                    item_count += 1
-                if self.has_prop(state, itemNames.PROP_PAINTBRUSH):
-                    item_count += 1
-                if self.has_prop(state, itemNames.PROP_BRA):
-                    item_count += 1
-                    
-                if self.has_prop(state, itemNames.PROP_SOCKS):
-                    item_count += 2
-        
-        if self.has_pub(state):
-            # Pub items (1 each)
-            if self.has_prop(state, itemNames.PROP_CORK):
-                item_count += 1
-            if self.has_prop(state, itemNames.PROP_LETTER):
-                item_count += 1
-            if self.has_prop(state, itemNames.PROP_CANDLESTICK):
-                item_count += 1
-            if self.has_prop(state, itemNames.PROP_HARMONICA):
-                item_count += 1
-            if self.has_prop(state, itemNames.PROP_TOY_BOAT):
-                item_count += 1
-            if self.has_prop(state, itemNames.PROP_PEPPER_GRINDER):
-                item_count += 1
-                
-            # Pub items (2 each)
-            if self.has_prop(state, itemNames.PROP_KNIVES):
-                item_count += 2
-            if self.has_prop(state, itemNames.PROP_FORKS):
-                item_count += 2
-                
-            if self.has_model_village(state):
-                if self.has_prop(state, itemNames.PROP_MINI_GOOSE):
-                    item_count += 1
-                if self.has_prop(state, itemNames.PROP_MINI_MAIL_PILLAR):
-                    item_count += 1
-                if self.has_prop(state, itemNames.PROP_MINI_PHONE_DOOR):
-                    item_count += 1
-                if self.has_prop(state, itemNames.PROP_MINI_SHOVEL):
-                    item_count += 1
-                if self.has_prop(state, itemNames.PROP_POPPY_FLOWER):
-                    item_count += 1
-                if self.has_prop(state, itemNames.PROP_TIMBER_HANDLE):
-                    item_count += 1
-        
-        return item_count >= 3
+    @task
+    def make_scales_ding(self) -> Requirement:
+        return (
+            self.has_high_street()
+            & self.weighted_items(SCALES_THRESHOLD, SCALES_ITEMS)
+        )
     
-    def open_umbrella_on_tv(self, state: CollectionState) -> bool:
+    @task
+    def open_umbrella_on_tv(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_npc(state, itemNames.NPC_TV_SHOP_OWNER)
-            and self.has_npc(state, itemNames.NPC_MARKET_LADY)
-            and self.has_prop(state, itemNames.PROP_UMBRELLAS)
-            and (
-                self.has_npc(state, itemNames.NPC_BOY)
-                or self.has_prop(state, itemNames.PROP_WALKIE_TALKIES)
+            self.has_high_street()
+            & self.has_npc(itemNames.NPC_TV_SHOP_OWNER)
+            & self.has_npc(itemNames.NPC_MARKET_LADY)
+            & self.has_prop(itemNames.PROP_UMBRELLAS)
+            & (
+                self.has_npc(itemNames.NPC_BOY)
+                | self.has_prop(itemNames.PROP_WALKIE_TALKIES)
             )
         )
     
-    def make_groundskeeper_buyback(self, state: CollectionState) -> bool:
+    @task
+    def make_groundskeeper_buyback(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_high_street(state)
-            and self.has_npc(state, itemNames.NPC_GROUNDSKEEPER)
-            and self.has_npc(state, itemNames.NPC_MARKET_LADY)
-            and self.has_prop(state, itemNames.PROP_TROWEL)
+            self.has_garden()
+            & self.has_high_street()
+            & self.has_npc(itemNames.NPC_GROUNDSKEEPER)
+            & self.has_npc(itemNames.NPC_MARKET_LADY)
+            & self.has_prop(itemNames.PROP_TROWEL)
         )
     
-    def collect_five_flowers(self, state: CollectionState) -> bool:
+    @task
+    def collect_five_flowers(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_high_street(state)
-            and self.has_pub(state)
-            and self.has_model_village(state)
-            and self.has_npc(state, itemNames.NPC_FANCY_LADIES)
-            and self.has_prop(state, itemNames.PROP_TULIP)
-            and self.has_prop(state, itemNames.PROP_LILY_FLOWER)
-            and self.has_prop(state, itemNames.PROP_FLOWER_FOR_VASE)
-            and self.has_prop(state, itemNames.PROP_POPPY_FLOWER)
-            and self.make_someone_prune_rose(state)
+            self.has_garden()
+            & self.has_high_street()
+            & self.has_pub()
+            & self.has_model_village()
+            & self.has_npc(itemNames.NPC_FANCY_LADIES)
+            & self.weighted_items(len(FIVE_FLOWERS_ITEMS), FIVE_FLOWERS_ITEMS)
+            & self.make_someone_prune_rose()
         )
     
-    def trap_boy_in_garage(self, state: CollectionState) -> bool:
-        return self.trap_shopkeep_in_garage(state)
+    @task
+    def trap_boy_in_garage(self) -> Requirement:
+        return self.trap_shopkeep_in_garage()
     
-    def catch_thrown_object(self, state: CollectionState) -> bool:
+    @task
+    def catch_thrown_object(self) -> Requirement:
         return ( # Tracking any prop souls here is unnecessary as it can be done with the Fence Bolt from the starting area
-            self.has_back_gardens(state)
-            and self.has_npc(state, itemNames.NPC_TIDY_NEIGHBOUR)
-            and self.has_prop(state, itemNames.PROP_DRAWER)
+            self.has_back_gardens()
+            & self.has_npc(itemNames.NPC_TIDY_NEIGHBOUR)
+            & self.has_prop(itemNames.PROP_DRAWER)
         )
     
-    def get_thrown_over_fence(self, state: CollectionState) -> bool:
+    @task
+    def get_thrown_over_fence(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_pub(state)
-            and self.has_npc(state, itemNames.NPC_TIDY_NEIGHBOUR)
-            and self.has_prop(state, itemNames.PROP_DRAWER)
-            and self.has_prop(state, itemNames.PROP_STEALTH_BOX)
+            self.has_back_gardens()
+            & self.has_pub()
+            & self.has_npc(itemNames.NPC_TIDY_NEIGHBOUR)
+            & self.has_prop(itemNames.PROP_DRAWER)
+            & self.has_prop(itemNames.PROP_STEALTH_BOX)
         )
     
-    def dress_up_bust_outside_items(self, state: CollectionState) -> bool:
+    @task
+    def dress_up_bust_outside_items(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_npc(state, itemNames.NPC_MESSY_NEIGHBOUR)
-            and self.has_prop(state, itemNames.PROP_DRAWER)
-            and (
-                self.has_garden(state) and self.has_npc(state, itemNames.NPC_GROUNDSKEEPER)
-                or self.has_pub(state) and (
-                    self.has_prop(state, itemNames.PROP_TRAFFIC_CONE)
-                    or self.has_npc(state, itemNames.NPC_OLD_MAN)
+            self.has_back_gardens()
+            & self.has_npc(itemNames.NPC_MESSY_NEIGHBOUR)
+            & self.has_prop(itemNames.PROP_DRAWER)
+            & (
+                self.has_garden() & self.has_npc(itemNames.NPC_GROUNDSKEEPER)
+                | self.has_pub() & (
+                    self.has_prop(itemNames.PROP_TRAFFIC_CONE)
+                    | self.has_npc(itemNames.NPC_OLD_MAN)
                 )
             )
-            and self.has_high_street(state) and (
-                self.has_prop(state, itemNames.PROP_HORN_RIMMED_GLASSES)
-                or self.has_prop(state, itemNames.PROP_RED_GLASSES)
-                or self.has_prop(state, itemNames.PROP_SUNGLASSES)
-                or self.has_prop(state, itemNames.PROP_STEREOSCOPE)
-                or self.has_npc(state, itemNames.NPC_BOY)
+            & self.has_high_street() & (
+                self.has_prop(itemNames.PROP_HORN_RIMMED_GLASSES)
+                | self.has_prop(itemNames.PROP_RED_GLASSES)
+                | self.has_prop(itemNames.PROP_SUNGLASSES)
+                | self.has_prop(itemNames.PROP_STEREOSCOPE)
+                | self.has_npc(itemNames.NPC_BOY)
             )
-            and (
-                self.has_prop(state, itemNames.PROP_DUMMY)
-                or self.has_garden(state) and self.has_prop(state, itemNames.PROP_TULIP)
-                or self.has_high_street(state) and (
-                    self.has_prop(state, itemNames.PROP_TOOTHRBRUSH)
-                    or self.has_prop(state, itemNames.PROP_LILY_FLOWER)
+            & (
+                self.has_prop(itemNames.PROP_DUMMY)
+                | self.has_garden() & self.has_prop(itemNames.PROP_TULIP)
+                | self.has_high_street() & (
+                    self.has_prop(itemNames.PROP_TOOTHRBRUSH)
+                    | self.has_prop(itemNames.PROP_LILY_FLOWER)
                 )
-                or self.has_pub(state) and (
-                    self.has_prop(state, itemNames.PROP_KNIVES)
-                    or self.has_prop(state, itemNames.PROP_FORKS)
-                    or self.has_prop(state, itemNames.PROP_HARMONICA)
-                    or self.has_npc(state, itemNames.NPC_FANCY_LADIES) and self.has_prop(state, itemNames.PROP_FLOWER_FOR_VASE)
+                | self.has_pub() & (
+                    self.has_prop(itemNames.PROP_KNIVES)
+                    | self.has_prop(itemNames.PROP_FORKS)
+                    | self.has_prop(itemNames.PROP_HARMONICA)
+                    | self.has_npc(itemNames.NPC_FANCY_LADIES) & self.has_prop(itemNames.PROP_FLOWER_FOR_VASE)
                 )
-                or self.has_model_village(state) and self.has_prop(state, itemNames.PROP_POPPY_FLOWER)
+                | self.has_model_village() & self.has_prop(itemNames.PROP_POPPY_FLOWER)
             )
         )
     
-    def score_goal(self, state: CollectionState) -> bool:
+    @task
+    def score_goal(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.make_someone_prune_rose(state)
-            and self.has_prop(state, itemNames.PROP_FOOTBALL)
-            and self.has_prop(state, itemNames.PROP_NO_GOOSE_SIGN_MESSY)
+            self.has_high_street()
+            & self.make_someone_prune_rose()
+            & self.has_prop(itemNames.PROP_FOOTBALL)
+            & self.has_prop(itemNames.PROP_NO_GOOSE_SIGN_MESSY)
         )
     
-    def sail_boat_under_bridge(self, state: CollectionState) -> bool:
+    @task
+    def sail_boat_under_bridge(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_prop(state, itemNames.PROP_TOY_BOAT)
+            self.has_pub()
+            & self.has_prop(itemNames.PROP_TOY_BOAT)
         )
     
-    def perform_with_ribbon(self, state: CollectionState) -> bool:
+    @task
+    def perform_with_ribbon(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_back_gardens(state)
-            and self.has_npc(state, itemNames.NPC_FANCY_LADIES)
-            and self.has_npc(state, itemNames.NPC_MESSY_NEIGHBOUR)
-            and self.has_prop(state, itemNames.PROP_DUCK_STATUE)
-            and self.has_prop(state, itemNames.PROP_RIBBONS)
-            and self.has_prop(state, itemNames.PROP_DRAWER)
+            self.has_pub()
+            & self.has_back_gardens()
+            & self.has_npc(itemNames.NPC_FANCY_LADIES)
+            & self.has_npc(itemNames.NPC_MESSY_NEIGHBOUR)
+            & self.has_prop(itemNames.PROP_DUCK_STATUE)
+            & self.has_prop(itemNames.PROP_RIBBONS)
+            & self.has_prop(itemNames.PROP_DRAWER)
         )
     
-    def steal_woolen_hat(self, state: CollectionState) -> bool:
-        return self.make_old_man_fall_on_bum(state)
+    @task
+    def steal_woolen_hat(self) -> Requirement:
+        return self.make_old_man_fall_on_bum()
     
     
     # ----- To Do (Quickly!!) Task Rule Defs -----
     
-    def speedrun_garden(self, state: CollectionState) -> bool:
+    @task
+    def speedrun_garden(self) -> Requirement:
         return (
-            self.get_into_garden(state)
-            and self.get_groundskeeper_wet(state)
-            and self.steal_groundskeepers_keys(state)
-            and self.make_groundskeeper_wear_sun_hat(state)
-            and self.rake_in_lake(state)
-            and self.picnic(state)
-            and self.make_groundskeeper_hammer_thumb(state)
+            self.get_into_garden()
+            & self.get_groundskeeper_wet()
+            & self.steal_groundskeepers_keys()
+            & self.make_groundskeeper_wear_sun_hat()
+            & self.rake_in_lake()
+            & self.picnic()
+            & self.make_groundskeeper_hammer_thumb()
         )
     
-    def speedrun_high_street(self, state: CollectionState) -> bool:
+    @task
+    def speedrun_high_street(self) -> Requirement:
         return (
-            self.break_broom(state)
-            and self.trap_boy_in_phone_booth(state)
-            and self.make_boy_wear_wrong_glasses(state)
-            and self.make_someone_buyback(state)
-            and self.get_on_tv(state)
-            and self.go_shopping(state)
-            and self.trap_shopkeep_in_garage(state)
+            self.break_broom()
+            & self.trap_boy_in_phone_booth()
+            & self.make_boy_wear_wrong_glasses()
+            & self.make_someone_buyback()
+            & self.get_on_tv()
+            & self.go_shopping()
+            & self.trap_shopkeep_in_garage()
         )
     
-    def speedrun_back_gardens(self, state: CollectionState) -> bool:
+    @task
+    def speedrun_back_gardens(self) -> Requirement:
         return (
-            self.make_someone_break_vase(state)
-            and self.dress_up_bust(state)
-            and self.make_man_spit_out_tea(state)
-            and self.get_dressed_up(state)
-            and self.make_man_barefoot(state)
-            and self.do_washing(state)
-            and self.make_someone_prune_rose(state)
+            self.make_someone_break_vase()
+            & self.dress_up_bust()
+            & self.make_man_spit_out_tea()
+            & self.get_dressed_up()
+            & self.make_man_barefoot()
+            & self.do_washing()
+            & self.make_someone_prune_rose()
         )
     
-    def speedrun_pub(self, state: CollectionState) -> bool:
+    @task
+    def speedrun_pub(self) -> Requirement:
         return (
-            self.get_into_pub(state)
-            and self.break_dartboard(state)
-            and self.get_toy_boat(state)
-            and self.make_old_man_fall_on_bum(state)
-            and self.be_awarded_flower(state)
-            and self.drop_pint_glass_in_canal(state)
-            and self.set_table(state)
-            and self.drop_bucket_on_burly_man(state)
+            self.get_into_pub()
+            & self.break_dartboard()
+            & self.get_toy_boat()
+            & self.make_old_man_fall_on_bum()
+            & self.be_awarded_flower()
+            & self.drop_pint_glass_in_canal()
+            & self.set_table()
+            & self.drop_bucket_on_burly_man()
         )
     
     
     # ----- Milestone & Goal Defs -----
     
-    def all_garden_tasks(self, state: CollectionState) -> bool:
+    @task
+    def all_garden_tasks(self) -> Requirement:
         return (
-            self.get_into_garden(state)
-            and self.get_groundskeeper_wet(state)
-            and self.steal_groundskeepers_keys(state)
-            and self.make_groundskeeper_wear_sun_hat(state)
-            and self.rake_in_lake(state)
-            and self.picnic(state)
-            and self.make_groundskeeper_hammer_thumb(state)
+            self.get_into_garden()
+            & self.get_groundskeeper_wet()
+            & self.steal_groundskeepers_keys()
+            & self.make_groundskeeper_wear_sun_hat()
+            & self.rake_in_lake()
+            & self.picnic()
+            & self.make_groundskeeper_hammer_thumb()
         )
     
-    def all_high_street_tasks(self, state: CollectionState) -> bool:
+    @task
+    def all_high_street_tasks(self) -> Requirement:
         return (
-            self.break_broom(state)
-            and self.trap_boy_in_phone_booth(state)
-            and self.make_boy_wear_wrong_glasses(state)
-            and self.make_someone_buyback(state)
-            and self.get_on_tv(state)
-            and self.go_shopping(state)
-            and self.trap_shopkeep_in_garage(state)
+            self.break_broom()
+            & self.trap_boy_in_phone_booth()
+            & self.make_boy_wear_wrong_glasses()
+            & self.make_someone_buyback()
+            & self.get_on_tv()
+            & self.go_shopping()
+            & self.trap_shopkeep_in_garage()
         )
     
-    def all_back_gardens_tasks(self, state: CollectionState) -> bool:
+    @task
+    def all_back_gardens_tasks(self) -> Requirement:
         return (
-            self.make_someone_break_vase(state)
-            and self.make_man_spit_out_tea(state)
-            and self.get_dressed_up(state)
-            and self.make_man_barefoot(state)
-            and self.do_washing(state)
-            and self.dress_up_bust(state)
-            and self.make_someone_prune_rose(state)
+            self.make_someone_break_vase()
+            & self.make_man_spit_out_tea()
+            & self.get_dressed_up()
+            & self.make_man_barefoot()
+            & self.do_washing()
+            & self.dress_up_bust()
+            & self.make_someone_prune_rose()
         )
     
-    def all_pub_tasks(self, state: CollectionState) -> bool:
+    @task
+    def all_pub_tasks(self) -> Requirement:
         return (
-            self.get_into_pub(state)
-            and self.break_dartboard(state)
-            and self.get_toy_boat(state)
-            and self.make_old_man_fall_on_bum(state)
-            and self.be_awarded_flower(state)
-            and self.drop_pint_glass_in_canal(state)
-            and self.set_table(state)
-            and self.drop_bucket_on_burly_man(state)
+            self.get_into_pub()
+            & self.break_dartboard()
+            & self.get_toy_boat()
+            & self.make_old_man_fall_on_bum()
+            & self.be_awarded_flower()
+            & self.drop_pint_glass_in_canal()
+            & self.set_table()
+            & self.drop_bucket_on_burly_man()
         )
     
-    def all_main_task_lists(self, state: CollectionState) -> bool:
+    @task
+    def all_main_task_lists(self) -> Requirement:
         return (
-            self.all_garden_tasks(state)
-            and self.all_high_street_tasks(state)
-            and self.all_back_gardens_tasks(state)
-            and self.all_pub_tasks(state)
+            self.all_garden_tasks()
+            & self.all_high_street_tasks()
+            & self.all_back_gardens_tasks()
+            & self.all_pub_tasks()
         )
     
-    def all_to_do_as_well_tasks(self, state: CollectionState) -> bool:
+    @task
+    def all_to_do_as_well_tasks(self) -> Requirement:
         return (
-            self.lock_groundskeeper_out(state)
-            and self.cabbage_picnic(state)
-            and self.trip_boy_in_puddle(state)
-            and self.make_scales_ding(state)
-            and self.open_umbrella_on_tv(state)
-            and self.make_groundskeeper_buyback(state)
-            and self.collect_five_flowers(state)
-            and self.trap_boy_in_garage(state)
-            and self.catch_thrown_object(state)
-            and self.get_thrown_over_fence(state)
-            and self.dress_up_bust_outside_items(state)
-            and self.score_goal(state)
-            and self.sail_boat_under_bridge(state)
-            and self.perform_with_ribbon(state)
-            and self.steal_woolen_hat(state)
+            self.lock_groundskeeper_out()
+            & self.cabbage_picnic()
+            & self.trip_boy_in_puddle()
+            & self.make_scales_ding()
+            & self.open_umbrella_on_tv()
+            & self.make_groundskeeper_buyback()
+            & self.collect_five_flowers()
+            & self.trap_boy_in_garage()
+            & self.catch_thrown_object()
+            & self.get_thrown_over_fence()
+            & self.dress_up_bust_outside_items()
+            & self.score_goal()
+            & self.sail_boat_under_bridge()
+            & self.perform_with_ribbon()
+            & self.steal_woolen_hat()
         )
     
-    def all_speedrun_tasks(self, state: CollectionState) -> bool:
+    @task
+    def all_speedrun_tasks(self) -> Requirement:
         return (
-            self.speedrun_garden(state)
-            and self.speedrun_high_street(state)
-            and self.speedrun_back_gardens(state)
-            and self.speedrun_pub(state)
+            self.speedrun_garden()
+            & self.speedrun_high_street()
+            & self.speedrun_back_gardens()
+            & self.speedrun_pub()
         )
     
-    def all_tasks_complete(self, state: CollectionState) -> bool:
+    @task
+    def all_tasks_complete(self) -> Requirement:
         return (
-            self.all_main_task_lists(state)
-            and self.all_to_do_as_well_tasks(state)
-            and self.all_speedrun_tasks(state)
+            self.all_main_task_lists()
+            & self.all_to_do_as_well_tasks()
+            & self.all_speedrun_tasks()
         )
     
-    def all_non_speedrun_tasks(self, state: CollectionState) -> bool:
+    @task
+    def all_non_speedrun_tasks(self) -> Requirement:
         return (
-            self.all_main_task_lists(state)
-            and self.all_to_do_as_well_tasks(state)
+            self.all_main_task_lists()
+            & self.all_to_do_as_well_tasks()
         )
     
-    def four_final_tasks(self, state: CollectionState) -> bool:
+    @task
+    def four_final_tasks(self) -> Requirement:
         return (
-            self.make_groundskeeper_hammer_thumb(state)
-            and self.trap_shopkeep_in_garage(state)
-            and self.make_someone_prune_rose(state)
-            and self.drop_bucket_on_burly_man(state)
+            self.make_groundskeeper_hammer_thumb()
+            & self.trap_shopkeep_in_garage()
+            & self.make_someone_prune_rose()
+            & self.drop_bucket_on_burly_man()
         )
     
     
     # ----- Model Village Defs -----
     
-    def get_into_model_village(self, state: CollectionState) -> bool:
-        return self.has_model_village(state)
+    @task
+    def get_into_model_village(self) -> Requirement:
+        return self.has_model_village()
     
-    def steal_bell(self, state: CollectionState) -> bool:
+    @task
+    def steal_bell(self) -> Requirement:
         if self.world.options.logically_require_npc_souls.value:
             return (
-                self.has_garden(state)
-                and self.has_high_street(state)
-                and self.has_back_gardens(state)
-                and self.has_pub(state)
-                and self.has_model_village(state)
-                and self.has_prop(state, itemNames.PROP_TIMBER_HANDLE)
-                and state.has(itemNames.PROP_GOLDEN_BELL, self.player)
-                and self.has_npc(state, itemNames.NPC_GROUNDSKEEPER)
-                and self.has_npc(state, itemNames.NPC_BOY)
-                and self.has_npc(state, itemNames.NPC_TV_SHOP_OWNER)
-                and self.has_npc(state, itemNames.NPC_MARKET_LADY)
-                and self.has_npc(state, itemNames.NPC_TIDY_NEIGHBOUR)
-                and self.has_npc(state, itemNames.NPC_MESSY_NEIGHBOUR)
-                and self.has_npc(state, itemNames.NPC_BURLY_MAN)
-                and self.has_npc(state, itemNames.NPC_OLD_MAN)
-                and self.has_npc(state, itemNames.NPC_PUB_LADY)
-                and self.has_npc(state, itemNames.NPC_FANCY_LADIES)
-                and self.has_npc(state, itemNames.NPC_COOK)
+                self.has_garden()
+                & self.has_high_street()
+                & self.has_back_gardens()
+                & self.has_pub()
+                & self.has_model_village()
+                & self.has_prop(itemNames.PROP_TIMBER_HANDLE)
+                & Has(itemNames.PROP_GOLDEN_BELL)
+                & self.has_npc(itemNames.NPC_GROUNDSKEEPER)
+                & self.has_npc(itemNames.NPC_BOY)
+                & self.has_npc(itemNames.NPC_TV_SHOP_OWNER)
+                & self.has_npc(itemNames.NPC_MARKET_LADY)
+                & self.has_npc(itemNames.NPC_TIDY_NEIGHBOUR)
+                & self.has_npc(itemNames.NPC_MESSY_NEIGHBOUR)
+                & self.has_npc(itemNames.NPC_BURLY_MAN)
+                & self.has_npc(itemNames.NPC_OLD_MAN)
+                & self.has_npc(itemNames.NPC_PUB_LADY)
+                & self.has_npc(itemNames.NPC_FANCY_LADIES)
+                & self.has_npc(itemNames.NPC_COOK)
             )
 
         return (
-            self.has_garden(state)
-            and self.has_high_street(state)
-            and self.has_back_gardens(state)
-            and self.has_pub(state)
-            and self.has_model_village(state)
-            and self.has_prop(state, itemNames.PROP_TIMBER_HANDLE)
-            and state.has(itemNames.PROP_GOLDEN_BELL, self.player)
+            self.has_garden()
+            & self.has_high_street()
+            & self.has_back_gardens()
+            & self.has_pub()
+            & self.has_model_village()
+            & self.has_prop(itemNames.PROP_TIMBER_HANDLE)
+            & Has(itemNames.PROP_GOLDEN_BELL)
         )
     
     
     # ----- Hub Item Pickup Defs -----
     
-    def pickup_drink_can(self, state: CollectionState) -> bool:
-        return self.has_prop(state, itemNames.PROP_DRINK_CAN)
+    def pickup_drink_can(self) -> Requirement:
+        return self.has_prop(itemNames.PROP_DRINK_CAN)
     
-    def pickup_tennis_ball(self, state: CollectionState) -> bool:
-        return self.has_prop(state, itemNames.PROP_TENNIS_BALL)
+    def pickup_tennis_ball(self) -> Requirement:
+        return self.has_prop(itemNames.PROP_TENNIS_BALL)
     
-    def pickup_blue_bow(self, state: CollectionState) -> bool:
-        return self.has_prop(state, itemNames.PROP_RIBBONS)
+    def pickup_blue_bow(self) -> Requirement:
+        return self.has_prop(itemNames.PROP_RIBBONS)
     
-    def pickup_dummy(self, state: CollectionState) -> bool:
-        return self.has_prop(state, itemNames.PROP_DUMMY)
+    def pickup_dummy(self) -> Requirement:
+        return self.has_prop(itemNames.PROP_DUMMY)
     
-    def pickup_fishing_bobber(self, state: CollectionState) -> bool:
-        return self.has_prop(state, itemNames.PROP_FISHING_BOBBER)
+    def pickup_fishing_bobber(self) -> Requirement:
+        return self.has_prop(itemNames.PROP_FISHING_BOBBER)
     
-    def pickup_boots(self, state: CollectionState) -> bool:
-        return self.has_prop(state, itemNames.PROP_BOOTS)
+    def pickup_boots(self) -> Requirement:
+        return self.has_prop(itemNames.PROP_BOOTS)
     
     
     # ----- Garden Item Pickup Defs -----
     
-    def pickup_radio(self, state: CollectionState) -> bool:
+    def pickup_radio(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_prop(state, itemNames.PROP_RADIO)
+            self.has_garden()
+            & self.has_prop(itemNames.PROP_RADIO)
         )
     
-    def pickup_trowel(self, state: CollectionState) -> bool:
+    def pickup_trowel(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_prop(state, itemNames.PROP_TROWEL)
+            self.has_garden()
+            & self.has_prop(itemNames.PROP_TROWEL)
         )
     
-    def pickup_keys(self, state: CollectionState) -> bool:
+    def pickup_keys(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_npc(state, itemNames.NPC_GROUNDSKEEPER)
+            self.has_garden()
+            & self.has_npc(itemNames.NPC_GROUNDSKEEPER)
         )
     
-    def pickup_grounsdkeepers_hat(self, state: CollectionState) -> bool:
+    def pickup_grounsdkeepers_hat(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_npc(state, itemNames.NPC_GROUNDSKEEPER)
-            and
+            self.has_garden()
+            & self.has_npc(itemNames.NPC_GROUNDSKEEPER)
+            &
             (
-                self.has_prop(state, itemNames.PROP_TULIP)
-                or self.rake_in_lake(state)
-                and self.picnic(state)
-                and self.has_prop(state, itemNames.PROP_MALLET)
+                self.has_prop(itemNames.PROP_TULIP)
+                | self.rake_in_lake()
+                & self.picnic()
+                & self.has_prop(itemNames.PROP_MALLET)
             )
         )
     
-    def pickup_tulip(self, state: CollectionState) -> bool:
+    def pickup_tulip(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_prop(state, itemNames.PROP_TULIP)
+            self.has_garden()
+            & self.has_prop(itemNames.PROP_TULIP)
         )
     
-    def pickup_apples(self, state: CollectionState) -> bool:
+    def pickup_apples(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_prop(state, itemNames.PROP_APPLES)
+            self.has_garden()
+            & self.has_prop(itemNames.PROP_APPLES)
         )
     
-    def pickup_jam(self, state: CollectionState) -> bool:
+    def pickup_jam(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_prop(state, itemNames.PROP_JAM)
+            self.has_garden()
+            & self.has_prop(itemNames.PROP_JAM)
         )
     
-    def pickup_picnic_mug(self, state: CollectionState) -> bool:
+    def pickup_picnic_mug(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_prop(state, itemNames.PROP_PICNIC_MUG)
+            self.has_garden()
+            & self.has_prop(itemNames.PROP_PICNIC_MUG)
         )
     
-    def pickup_thermos(self, state: CollectionState) -> bool:
+    def pickup_thermos(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_prop(state, itemNames.PROP_THERMOS)
+            self.has_garden()
+            & self.has_prop(itemNames.PROP_THERMOS)
         )
     
-    def pickup_sandwich(self, state: CollectionState) -> bool:
+    def pickup_sandwich(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_prop(state, itemNames.PROP_SANDWICH)
+            self.has_garden()
+            & self.has_prop(itemNames.PROP_SANDWICH)
         )
     
-    def pickup_straw_hat(self, state: CollectionState) -> bool:
+    def pickup_straw_hat(self) -> Requirement:
         return (
-            self.pickup_grounsdkeepers_hat(state)
-            and self.has_prop(state, itemNames.PROP_STRAW_HAT)
+            self.pickup_grounsdkeepers_hat()
+            & self.has_prop(itemNames.PROP_STRAW_HAT)
         )
     
-    def pickup_garden_carrots(self, state: CollectionState) -> bool:
+    def pickup_garden_carrots(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_prop(state, itemNames.PROP_CARROTS)
+            self.has_garden()
+            & self.has_prop(itemNames.PROP_CARROTS)
         )
     
     
     # ----- High Street Item Pickup Defs -----
     
-    def pickup_boys_glasses(self, state: CollectionState) -> bool:
+    def pickup_boys_glasses(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_npc(state, itemNames.NPC_BOY)
+            self.has_high_street()
+            & self.has_npc(itemNames.NPC_BOY)
         )
     
-    def pickup_horn_rimmed_glasses(self, state: CollectionState) -> bool:
+    def pickup_horn_rimmed_glasses(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_HORN_RIMMED_GLASSES)
+            self.has_high_street()
+            & self.has_prop(itemNames.PROP_HORN_RIMMED_GLASSES)
         )
     
-    def pickup_red_glasses(self, state: CollectionState) -> bool:
+    def pickup_red_glasses(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_RED_GLASSES)
+            self.has_high_street()
+            & self.has_prop(itemNames.PROP_RED_GLASSES)
         )
     
-    def pickup_sunglasses(self, state: CollectionState) -> bool:
+    def pickup_sunglasses(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_SUNGLASSES)
+            self.has_high_street()
+            & self.has_prop(itemNames.PROP_SUNGLASSES)
         )
     
-    def pickup_loo_paper(self, state: CollectionState) -> bool:
+    def pickup_loo_paper(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_LOO_PAPER)
+            self.has_high_street()
+            & self.has_prop(itemNames.PROP_LOO_PAPER)
         )
     
-    def pickup_toy_car(self, state: CollectionState) -> bool:
+    def pickup_toy_car(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_TOY_CAR)
+            self.has_high_street()
+            & self.has_prop(itemNames.PROP_TOY_CAR)
         )
     
-    def pickup_hairbrush(self, state: CollectionState) -> bool:
+    def pickup_hairbrush(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_HAIRBRUSH)
+            self.has_high_street()
+            & self.has_prop(itemNames.PROP_HAIRBRUSH)
         )
     
-    def pickup_toothbrush(self, state: CollectionState) -> bool:
+    def pickup_toothbrush(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_TOOTHRBRUSH)
+            self.has_high_street()
+            & self.has_prop(itemNames.PROP_TOOTHRBRUSH)
         )
     
-    def pickup_stereoscope(self, state: CollectionState) -> bool:
+    def pickup_stereoscope(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_STEREOSCOPE)
+            self.has_high_street()
+            & self.has_prop(itemNames.PROP_STEREOSCOPE)
         )
     
-    def pickup_dish_soap_bottle(self, state: CollectionState) -> bool:
+    def pickup_dish_soap_bottle(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_DISH_SOAP_BOTTLE)
+            self.has_high_street()
+            & self.has_prop(itemNames.PROP_DISH_SOAP_BOTTLE)
         )
     
-    def pickup_food_cans(self, state: CollectionState) -> bool:
+    def pickup_food_cans(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_TINNED_FOOD)
+            self.has_high_street()
+            & self.has_prop(itemNames.PROP_TINNED_FOOD)
         )
     
-    def pickup_weed_tools(self, state: CollectionState) -> bool:
+    def pickup_weed_tools(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_WEED_TOOLS)
+            self.has_high_street()
+            & self.has_prop(itemNames.PROP_WEED_TOOLS)
         )
     
-    def pickup_lily_flower(self, state: CollectionState) -> bool:
+    def pickup_lily_flower(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_LILY_FLOWER)
+            self.has_high_street()
+            & self.has_prop(itemNames.PROP_LILY_FLOWER)
         )
     
-    def pickup_oranges(self, state: CollectionState) -> bool:
+    def pickup_oranges(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_ORANGES)
+            self.has_high_street()
+            & self.has_prop(itemNames.PROP_ORANGES)
         )
     
-    def pickup_tomatoes_high_street(self, state: CollectionState) -> bool:
+    def pickup_tomatoes_high_street(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_TOMATOES)
+            self.has_high_street()
+            & self.has_prop(itemNames.PROP_TOMATOES)
         )
     
-    def pickup_carrots_high_street(self, state: CollectionState) -> bool:
+    def pickup_carrots_high_street(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_CARROTS)
+            self.has_high_street()
+            & self.has_prop(itemNames.PROP_CARROTS)
         )
     
-    def pickup_cucumbers(self, state: CollectionState) -> bool:
+    def pickup_cucumbers(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_CUCUMBERS)
+            self.has_high_street()
+            & self.has_prop(itemNames.PROP_CUCUMBERS)
         )
     
-    def pickup_leeks(self, state: CollectionState) -> bool:
+    def pickup_leeks(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_LEEKS)
+            self.has_high_street()
+            & self.has_prop(itemNames.PROP_LEEKS)
         )
     
-    def pickup_fusilage(self, state: CollectionState) -> bool:
+    def pickup_fusilage(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_TOY_PLANE)
+            self.has_high_street()
+            & self.has_prop(itemNames.PROP_TOY_PLANE)
         )
     
-    def pickup_pint_bottle_hub(self, state: CollectionState) -> bool:
-        return self.has_prop(state, itemNames.PROP_PINT_BOTTLES)
+    def pickup_pint_bottle_hub(self) -> Requirement:
+        return self.has_prop(itemNames.PROP_PINT_BOTTLES)
     
-    def pickup_pint_bottle_high_street(self, state: CollectionState) -> bool:
+    def pickup_pint_bottle_high_street(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_PINT_BOTTLES)
+            self.has_high_street()
+            & self.has_prop(itemNames.PROP_PINT_BOTTLES)
         )
     
-    def pickup_spray_bottle(self, state: CollectionState) -> bool:
+    def pickup_spray_bottle(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_SPRAY_BOTTLE)
+            self.has_high_street()
+            & self.has_prop(itemNames.PROP_SPRAY_BOTTLE)
         )
     
-    def pickup_walkie_talkies(self, state: CollectionState) -> bool:
+    def pickup_walkie_talkies(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_WALKIE_TALKIES)
+            self.has_high_street()
+            & self.has_prop(itemNames.PROP_WALKIE_TALKIES)
         )
     
-    def pickup_apple_cores(self, state: CollectionState) -> bool:
+    def pickup_apple_cores(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_APPLE_CORES)
+            self.has_high_street()
+            & self.has_prop(itemNames.PROP_APPLE_CORES)
         )
     
-    def pickup_dustbin_lid(self, state: CollectionState) -> bool:
+    def pickup_dustbin_lid(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_DUSTBIN_LID)
+            self.has_high_street()
+            & self.has_prop(itemNames.PROP_DUSTBIN_LID)
         )
     
-    def pickup_chalk(self, state: CollectionState) -> bool:
-        return self.trap_shopkeep_in_garage(state)
+    def pickup_chalk(self) -> Requirement:
+        return self.trap_shopkeep_in_garage()
     
     
     # ----- Back Gardens Item Pickup Defs -----
     
-    def pickup_red_bow(self, state: CollectionState) -> bool:
-        return self.get_dressed_up(state)
+    def pickup_red_bow(self) -> Requirement:
+        return self.get_dressed_up()
     
-    def pickup_cricket_ball(self, state: CollectionState) -> bool:
+    def pickup_cricket_ball(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_prop(state, itemNames.PROP_CRICKET_BALL)
+            self.has_back_gardens()
+            & self.has_prop(itemNames.PROP_CRICKET_BALL)
         )
     
-    def pickup_bust_pipe(self, state: CollectionState) -> bool:
+    def pickup_bust_pipe(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_prop(state, itemNames.PROP_BUST_PIPE)
+            self.has_back_gardens()
+            & self.has_prop(itemNames.PROP_BUST_PIPE)
         )
     
-    def pickup_bust_hat(self, state: CollectionState) -> bool:
+    def pickup_bust_hat(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_prop(state, itemNames.PROP_BUST_HAT)
+            self.has_back_gardens()
+            & self.has_prop(itemNames.PROP_BUST_HAT)
         )
     
-    def pickup_bust_glasses(self, state: CollectionState) -> bool:
+    def pickup_bust_glasses(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_prop(state, itemNames.PROP_BUST_GLASSES)
+            self.has_back_gardens()
+            & self.has_prop(itemNames.PROP_BUST_GLASSES)
         )
     
-    def pickup_slippers(self, state: CollectionState) -> bool:
+    def pickup_slippers(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_npc(state, itemNames.NPC_TIDY_NEIGHBOUR)
+            self.has_back_gardens()
+            & self.has_npc(itemNames.NPC_TIDY_NEIGHBOUR)
         )
     
-    def pickup_tea_cup(self, state: CollectionState) -> bool:
+    def pickup_tea_cup(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_prop(state, itemNames.PROP_TEA_CUP)
+            self.has_back_gardens()
+            & self.has_prop(itemNames.PROP_TEA_CUP)
         )
     
-    def pickup_newspaper(self, state: CollectionState) -> bool:
+    def pickup_newspaper(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_prop(state, itemNames.PROP_NEWSPAPER)
+            self.has_back_gardens()
+            & self.has_prop(itemNames.PROP_NEWSPAPER)
         )
     
-    def pickup_socks(self, state: CollectionState) -> bool:
+    def pickup_socks(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_prop(state, itemNames.PROP_SOCKS)
-            and self.has_prop(state, itemNames.PROP_DRAWER)
+            self.has_back_gardens()
+            & self.has_prop(itemNames.PROP_SOCKS)
+            & self.has_prop(itemNames.PROP_DRAWER)
         )
     
-    def pickup_vase(self, state: CollectionState) -> bool:
+    def pickup_vase(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_prop(state, itemNames.PROP_VASE)
-            and self.has_prop(state, itemNames.PROP_DRAWER)
+            self.has_back_gardens()
+            & self.has_prop(itemNames.PROP_VASE)
+            & self.has_prop(itemNames.PROP_DRAWER)
         )
     
-    def pickup_pot_stack(self, state: CollectionState) -> bool:
+    def pickup_pot_stack(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_prop(state, itemNames.PROP_POT_STACK)
-            and self.has_prop(state, itemNames.PROP_DRAWER)
+            self.has_back_gardens()
+            & self.has_prop(itemNames.PROP_POT_STACK)
+            & self.has_prop(itemNames.PROP_DRAWER)
         )
     
-    def pickup_soap(self, state: CollectionState) -> bool:
+    def pickup_soap(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_prop(state, itemNames.PROP_SOAP)
-            and self.has_prop(state, itemNames.PROP_DRAWER)
+            self.has_back_gardens()
+            & self.has_prop(itemNames.PROP_SOAP)
+            & self.has_prop(itemNames.PROP_DRAWER)
         )
     
-    def pickup_paintbrush(self, state: CollectionState) -> bool:
+    def pickup_paintbrush(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_prop(state, itemNames.PROP_PAINTBRUSH)
-            and self.has_prop(state, itemNames.PROP_DRAWER)
+            self.has_back_gardens()
+            & self.has_prop(itemNames.PROP_PAINTBRUSH)
+            & self.has_prop(itemNames.PROP_DRAWER)
         )
     
-    def pickup_vase_pieces(self, state: CollectionState) -> bool:
+    def pickup_vase_pieces(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_npc(state, itemNames.NPC_TIDY_NEIGHBOUR)
-            and self.has_prop(state, itemNames.PROP_VASE)
-            and self.has_prop(state, itemNames.PROP_DRAWER)
+            self.has_back_gardens()
+            & self.has_npc(itemNames.NPC_TIDY_NEIGHBOUR)
+            & self.has_prop(itemNames.PROP_VASE)
+            & self.has_prop(itemNames.PROP_DRAWER)
         )
     
-    def pickup_bra(self, state: CollectionState) -> bool:
+    def pickup_bra(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_prop(state, itemNames.PROP_BRA)
-            and self.has_prop(state, itemNames.PROP_DRAWER)
+            self.has_back_gardens()
+            & self.has_prop(itemNames.PROP_BRA)
+            & self.has_prop(itemNames.PROP_DRAWER)
         )
     
-    def pickup_badminton_racket(self, state: CollectionState) -> bool:
+    def pickup_badminton_racket(self) -> Requirement:
         return (
-            self.has_prop(state, itemNames.PROP_BADMINTON_RACKET)
-            and self.has_prop(state, itemNames.PROP_NO_GOOSE_SIGN_MESSY)
-            and self.make_someone_prune_rose(state)
+            self.has_prop(itemNames.PROP_BADMINTON_RACKET)
+            & self.has_prop(itemNames.PROP_NO_GOOSE_SIGN_MESSY)
+            & self.make_someone_prune_rose()
         )
     
-    def pickup_rose(self, state: CollectionState) -> bool:
-        return self.make_someone_prune_rose(state)
+    def pickup_rose(self) -> Requirement:
+        return self.make_someone_prune_rose()
     
     
     # ----- Pub Item Pickup Defs -----
     
-    def pickup_exit_letter(self, state: CollectionState) -> bool:
+    def pickup_exit_letter(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_prop(state, itemNames.PROP_LETTER)
+            self.has_pub()
+            & self.has_prop(itemNames.PROP_LETTER)
         )
     
-    def pickup_plates(self, state: CollectionState) -> bool:
+    def pickup_plates(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_prop(state, itemNames.PROP_PLATES)
+            self.has_pub()
+            & self.has_prop(itemNames.PROP_PLATES)
         )
     
-    def pickup_green_quoits(self, state: CollectionState) -> bool:
+    def pickup_green_quoits(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_prop(state, itemNames.PROP_GREEN_QUOITS)
+            self.has_pub()
+            & self.has_prop(itemNames.PROP_GREEN_QUOITS)
         )
     
-    def pickup_red_quoits(self, state: CollectionState) -> bool:
+    def pickup_red_quoits(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_prop(state, itemNames.PROP_RED_QUOITS)
+            self.has_pub()
+            & self.has_prop(itemNames.PROP_RED_QUOITS)
         )
     
-    def pickup_forks(self, state: CollectionState) -> bool:
+    def pickup_forks(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_prop(state, itemNames.PROP_FORKS)
+            self.has_pub()
+            & self.has_prop(itemNames.PROP_FORKS)
         )
     
-    def pickup_knives(self, state: CollectionState) -> bool:
+    def pickup_knives(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_prop(state, itemNames.PROP_KNIVES)
+            self.has_pub()
+            & self.has_prop(itemNames.PROP_KNIVES)
         )
     
-    def pickup_cork(self, state: CollectionState) -> bool:
+    def pickup_cork(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_prop(state, itemNames.PROP_CORK)
+            self.has_pub()
+            & self.has_prop(itemNames.PROP_CORK)
         )
     
-    def pickup_candlestick(self, state: CollectionState) -> bool:
+    def pickup_candlestick(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_prop(state, itemNames.PROP_CANDLESTICK)
+            self.has_pub()
+            & self.has_prop(itemNames.PROP_CANDLESTICK)
         )
     
-    def pickup_vase_flower(self, state: CollectionState) -> bool:
+    def pickup_vase_flower(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_npc(state, itemNames.NPC_FANCY_LADIES)
-            and self.has_prop(state, itemNames.PROP_FLOWER_FOR_VASE)
+            self.has_pub()
+            & self.has_npc(itemNames.NPC_FANCY_LADIES)
+            & self.has_prop(itemNames.PROP_FLOWER_FOR_VASE)
         )
     
-    def pickup_darts(self, state: CollectionState) -> bool:
+    def pickup_darts(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_npc(state, itemNames.NPC_OLD_MAN)
-            and self.has_prop(state, itemNames.PROP_DARTBOARD)
+            self.has_pub()
+            & self.has_npc(itemNames.NPC_OLD_MAN)
+            & self.has_prop(itemNames.PROP_DARTBOARD)
         )
     
-    def pickup_harmonica(self, state: CollectionState) -> bool:
+    def pickup_harmonica(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_prop(state, itemNames.PROP_HARMONICA)
+            self.has_pub()
+            & self.has_prop(itemNames.PROP_HARMONICA)
         )
     
-    def pickup_pint_glass(self, state: CollectionState) -> bool:
+    def pickup_pint_glass(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_prop(state, itemNames.PROP_PINT_GLASSES)
+            self.has_pub()
+            & self.has_prop(itemNames.PROP_PINT_GLASSES)
         )
     
-    def pickup_toy_boat(self, state: CollectionState) -> bool:
+    def pickup_toy_boat(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_prop(state, itemNames.PROP_TOY_BOAT)
+            self.has_pub()
+            & self.has_prop(itemNames.PROP_TOY_BOAT)
         )
     
-    def pickup_woolen_hat(self, state: CollectionState) -> bool:
-        return self.make_old_man_fall_on_bum(state)
+    def pickup_woolen_hat(self) -> Requirement:
+        return self.make_old_man_fall_on_bum()
     
-    def pickup_pepper_grinder(self, state: CollectionState) -> bool:
+    def pickup_pepper_grinder(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_prop(state, itemNames.PROP_PEPPER_GRINDER)
+            self.has_pub()
+            & self.has_prop(itemNames.PROP_PEPPER_GRINDER)
         )
     
-    def pickup_pub_woman_cloth(self, state: CollectionState) -> bool:
+    def pickup_pub_woman_cloth(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_npc(state, itemNames.NPC_PUB_LADY)
+            self.has_pub()
+            & self.has_npc(itemNames.NPC_PUB_LADY)
         )
     
-    def pickup_pub_open_tomatoes(self, state: CollectionState) -> bool:
+    def pickup_pub_open_tomatoes(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_prop(state, itemNames.PROP_TOMATOES)
+            self.has_pub()
+            & self.has_prop(itemNames.PROP_TOMATOES)
         )
     
-    def pickup_pub_boxed_tomatoes(self, state: CollectionState) -> bool:
-        task_count = 0
-        
-        if self.get_into_pub(state):
-            task_count += 1
-        if self.break_dartboard(state):
-            task_count += 1
-        if self.get_toy_boat(state):
-            task_count += 1
-        if self.make_old_man_fall_on_bum(state):
-            task_count += 1
-        if self.be_awarded_flower(state):
-            task_count += 1
-        if self.drop_pint_glass_in_canal(state):
-            task_count += 1
-        if self.set_table(state):
-            task_count += 1
-        
+    def pickup_pub_boxed_tomatoes(self) -> Requirement:
         return (
-            self.has_npc(state, itemNames.NPC_PUB_LADY)
-            and self.has_prop(state, itemNames.PROP_NO_GOOSE_SIGN_PUB)
-            and self.has_prop(state, itemNames.PROP_TOMATOES)
-            and task_count >= 6
+            self.has_npc(itemNames.NPC_PUB_LADY)
+            & self.has_prop(itemNames.PROP_NO_GOOSE_SIGN_PUB)
+            & self.has_prop(itemNames.PROP_TOMATOES)
+            & at_least(6, *self.pub_tasks())
         )
     
     
     # ----- Model Village Item Pickup Defs -----
     
-    def pickup_people_miniatures(self, state: CollectionState) -> bool:
+    def pickup_people_miniatures(self) -> Requirement:
         return (
-            self.has_model_village(state)
-            and self.has_prop(state, itemNames.PROP_MINI_PEOPLE)
+            self.has_model_village()
+            & self.has_prop(itemNames.PROP_MINI_PEOPLE)
         )
     
-    def pickup_mini_shovel(self, state: CollectionState) -> bool:
+    def pickup_mini_shovel(self) -> Requirement:
         return (
-            self.has_model_village(state)
-            and self.has_prop(state, itemNames.PROP_MINI_SHOVEL)
+            self.has_model_village()
+            & self.has_prop(itemNames.PROP_MINI_SHOVEL)
         )
     
-    def pickup_mini_goose(self, state: CollectionState) -> bool:
+    def pickup_mini_goose(self) -> Requirement:
         return (
-            self.has_model_village(state)
-            and self.has_prop(state, itemNames.PROP_MINI_GOOSE)
+            self.has_model_village()
+            & self.has_prop(itemNames.PROP_MINI_GOOSE)
         )
     
-    def pickup_poppy(self, state: CollectionState) -> bool:
+    def pickup_poppy(self) -> Requirement:
         return (
-            self.has_model_village(state)
-            and self.has_prop(state, itemNames.PROP_POPPY_FLOWER)
+            self.has_model_village()
+            & self.has_prop(itemNames.PROP_POPPY_FLOWER)
         )
     
-    def pickup_mini_phone_booth(self, state: CollectionState) -> bool:
+    def pickup_mini_phone_booth(self) -> Requirement:
         return (
-            self.has_model_village(state)
-            and self.has_prop(state, itemNames.PROP_MINI_PHONE_DOOR)
+            self.has_model_village()
+            & self.has_prop(itemNames.PROP_MINI_PHONE_DOOR)
         )
     
-    def pickup_mini_mail_pillar(self, state: CollectionState) -> bool:
+    def pickup_mini_mail_pillar(self) -> Requirement:
         return (
-            self.has_model_village(state)
-            and self.has_prop(state, itemNames.PROP_MINI_MAIL_PILLAR)
+            self.has_model_village()
+            & self.has_prop(itemNames.PROP_MINI_MAIL_PILLAR)
         )
     
-    def pickup_timber_handle(self, state: CollectionState) -> bool:
+    def pickup_timber_handle(self) -> Requirement:
         return (
-            self.has_model_village(state)
-            and self.has_prop(state, itemNames.PROP_TIMBER_HANDLE)
+            self.has_model_village()
+            & self.has_prop(itemNames.PROP_TIMBER_HANDLE)
         )
     
-    def pickup_golden_bell(self, state: CollectionState) -> bool:
-        return self.steal_bell(state)
+    def pickup_golden_bell(self) -> Requirement:
+        return self.steal_bell()
     
     
     # ----- Hub Item Drag Defs -----
     
-    def drag_fence_bolt(self, state: CollectionState) -> bool:
-        return True
+    def drag_fence_bolt(self) -> Requirement:
+        return ALWAYS
     
-    def drag_tackle_box(self, state: CollectionState) -> bool:
-        return self.has_prop(state, itemNames.PROP_TACKLE_BOX)
+    def drag_tackle_box(self) -> Requirement:
+        return self.has_prop(itemNames.PROP_TACKLE_BOX)
     
     
     # ----- Garden Item Drag Defs -----
     
-    def drag_rake(self, state: CollectionState) -> bool:
+    def drag_rake(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_prop(state, itemNames.PROP_RAKE)
+            self.has_garden()
+            & self.has_prop(itemNames.PROP_RAKE)
         )
     
-    def drag_picnic_basket(self, state: CollectionState) -> bool:
+    def drag_picnic_basket(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_prop(state, itemNames.PROP_PICNIC_BASKET)
+            self.has_garden()
+            & self.has_prop(itemNames.PROP_PICNIC_BASKET)
         )
     
-    def drag_esky(self, state: CollectionState) -> bool:
+    def drag_esky(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_prop(state, itemNames.PROP_ESKY)
+            self.has_garden()
+            & self.has_prop(itemNames.PROP_ESKY)
         )
     
-    def drag_shovel(self, state: CollectionState) -> bool:
+    def drag_shovel(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_prop(state, itemNames.PROP_SHOVEL)
+            self.has_garden()
+            & self.has_prop(itemNames.PROP_SHOVEL)
         )
     
-    def drag_pumpkins(self, state: CollectionState) -> bool:
+    def drag_pumpkins(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_prop(state, itemNames.PROP_PUMPKINS)
+            self.has_garden()
+            & self.has_prop(itemNames.PROP_PUMPKINS)
         )
     
-    def drag_watering_can(self, state: CollectionState) -> bool:
+    def drag_watering_can(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_prop(state, itemNames.PROP_WATERING_CAN)
+            self.has_garden()
+            & self.has_prop(itemNames.PROP_WATERING_CAN)
         )
     
-    def drag_gumboots(self, state: CollectionState) -> bool:
+    def drag_gumboots(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_prop(state, itemNames.PROP_GUMBOOTS)
+            self.has_garden()
+            & self.has_prop(itemNames.PROP_GUMBOOTS)
         )
     
-    def drag_gardener_sign(self, state: CollectionState) -> bool:
-        task_count = 0
-        
-        if self.get_into_garden(state):
-            task_count += 1
-        if self.get_groundskeeper_wet(state):
-            task_count += 1
-        if self.steal_groundskeepers_keys(state):
-            task_count += 1
-        if self.make_groundskeeper_wear_sun_hat(state):
-            task_count += 1
-        if self.rake_in_lake(state):
-            task_count += 1
-        if self.picnic(state):
-            task_count += 1
-        
+    def drag_gardener_sign(self) -> Requirement:
         return (
-            self.has_npc(state, itemNames.NPC_GROUNDSKEEPER)
-            and task_count >= 5
+            self.has_npc(itemNames.NPC_GROUNDSKEEPER)
+            & at_least(5, *self.garden_tasks())
         )
     
-    def drag_wooden_crate(self, state: CollectionState) -> bool:
+    def drag_wooden_crate(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_prop(state, itemNames.PROP_WOODEN_CRATE)
+            self.has_garden()
+            & self.has_prop(itemNames.PROP_WOODEN_CRATE)
         )
     
-    def drag_mallet(self, state: CollectionState) -> bool:
-        return self.make_groundskeeper_hammer_thumb(state)
+    def drag_mallet(self) -> Requirement:
+        return self.make_groundskeeper_hammer_thumb()
     
-    def drag_topsoil_bags(self, state: CollectionState) -> bool:
+    def drag_topsoil_bags(self) -> Requirement:
         return (
-            self.has_garden(state)
-            and self.has_prop(state, itemNames.PROP_TOPSOIL_BAGS)
+            self.has_garden()
+            & self.has_prop(itemNames.PROP_TOPSOIL_BAGS)
         )
     
     
     # ----- High Street Item Drag Defs -----
     
-    def drag_shopping_basket(self, state: CollectionState) -> bool:
+    def drag_shopping_basket(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_SHOPPING_BASKET)
+            self.has_high_street()
+            & self.has_prop(itemNames.PROP_SHOPPING_BASKET)
         )
     
-    def drag_umbrellas(self, state: CollectionState) -> bool:
+    def drag_umbrellas(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_npc(state, itemNames.NPC_MARKET_LADY)
-            and self.has_prop(state, itemNames.PROP_UMBRELLAS)
+            self.has_high_street()
+            & self.has_npc(itemNames.NPC_MARKET_LADY)
+            & self.has_prop(itemNames.PROP_UMBRELLAS)
         )
     
-    def drag_push_broom(self, state: CollectionState) -> bool:
+    def drag_push_broom(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_PUSH_BROOM)
+            self.has_high_street()
+            & self.has_prop(itemNames.PROP_PUSH_BROOM)
         )
     
-    def drag_broom_head(self, state: CollectionState) -> bool:
-        return self.break_broom(state)
+    def drag_broom_head(self) -> Requirement:
+        return self.break_broom()
     
-    def drag_dustbin(self, state: CollectionState) -> bool:
+    def drag_dustbin(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_DUSTBIN)
+            self.has_high_street()
+            & self.has_prop(itemNames.PROP_DUSTBIN)
         )
     
-    def drag_baby_doll(self, state: CollectionState) -> bool:
+    def drag_baby_doll(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_BABY_DOLL)
+            self.has_high_street()
+            & self.has_prop(itemNames.PROP_BABY_DOLL)
         )
     
-    def drag_pricing_gun(self, state: CollectionState) -> bool:
+    def drag_pricing_gun(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_PRICING_GUN)
+            self.has_high_street()
+            & self.has_prop(itemNames.PROP_PRICING_GUN)
         )
     
-    def drag_adding_machine(self, state: CollectionState) -> bool:
+    def drag_adding_machine(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_ADDING_MACHINE)
+            self.has_high_street()
+            & self.has_prop(itemNames.PROP_ADDING_MACHINE)
         )
     
     
     # ----- Back Gardens Item Drag Defs -----
     
-    def drag_rose_box(self, state: CollectionState) -> bool:
-        task_count = 0
-        
-        if self.make_someone_break_vase(state):
-            task_count += 1
-        if self.make_man_spit_out_tea(state):
-            task_count += 1
-        if self.get_dressed_up(state):
-            task_count += 1
-        if self.make_man_barefoot(state):
-            task_count += 1
-        if self.do_washing(state):
-            task_count += 1
-        if self.dress_up_bust(state):
-            task_count += 1
-        
+    def drag_rose_box(self) -> Requirement:
         return (
-            self.has_npc(state, itemNames.NPC_TIDY_NEIGHBOUR)
-            and self.has_prop(state, itemNames.PROP_ROSE_BOX)
-            and self.has_prop(state, itemNames.PROP_NO_GOOSE_SIGN_CLEAN)
-            and task_count >= 5
+            self.has_npc(itemNames.NPC_TIDY_NEIGHBOUR)
+            & self.has_prop(itemNames.PROP_ROSE_BOX)
+            & self.has_prop(itemNames.PROP_NO_GOOSE_SIGN_CLEAN)
+            & at_least(5, *self.back_gardens_tasks())
         )
     
-    def drag_cricket_bat(self, state: CollectionState) -> bool:
+    def drag_cricket_bat(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_prop(state, itemNames.PROP_CRICKET_BAT)
+            self.has_back_gardens()
+            & self.has_prop(itemNames.PROP_CRICKET_BAT)
         )
     
-    def drag_tea_pot(self, state: CollectionState) -> bool:
+    def drag_tea_pot(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_prop(state, itemNames.PROP_TEA_POT)
+            self.has_back_gardens()
+            & self.has_prop(itemNames.PROP_TEA_POT)
         )
     
-    def drag_clippers(self, state: CollectionState) -> bool:
+    def drag_clippers(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_prop(state, itemNames.PROP_CLIPPERS)
+            self.has_back_gardens()
+            & self.has_prop(itemNames.PROP_CLIPPERS)
         )
     
-    def drag_duck_statue(self, state: CollectionState) -> bool:
+    def drag_duck_statue(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_prop(state, itemNames.PROP_DUCK_STATUE)
-            and self.has_prop(state, itemNames.PROP_DRAWER)
+            self.has_back_gardens()
+            & self.has_prop(itemNames.PROP_DUCK_STATUE)
+            & self.has_prop(itemNames.PROP_DRAWER)
         )
     
-    def drag_frog_statue(self, state: CollectionState) -> bool:
+    def drag_frog_statue(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_prop(state, itemNames.PROP_FROG_STATUE)
-            and self.has_prop(state, itemNames.PROP_DRAWER)
+            self.has_back_gardens()
+            & self.has_prop(itemNames.PROP_FROG_STATUE)
+            & self.has_prop(itemNames.PROP_DRAWER)
         )
     
-    def drag_jeremy_fish(self, state: CollectionState) -> bool:
+    def drag_jeremy_fish(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_prop(state, itemNames.PROP_JEREMY_FISH)
-            and self.has_prop(state, itemNames.PROP_DRAWER)
+            self.has_back_gardens()
+            & self.has_prop(itemNames.PROP_JEREMY_FISH)
+            & self.has_prop(itemNames.PROP_DRAWER)
         )
     
-    def drag_messy_sign(self, state: CollectionState) -> bool:
+    def drag_messy_sign(self) -> Requirement:
         return (
-            self.has_prop(state, itemNames.PROP_NO_GOOSE_SIGN_MESSY)
-            and self.make_someone_prune_rose(state)
+            self.has_prop(itemNames.PROP_NO_GOOSE_SIGN_MESSY)
+            & self.make_someone_prune_rose()
         )
     
-    def drag_drawer(self, state: CollectionState) -> bool:
+    def drag_drawer(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_prop(state, itemNames.PROP_DRAWER)
+            self.has_back_gardens()
+            & self.has_prop(itemNames.PROP_DRAWER)
         )
     
-    def drag_enamel_jug(self, state: CollectionState) -> bool:
+    def drag_enamel_jug(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_prop(state, itemNames.PROP_ENAMEL_JUG)
-            and self.has_prop(state, itemNames.PROP_DRAWER)
+            self.has_back_gardens()
+            & self.has_prop(itemNames.PROP_ENAMEL_JUG)
+            & self.has_prop(itemNames.PROP_DRAWER)
         )
     
-    def drag_clean_sign(self, state: CollectionState) -> bool:
-        task_count = 0
-        
-        if self.make_someone_break_vase(state):
-            task_count += 1
-        if self.make_man_spit_out_tea(state):
-            task_count += 1
-        if self.get_dressed_up(state):
-            task_count += 1
-        if self.make_man_barefoot(state):
-            task_count += 1
-        if self.do_washing(state):
-            task_count += 1
-        if self.dress_up_bust(state):
-            task_count += 1
-        
+    def drag_clean_sign(self) -> Requirement:
         return (
-            self.has_npc(state, itemNames.NPC_TIDY_NEIGHBOUR)
-            and self.has_prop(state, itemNames.PROP_NO_GOOSE_SIGN_CLEAN)
-            and task_count >= 5
+            self.has_npc(itemNames.NPC_TIDY_NEIGHBOUR)
+            & self.has_prop(itemNames.PROP_NO_GOOSE_SIGN_CLEAN)
+            & at_least(5, *self.back_gardens_tasks())
         )
     
     
     # ----- Pub Item Drag Defs -----
     
-    def drag_traffic_cone(self, state: CollectionState) -> bool:
+    def drag_traffic_cone(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_prop(state, itemNames.PROP_TRAFFIC_CONE)
+            self.has_pub()
+            & self.has_prop(itemNames.PROP_TRAFFIC_CONE)
         )
     
-    def drag_exit_parcel(self, state: CollectionState) -> bool:
+    def drag_exit_parcel(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_prop(state, itemNames.PROP_PARCEL)
+            self.has_pub()
+            & self.has_prop(itemNames.PROP_PARCEL)
         )
     
-    def drag_stealth_box(self, state: CollectionState) -> bool:
+    def drag_stealth_box(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_prop(state, itemNames.PROP_STEALTH_BOX)
+            self.has_pub()
+            & self.has_prop(itemNames.PROP_STEALTH_BOX)
         )
     
-    def drag_no_goose_sign(self, state: CollectionState) -> bool:
-        task_count = 0
-        
-        if self.get_into_pub(state):
-            task_count += 1
-        if self.break_dartboard(state):
-            task_count += 1
-        if self.get_toy_boat(state):
-            task_count += 1
-        if self.make_old_man_fall_on_bum(state):
-            task_count += 1
-        if self.be_awarded_flower(state):
-            task_count += 1
-        if self.drop_pint_glass_in_canal(state):
-            task_count += 1
-        if self.set_table(state):
-            task_count += 1
-        
+    def drag_no_goose_sign(self) -> Requirement:
         return (
-            self.has_npc(state, itemNames.NPC_PUB_LADY)
-            and self.has_prop(state, itemNames.PROP_NO_GOOSE_SIGN_PUB)
-            and task_count >= 6
+            self.has_npc(itemNames.NPC_PUB_LADY)
+            & self.has_prop(itemNames.PROP_NO_GOOSE_SIGN_PUB)
+            & at_least(6, *self.pub_tasks())
         )
     
-    def drag_portable_stool(self, state: CollectionState) -> bool:
+    def drag_portable_stool(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_prop(state, itemNames.PROP_PORTABLE_STOOL)
+            self.has_pub()
+            & self.has_prop(itemNames.PROP_PORTABLE_STOOL)
         )
     
-    def drag_dartboard(self, state: CollectionState) -> bool:
-        return self.break_dartboard(state)
+    def drag_dartboard(self) -> Requirement:
+        return self.break_dartboard()
     
-    def drag_mop_bucket(self, state: CollectionState) -> bool:
+    def drag_mop_bucket(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_prop(state, itemNames.PROP_MOP_BUCKET)
+            self.has_pub()
+            & self.has_prop(itemNames.PROP_MOP_BUCKET)
         )
     
-    def drag_mop(self, state: CollectionState) -> bool:
+    def drag_mop(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_prop(state, itemNames.PROP_MOP)
+            self.has_pub()
+            & self.has_prop(itemNames.PROP_MOP)
         )
     
-    def drag_delivery_box(self, state: CollectionState) -> bool:
+    def drag_delivery_box(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_npc(state, itemNames.NPC_COOK)
+            self.has_pub()
+            & self.has_npc(itemNames.NPC_COOK)
         )
     
-    def drag_burly_mans_bucket(self, state: CollectionState) -> bool:
+    def drag_burly_mans_bucket(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_prop(state, itemNames.PROP_BUCKET)
+            self.has_pub()
+            & self.has_prop(itemNames.PROP_BUCKET)
         )
     
     
     # ----- Model Village Item Drag Defs -----
     
-    def drag_mini_benches(self, state: CollectionState) -> bool:
+    def drag_mini_benches(self) -> Requirement:
         return (
-            self.has_model_village(state)
-            and self.has_prop(state, itemNames.PROP_MINI_BENCHES)
+            self.has_model_village()
+            & self.has_prop(itemNames.PROP_MINI_BENCHES)
         )
     
-    def drag_mini_pump(self, state: CollectionState) -> bool:
+    def drag_mini_pump(self) -> Requirement:
         return (
-            self.has_model_village(state)
-            and self.has_prop(state, itemNames.PROP_MINI_PUMP)
+            self.has_model_village()
+            & self.has_prop(itemNames.PROP_MINI_PUMP)
         )
     
-    def drag_mini_birdbath(self, state: CollectionState) -> bool:
+    def drag_mini_birdbath(self) -> Requirement:
         return (
-            self.has_model_village(state)
-            and self.has_prop(state, itemNames.PROP_MINI_BIRDBATH)
+            self.has_model_village()
+            & self.has_prop(itemNames.PROP_MINI_BIRDBATH)
         )
     
-    def drag_mini_easel(self, state: CollectionState) -> bool:
+    def drag_mini_easel(self) -> Requirement:
         return (
-            self.has_model_village(state)
-            and self.has_prop(state, itemNames.PROP_MINI_EASEL)
+            self.has_model_village()
+            & self.has_prop(itemNames.PROP_MINI_EASEL)
         )
     
-    def drag_sun_lounge(self, state: CollectionState) -> bool:
+    def drag_sun_lounge(self) -> Requirement:
         return (
-            self.has_model_village(state)
-            and self.has_prop(state, itemNames.PROP_MINI_SUN_LOUNGE)
+            self.has_model_village()
+            & self.has_prop(itemNames.PROP_MINI_SUN_LOUNGE)
         )
     
     
     # ----- Interaction & Church Pecking Defs -----
     
-    def interact_bike_bell(self, state: CollectionState) -> bool:
-        return True
-    
-    def interact_garden_water(self, state: CollectionState) -> bool:
-        return self.has_garden(state)
-    
-    def short_out_radio(self, state: CollectionState) -> bool:
-        return (
-            self.has_garden(state)
-            and self.has_prop(state, itemNames.PROP_RADIO)
-        )
-    
-    def interact_intro_gate(self, state: CollectionState) -> bool:
-        return True
-    
-    def interact_well(self, state: CollectionState) -> bool:
-        return (
-            self.pickup_radio(state)
-            or self.pickup_trowel(state)
-            or self.pickup_keys(state)
-            or self.pickup_tulip(state)
-            or self.pickup_apples(state)
-            or self.pickup_jam(state)
-            or self.pickup_picnic_mug(state)
-            or self.pickup_thermos(state)
-            or self.pickup_sandwich(state)
-            or self.pickup_straw_hat(state)
-            or self.pickup_drink_can(state)
-            or self.pickup_tennis_ball(state)
-            or self.pickup_grounsdkeepers_hat(state)
-            or self.pickup_boys_glasses(state)
-            or self.pickup_horn_rimmed_glasses(state)
-            or self.pickup_red_glasses(state)
-            or self.pickup_sunglasses(state)
-            or self.pickup_loo_paper(state)
-            or self.pickup_toy_car(state)
-            or self.pickup_hairbrush(state)
-            or self.pickup_toothbrush(state)
-            or self.pickup_stereoscope(state)
-            or self.pickup_dish_soap_bottle(state)
-            or self.pickup_food_cans(state)
-            or self.pickup_weed_tools(state)
-            or self.pickup_lily_flower(state)
-            or self.pickup_oranges(state)
-            or self.pickup_tomatoes_high_street(state)
-            or self.pickup_carrots_high_street(state)
-            or self.pickup_cucumbers(state)
-            or self.pickup_leeks(state)
-            or self.pickup_fusilage(state)
-            or self.pickup_pint_bottle_hub(state)
-            or self.pickup_spray_bottle(state)
-            or self.pickup_walkie_talkies(state)
-            or self.pickup_apple_cores(state)
-            or self.pickup_dustbin_lid(state)
-            or self.pickup_blue_bow(state)
-            or self.pickup_dummy(state)
-            or self.pickup_cricket_ball(state)
-            or self.pickup_bust_pipe(state)
-            or self.pickup_bust_hat(state)
-            or self.pickup_bust_glasses(state)
-            or self.pickup_slippers(state)
-            or self.pickup_tea_cup(state)
-            or self.pickup_newspaper(state)
-            or self.pickup_socks(state)
-            or self.pickup_vase(state)
-            or self.pickup_pot_stack(state)
-            or self.pickup_soap(state)
-            or self.pickup_paintbrush(state)
-            or self.pickup_bra(state)
-            or self.pickup_fishing_bobber(state)
-            or self.pickup_exit_letter(state)
-            or self.pickup_plates(state)
-            or self.pickup_green_quoits(state)
-            or self.pickup_red_quoits(state)
-            or self.pickup_forks(state)
-            or self.pickup_knives(state)
-            or self.pickup_cork(state)
-            or self.pickup_candlestick(state)
-            or self.pickup_vase_flower(state)
-            or self.pickup_darts(state)
-            or self.pickup_harmonica(state)
-            or self.pickup_pint_glass(state)
-            or self.pickup_toy_boat(state)
-            or self.pickup_woolen_hat(state)
-            or self.pickup_pepper_grinder(state)
-            or self.pickup_pub_woman_cloth(state)
-            or self.pickup_people_miniatures(state)
-            or self.pickup_mini_goose(state)
-            or self.pickup_mini_shovel(state)
-            or self.pickup_poppy(state)
-            or self.pickup_mini_phone_booth(state)
-            or self.pickup_mini_mail_pillar(state)
-            or self.pickup_timber_handle(state)
-            or self.pickup_garden_carrots(state)
-            or self.pickup_boots(state)
-        )
-    
-    def drop_mail_in_well(self, state: CollectionState) -> bool:
-        return (
-            self.has_pub(state)
-            and (
-                self.has_prop(state, itemNames.PROP_LETTER)
-                or self.has_model_village(state)
-                and self.has_prop(state, itemNames.PROP_MINI_MAIL_PILLAR)
+    def interact_bike_bell(self) -> Requirement:
+        return ALWAYS
+    
+    def interact_garden_water(self) -> Requirement:
+        return self.has_garden()
+    
+    def short_out_radio(self) -> Requirement:
+        return (
+            self.has_garden()
+            & self.has_prop(itemNames.PROP_RADIO)
+        )
+    
+    def interact_intro_gate(self) -> Requirement:
+        return ALWAYS
+    
+    def interact_well(self) -> Requirement:
+        return (
+            self.pickup_radio()
+            | self.pickup_trowel()
+            | self.pickup_keys()
+            | self.pickup_tulip()
+            | self.pickup_apples()
+            | self.pickup_jam()
+            | self.pickup_picnic_mug()
+            | self.pickup_thermos()
+            | self.pickup_sandwich()
+            | self.pickup_straw_hat()
+            | self.pickup_drink_can()
+            | self.pickup_tennis_ball()
+            | self.pickup_grounsdkeepers_hat()
+            | self.pickup_boys_glasses()
+            | self.pickup_horn_rimmed_glasses()
+            | self.pickup_red_glasses()
+            | self.pickup_sunglasses()
+            | self.pickup_loo_paper()
+            | self.pickup_toy_car()
+            | self.pickup_hairbrush()
+            | self.pickup_toothbrush()
+            | self.pickup_stereoscope()
+            | self.pickup_dish_soap_bottle()
+            | self.pickup_food_cans()
+            | self.pickup_weed_tools()
+            | self.pickup_lily_flower()
+            | self.pickup_oranges()
+            | self.pickup_tomatoes_high_street()
+            | self.pickup_carrots_high_street()
+            | self.pickup_cucumbers()
+            | self.pickup_leeks()
+            | self.pickup_fusilage()
+            | self.pickup_pint_bottle_hub()
+            | self.pickup_spray_bottle()
+            | self.pickup_walkie_talkies()
+            | self.pickup_apple_cores()
+            | self.pickup_dustbin_lid()
+            | self.pickup_blue_bow()
+            | self.pickup_dummy()
+            | self.pickup_cricket_ball()
+            | self.pickup_bust_pipe()
+            | self.pickup_bust_hat()
+            | self.pickup_bust_glasses()
+            | self.pickup_slippers()
+            | self.pickup_tea_cup()
+            | self.pickup_newspaper()
+            | self.pickup_socks()
+            | self.pickup_vase()
+            | self.pickup_pot_stack()
+            | self.pickup_soap()
+            | self.pickup_paintbrush()
+            | self.pickup_bra()
+            | self.pickup_fishing_bobber()
+            | self.pickup_exit_letter()
+            | self.pickup_plates()
+            | self.pickup_green_quoits()
+            | self.pickup_red_quoits()
+            | self.pickup_forks()
+            | self.pickup_knives()
+            | self.pickup_cork()
+            | self.pickup_candlestick()
+            | self.pickup_vase_flower()
+            | self.pickup_darts()
+            | self.pickup_harmonica()
+            | self.pickup_pint_glass()
+            | self.pickup_toy_boat()
+            | self.pickup_woolen_hat()
+            | self.pickup_pepper_grinder()
+            | self.pickup_pub_woman_cloth()
+            | self.pickup_people_miniatures()
+            | self.pickup_mini_goose()
+            | self.pickup_mini_shovel()
+            | self.pickup_poppy()
+            | self.pickup_mini_phone_booth()
+            | self.pickup_mini_mail_pillar()
+            | self.pickup_timber_handle()
+            | self.pickup_garden_carrots()
+            | self.pickup_boots()
+        )
+    
+    def drop_mail_in_well(self) -> Requirement:
+        return (
+            self.has_pub()
+            & (
+                self.has_prop(itemNames.PROP_LETTER)
+                | self.has_model_village()
+                & self.has_prop(itemNames.PROP_MINI_MAIL_PILLAR)
             )
         )
     
-    def interact_boards(self, state: CollectionState) -> bool:
-        return self.has_back_gardens(state)
+    def interact_boards(self) -> Requirement:
+        return self.has_back_gardens()
     
-    def interact_radio(self, state: CollectionState) -> bool:
-        return self.has_high_street(state)
+    def interact_radio(self) -> Requirement:
+        return self.has_high_street()
     
-    def interact_football(self, state: CollectionState) -> bool:
+    def interact_football(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_prop(state, itemNames.PROP_FOOTBALL)
+            self.has_high_street()
+            & self.has_prop(itemNames.PROP_FOOTBALL)
         )
     
-    def interact_umbrellas(self, state: CollectionState) -> bool:
+    def interact_umbrellas(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_npc(state, itemNames.NPC_MARKET_LADY)
-            and self.has_prop(state, itemNames.PROP_UMBRELLAS)
+            self.has_high_street()
+            & self.has_npc(itemNames.NPC_MARKET_LADY)
+            & self.has_prop(itemNames.PROP_UMBRELLAS)
         )
     
-    def interact_boys_laces(self, state: CollectionState) -> bool:
+    def interact_boys_laces(self) -> Requirement:
         return (
-            self.has_high_street(state)
-            and self.has_npc(state, itemNames.NPC_BOY)
+            self.has_high_street()
+            & self.has_npc(itemNames.NPC_BOY)
         )
     
-    def trap_tv_shop_owner_in_garage(self, state: CollectionState) -> bool:
+    def trap_tv_shop_owner_in_garage(self) -> Requirement:
         return (
-            self.trap_shopkeep_in_garage(state)
-            and self.has_npc(state, itemNames.NPC_TV_SHOP_OWNER)
-            and self.has_prop(state, itemNames.PROP_WALKIE_TALKIES)
+            self.trap_shopkeep_in_garage()
+            & self.has_npc(itemNames.NPC_TV_SHOP_OWNER)
+            & self.has_prop(itemNames.PROP_WALKIE_TALKIES)
         )
     
-    def interact_back_gardens_objects(self, state: CollectionState) -> bool:
+    def interact_back_gardens_objects(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_prop(state, itemNames.PROP_DRAWER)
+            self.has_back_gardens()
+            & self.has_prop(itemNames.PROP_DRAWER)
         )
     
-    def interact_trellis(self, state: CollectionState) -> bool:
-        return self.has_back_gardens(state)
+    def interact_trellis(self) -> Requirement:
+        return self.has_back_gardens()
 
-    def interact_make_woman_fix_topiary(self, state: CollectionState) -> bool:
+    def interact_make_woman_fix_topiary(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_npc(state, itemNames.NPC_MESSY_NEIGHBOUR)
-            and self.has_prop(state, itemNames.PROP_CLIPPERS)
-            and self.has_prop(state, itemNames.PROP_DRAWER)
+            self.has_back_gardens()
+            & self.has_npc(itemNames.NPC_MESSY_NEIGHBOUR)
+            & self.has_prop(itemNames.PROP_CLIPPERS)
+            & self.has_prop(itemNames.PROP_DRAWER)
         )
 
-    def pose_as_duck_statue(self, state: CollectionState) -> bool:
+    def pose_as_duck_statue(self) -> Requirement:
         return (
-            self.has_back_gardens(state)
-            and self.has_npc(state, itemNames.NPC_MESSY_NEIGHBOUR)
-            and self.has_prop(state, itemNames.PROP_DUCK_STATUE)
-            and self.has_prop(state, itemNames.PROP_DRAWER)
+            self.has_back_gardens()
+            & self.has_npc(itemNames.NPC_MESSY_NEIGHBOUR)
+            & self.has_prop(itemNames.PROP_DUCK_STATUE)
+            & self.has_prop(itemNames.PROP_DRAWER)
         )
     
-    def dress_up_bush(self, state: CollectionState) -> bool:
+    def dress_up_bush(self) -> Requirement:
         return (
-            self.make_someone_prune_rose(state)
-            and self.has_prop(state, itemNames.PROP_RIBBONS)
+            self.make_someone_prune_rose()
+            & self.has_prop(itemNames.PROP_RIBBONS)
         )
     
-    def interact_van_doors(self, state: CollectionState) -> bool:
-        return self.has_pub(state)
+    def interact_van_doors(self) -> Requirement:
+        return self.has_pub()
     
-    def interact_burly_laces(self, state: CollectionState) -> bool:
+    def interact_burly_laces(self) -> Requirement:
         return (
-            self.has_pub(state)
-            and self.has_npc(state, itemNames.NPC_BURLY_MAN)
+            self.has_pub()
+            & self.has_npc(itemNames.NPC_BURLY_MAN)
         )
     
-    def interact_pub_tap(self, state: CollectionState) -> bool:
-        return self.has_pub(state)
+    def interact_pub_tap(self) -> Requirement:
+        return self.has_pub()
     
-    def perform_with_harmonica(self, state: CollectionState) -> bool:
+    def perform_with_harmonica(self) -> Requirement:
         return (
-            self.be_awarded_flower(state)
-            and self.has_prop(state, itemNames.PROP_HARMONICA)
+            self.be_awarded_flower()
+            & self.has_prop(itemNames.PROP_HARMONICA)
         )
     
-    def peck_church(self, state: CollectionState) -> bool:
-        return self.has_model_village(state)
+    def peck_church(self) -> Requirement:
+        return self.has_model_village()
     
     
     # --------------- Set Rules ---------------
 
     def set_rules(self) -> None:
-        # Model Village Rules/Victory Rules
-        for location, rules in self.victory_rules.items():
-            new_rule = self.world.multiworld.get_location(location, self.player)
-            set_rule(new_rule, rules)
+        # create_regions only added the locations the options enable, so one pass over them sets every rule
+        for location in self.world.multiworld.get_locations(self.player):
+            builder = self.location_rules.get(location.name)
+            if builder is not None:
+                record = LOCATION_REGISTRY[location_index_by_name[location.name]]
+                flags = CATEGORY_OPTIONS[record.category]
+                if location.name in OPTION_GATED_RULES:
+                    flags += (OPTION_GATED_RULES[location.name],)
+                set_rule(location, self.location_rule(location, builder, flags))
         
-        # Main Task Rules
-        for location, rules in self.main_tasks_rules.items():
-            new_rule = self.world.multiworld.get_location(location, self.player)
-            set_rule(new_rule, rules)
+        self.world.multiworld.completion_condition[self.player] = self.rule(self.steal_bell)
+        self.world.item_dependents = self.get_item_dependents()
+    
+    def get_item_dependents(self) -> Dict[str, FrozenSet[str]]:
+        """Inverts location_dependencies into item name -> the locations that item can affect"""
+        # Locations without a rule of their own still depend on reaching their region
+        for location in self.world.multiworld.get_locations(self.player):
+            if location.name not in self.location_dependencies:
+                self.location_dependencies[location.name] = frozenset(
+                    check.item for check in self.region_items(location.parent_region.name)
+                )
         
-        # To Do (As Well) Task Rules
-        if self.world.options.include_extra_tasks.value:
-            for location, rules in self.extra_task_rules.items():
-                new_rule = self.world.multiworld.get_location(location, self.player)
-                set_rule(new_rule, rules)
-
-        # To Do (Quickly!!) Task Rules
-        if self.world.options.include_speedrun_tasks.value:
-            for location, rules in self.speedrun_task_rules.items():
-                new_rule = self.world.multiworld.get_location(location, self.player)
-                set_rule(new_rule, rules)
-
-        # Item Pickup Rules
-        if self.world.options.include_item_pickups.value:
-            for location, rules in self.pickup_rules.items():
-                new_rule = self.world.multiworld.get_location(location, self.player)
-                set_rule(new_rule, rules)
+        dependents: Dict[str, Set[str]] = {}
+        for location, items in self.location_dependencies.items():
+            for item in items:
+                dependents.setdefault(item, set()).add(location)
+        return {item: frozenset(locations) for item, locations in dependents.items()}
 
-        # Item Drag Rules
-        if self.world.options.include_drag_items.value:
-            for location, rules in self.drag_rules.items():
-                new_rule = self.world.multiworld.get_location(location, self.player)
-                set_rule(new_rule, rules)
 
-        # Interaction Rules
-        if self.world.options.include_interactions.value:
-            for location, rules in self.interaction_rules.items():
-                new_rule = self.world.multiworld.get_location(location, self.player)
-                set_rule(new_rule, rules)
-
-        # New Tasks Rules
-        if self.world.options.include_new_tasks.value:
-            for location, rules in self.new_tasks_rules.items():
-                new_rule = self.world.multiworld.get_location(location, self.player)
-                set_rule(new_rule, rules)
-
-        # Model Church Pecking Rules
-        if self.world.options.include_model_church_pecks.value == 1:
-            for location, rules in self.church_first_peck_rules.items():
-                new_rule = self.world.multiworld.get_location(location, self.player)
-                set_rule(new_rule, rules)
-        elif self.world.options.include_model_church_pecks.value == 2:
-            for location, rules in self.church_all_peck_rules.items():
-                new_rule = self.world.multiworld.get_location(location, self.player)
-                set_rule(new_rule, rules)
-
-        # Milestone Rules
-        if self.world.options.include_milestone_locations.value and self.world.options.include_extra_tasks.value and self.world.options.include_speedrun_tasks.value:
-            for location, rules in self.all_milestone_rules.items():
-                new_rule = self.world.multiworld.get_location(location, self.player)
-                set_rule(new_rule, rules)
-        elif self.world.options.include_milestone_locations.value and self.world.options.include_extra_tasks.value:
-            for location, rules in self.non_speedrun_milestone_rules.items():
-                new_rule = self.world.multiworld.get_location(location, self.player)
-                set_rule(new_rule, rules)
-        elif self.world.options.include_milestone_locations.value and self.world.options.include_speedrun_tasks.value:
-            for location, rules in self.non_to_do_as_well_milestone_rules.items():
-                new_rule = self.world.multiworld.get_location(location, self.player)
-                set_rule(new_rule, rules)
-        elif self.world.options.include_milestone_locations.value:
-            for location, rules in self.basic_milestone_rules.items():
-                new_rule = self.world.multiworld.get_location(location, self.player)
-                set_rule(new_rule, rules)
-
-        # Goals
-        if self.world.options.goal.value == 0:
-            for location, rules in self.simple_goal_rules.items():
-                new_rule = self.world.multiworld.get_location(location, self.player)
-                set_rule(new_rule, rules)
-        # elif self.world.options.goal.value == 1:\
-            # No special locations
-        elif self.world.options.goal.value == 2:
-            for location, rules in self.all_main_tasks_goal_rules.items():
-                new_rule = self.world.multiworld.get_location(location, self.player)
-                set_rule(new_rule, rules)
-        elif self.world.options.goal.value == 3:
-            for location, rules in self.all_speedrun_tasks_goal_rules.items():
-                new_rule = self.world.multiworld.get_location(location, self.player)
-                set_rule(new_rule, rules)
-        elif self.world.options.goal.value == 4:
-            for location, rules in self.all_non_speedrun_tasks_goal_rules.items():
-                new_rule = self.world.multiworld.get_location(location, self.player)
-                set_rule(new_rule, rules)
-        elif self.world.options.goal.value == 5:
-            for location, rules in self.all_tasks_goal_rules.items():
-                new_rule = self.world.multiworld.get_location(location, self.player)
-                set_rule(new_rule, rules)
-        elif self.world.options.goal.value == 6:
-            for location, rules in self.four_final_tasks_rules.items():
-                new_rule = self.world.multiworld.get_location(location, self.player)
-                set_rule(new_rule, rules)
-        
-        self.world.multiworld.completion_condition[self.player] = self.steal_bell
\ No newline at end of file
+profile_rule_methods(UntitledGooseRules)
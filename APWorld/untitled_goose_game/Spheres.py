@@ -0,0 +1,99 @@
+"""Sphere calculation for solo goose seeds, for quickly checking YAMLs while tuning them.
+
+Works like MultiWorld.get_spheres, with two shortcuts the goose logic allows. Every region is entered straight
+from the hub with an item check, so each sphere checks the compiled rule of every region once and masks out the
+locations of the closed ones, and the rest only need their own access rule. And only the locations whose rules
+depend on an item collected in the previous sphere are checked again, using the world's item -> dependent locations
+index. Pending, candidate and open locations are all kept as bitmasks over the slot's filled locations.
+"""
+from typing import TYPE_CHECKING, Dict, List
+
+from BaseClasses import CollectionState
+
+if TYPE_CHECKING:
+    from . import GooseGameWorld
+
+
+def get_location_spheres(world: "GooseGameWorld") -> Dict[str, int]:
+    """Sphere index of every filled goose location, numbered like MultiWorld.get_spheres.
+
+    Unreachable locations are left out. Needs the rules set and the items placed,
+    and only handles seeds where the goose world is the only player."""
+    multiworld = world.multiworld
+    if len(multiworld.player_ids) != 1:
+        raise ValueError("The goose sphere solver only handles solo goose seeds")
+
+    rules = world.get_rules()
+    locations = [location for location in multiworld.get_locations(world.player) if location.item is not None]
+    bit_of = {location.name: 1 << index for index, location in enumerate(locations)}
+
+    # Region name -> bitmask of its locations, and the compiled item check of getting into it
+    region_masks: Dict[str, int] = {}
+    for location in locations:
+        region = location.parent_region.name
+        region_masks[region] = region_masks.get(region, 0) | bit_of[location.name]
+    region_checks = [
+        (rules.compiler.compile(rules.has_region(region)), mask) for region, mask in region_masks.items()
+    ]
+
+    # Item name -> bitmask of the locations it can affect
+    dependents: Dict[str, int] = {}
+    for item, names in world.item_dependents.items():
+        mask = 0
+        for name in names:
+            mask |= bit_of.get(name, 0)
+        dependents[item] = mask
+
+    state = CollectionState(multiworld)
+    spheres: Dict[str, int] = {}
+    pending = (1 << len(locations)) - 1
+    # Everything is checked for the first sphere, after that only what the new items can affect
+    candidates = pending
+    sphere = 0
+    while candidates:
+        reachable = 0
+        for check, mask in region_checks:
+            if check(state):
+                reachable |= mask
+
+        reached = 0
+        remaining = candidates & reachable
+        while remaining:
+            low = remaining & -remaining
+            # The access rule leaves out the item checks of the region's entrance, which are already done
+            if locations[low.bit_length() - 1].access_rule(state):
+                reached |= low
+            remaining ^= low
+        if not reached:
+            break
+
+        pending ^= reached
+        candidates = 0
+        while reached:
+            low = reached & -reached
+            location = locations[low.bit_length() - 1]
+            spheres[location.name] = sphere
+            # Filler doesn't change the state, so it's not worth collecting
+            if location.item.advancement:
+                state.collect(location.item, True, location)
+                candidates |= dependents.get(location.item.name, 0)
+            reached ^= low
+        candidates &= pending
+        sphere += 1
+    return spheres
+
+
+def verify_location_spheres(world: "GooseGameWorld") -> List[str]:
+    """Locations where get_location_spheres disagrees with the generic MultiWorld.get_spheres"""
+    expected: Dict[str, int] = {}
+    for sphere, locations in enumerate(world.multiworld.get_spheres()):
+        if not locations:
+            # get_spheres follows an empty sphere with the unreachable locations
+            break
+        expected.update((location.name, sphere) for location in locations)
+
+    spheres = get_location_spheres(world)
+    return sorted(
+        name for name in expected.keys() | spheres.keys()
+        if expected.get(name) != spheres.get(name)
+    )
@@ -0,0 +1,697 @@
+"""Name and id tables of every location, generated by GenerateData.py from Locations.py.
+
+Do not edit by hand, run `python -m worlds.untitled_goose_game.GenerateData` instead."""
+
+LOCATION_NAMES = (
+    'Get into the garden',
+    'Get the groundskeeper wet',
+    "Steal the groundskeeper's keys",
+    'Make the groundskeeper wear his sun hat',
+    'Rake in the lake',
+    'Have a picnic',
+    'Make the groundskeeper hammer his thumb',
+    'Break the broom',
+    'Trap the boy in the phone booth',
+    'Make the boy wear the wrong glasses',
+    'Make someone buy back their own stuff',
+    'Get on TV',
+    'Go shopping',
+    'Trap the shopkeeper in the garage',
+    'Make someone break the fancy vase',
+    'Help the woman dress up the bust',
+    'Make the man spit out his tea',
+    'Get dressed up with a ribbon',
+    'Make the man go barefoot',
+    'Do the washing',
+    'Make someone prune the prize rose',
+    'Get into the pub',
+    'Break the dartboard',
+    'Get the toy boat',
+    'Make the old man fall on his bum',
+    'Be awarded a flower',
+    'Steal a pint glass and drop it in the canal',
+    'Set the table',
+    "Drop a bucket on the burly man's head",
+    'Get into the model village',
+    'Steal the beautiful miniature golden bell',
+    '...and take it all the way back home',
+    'Pick up Golden Bell',
+    'Lock the groundskeeper out of the garden',
+    'Cabbage picnic',
+    'Trip the boy in the puddle',
+    'Make the scales go ding',
+    'Open an umbrella inside the TV shop',
+    'Make someone from outside the high street buy back their own stuff',
+    'Collect the five flowers',
+    'Trap the boy in the garage',
+    "Catch an object as it's thrown over the fence",
+    'Get thrown over the fence',
+    'Dress up the bust with things from outside the back gardens',
+    'Score a goal',
+    'Sail the toy boat under the bridge',
+    'Perform at the pub wearing a ribbon',
+    "Steal the old man's woolen hat",
+    'Complete Garden before noon',
+    'Complete High Street before noon',
+    'Complete Back Gardens before noon',
+    'Complete Pub before noon',
+    'Pick up Radio',
+    'Pick up Trowel',
+    'Pick up Keys',
+    'Pick up Tulip',
+    'Pick up Apple 1',
+    'Pick up Jam',
+    'Pick up Picnic Mug',
+    'Pick up Thermos',
+    'Pick up Sandwich (Right)',
+    'Pick up Sandwich (Left)',
+    'Pick up Straw Hat',
+    'Pick up Drink Can',
+    'Pick up Tennis Ball',
+    "Pick up Groundskeeper's Hat",
+    'Pick up Apple 2',
+    "Pick up Boy's Glasses",
+    'Pick up Horn-Rimmed Glasses',
+    'Pick up Red Glasses',
+    'Pick up Sunglasses',
+    'Pick up Loo Paper',
+    'Pick up Toy Car',
+    'Pick up Hairbrush',
+    'Pick up Toothbrush',
+    'Pick up Stereoscope',
+    'Pick up Dish Soap Bottle',
+    'Pick up Tinned Food (Blue)',
+    'Pick up Tinned Food (Yellow)',
+    'Pick up Tinned Food (Orange)',
+    'Pick up Weed Tool',
+    'Pick up Lily Flower',
+    'Pick up Orange 1',
+    'Pick up Shop Tomato 1',
+    'Pick up Shop Carrot 1',
+    'Pick up Cucumber 1',
+    'Pick up Leek 1',
+    'Pick up Fusilage',
+    'Pick up Pint Bottle (Hub)',
+    'Pick up Spray Bottle',
+    'Pick up Walkie Talkie 2',
+    'Pick up Walkie Talkie 1',
+    'Pick up Apple Core 1',
+    'Pick up Apple Core 2',
+    'Pick up Dustbin Lid',
+    'Pick up Pint Bottle (High Street 1)',
+    'Pick up Pint Bottle (High Street 2)',
+    'Pick up Chalk',
+    'Pick up Shop Tomato 2',
+    'Pick up Orange 2',
+    'Pick up Orange 3',
+    'Pick up Shop Carrot 2',
+    'Pick up Cucumber 2',
+    'Pick up Leek 2',
+    'Pick up Shop Carrot 3',
+    'Pick up Leek 3',
+    'Pick up Shop Tomato 3',
+    'Pick up Cucumber 3',
+    'Pick up Garden Fork',
+    'Pick up Ribbon (Blue)',
+    'Pick up Dummy',
+    'Pick up Cricket Ball',
+    'Pick up Bust Pipe',
+    'Pick up Bust Hat',
+    'Pick up Bust Glasses',
+    'Pick up Slipper (Right)',
+    'Pick up Slipper (Left)',
+    'Pick up Tea Cup',
+    'Pick up Newspaper',
+    'Pick up Sock 1',
+    'Pick up Sock 2',
+    'Pick up Vase',
+    'Pick up Ribbon (Red)',
+    'Pick up Pot Stack',
+    'Pick up Soap',
+    'Pick up Paintbrush',
+    'Pick up Broken Vase Piece 1',
+    'Pick up Broken Vase Piece 2',
+    'Pick up Bra',
+    'Pick up Badminton Racket',
+    'Pick up Rose',
+    'Pick up Fishing Bobber',
+    'Pick up Letter',
+    'Pick up Plate 1',
+    'Pick up Plate 2',
+    'Pick up Plate 3',
+    'Pick up Green Quoit 1',
+    'Pick up Red Quoit 1',
+    'Pick up Fork 1',
+    'Pick up Fork 2',
+    'Pick up Knife 1',
+    'Pick up Knife 2',
+    'Pick up Cork',
+    'Pick up Candlestick',
+    'Pick up Flower for Vase',
+    'Pick up Dart 1',
+    'Pick up Dart 2',
+    'Pick up Dart 3',
+    'Pick up Harmonica',
+    'Pick up Pint Glass',
+    'Pick up Toy Boat',
+    "Pick up Old Man's Woolen Hat",
+    'Pick up Pepper Grinder',
+    "Pick up Pub Woman's Cloth",
+    'Pick up Green Quoit 2',
+    'Pick up Green Quoit 3',
+    'Pick up Red Quoit 2',
+    'Pick up Red Quoit 3',
+    'Pick up Mini Person (Child)',
+    'Pick up Mini Person (Jumpsuit)',
+    'Pick up Mini Person (Gardener)',
+    'Pick up Mini Shovel',
+    'Pick up Poppy Flower',
+    'Pick up Mini Person (Old Woman)',
+    'Pick up Mini Phone Door',
+    'Pick up Mini Mail Pillar',
+    'Pick up Mini Person (Postie)',
+    'Pick up Mini Person (Vest Man)',
+    'Pick up Mini Person',
+    'Pick up Mini Goose',
+    'Pick up Timber Handle',
+    'Pick up Carrot 1',
+    'Pick up Carrot 2',
+    'Pick up Carrot 3',
+    'Pick up Carrot 4',
+    'Pick up Carrot 5',
+    'Pick up Carrot 6',
+    'Pick up Carrot 7',
+    'Pick up Carrot 8',
+    'Pick up Carrot 9',
+    'Pick up Carrot 10',
+    'Pick up Boxed Pub Tomato 1',
+    'Pick up Boxed Pub Tomato 2',
+    'Pick up Boxed Pub Tomato 3',
+    'Pick up Boxed Pub Tomato 4',
+    'Pick up Boxed Pub Tomato 5',
+    'Pick up Boxed Pub Tomato 6',
+    'Pick up Boxed Pub Tomato 7',
+    'Pick up Boxed Pub Tomato 8',
+    'Pick up Boxed Pub Tomato 9',
+    'Pick up Pub Tomato 1',
+    'Pick up Pub Tomato 2',
+    'Pick up Boot (Start)',
+    'Pick up Boot (Hub)',
+    'Drag Rake',
+    'Drag Picnic Basket',
+    'Drag Esky',
+    'Drag Shovel',
+    'Drag Pumpkin 1',
+    'Drag Pumpkin 2',
+    'Drag Pumpkin 3',
+    'Drag Pumpkin 4',
+    'Drag Watering Can',
+    'Drag Gumboot 1',
+    'Drag Gumboot 2',
+    'Drag No Goose Sign (Garden)',
+    'Drag Wooden Crate',
+    'Drag Fence Bolt',
+    'Drag Mallet',
+    'Drag Shopping Basket',
+    'Drag Umbrella (Black)',
+    'Drag Push Broom',
+    'Drag Broken Broom Head',
+    'Drag Dustbin',
+    'Drag Baby Doll',
+    'Drag Pricing Gun',
+    'Drag Adding Machine',
+    'Drag Umbrella (Rainbow)',
+    'Drag Umbrella (Red)',
+    'Drag Rose Box',
+    'Drag Cricket Bat',
+    'Drag Tea Pot',
+    'Drag Clippers',
+    'Drag Duck Statue',
+    'Drag Frog Statue',
+    'Drag Jeremy Fish',
+    'Drag No Goose Sign (Messy)',
+    'Drag Drawer',
+    'Drag Enamel Jug',
+    'Drag No Goose Sign (Clean)',
+    'Drag Tackle Box',
+    'Drag Traffic Cone',
+    'Drag Parcel',
+    'Drag Stealth Box',
+    'Drag No Goose Sign (Pub)',
+    'Drag Portable Stool',
+    'Drag Dartboard',
+    'Drag Mop Bucket',
+    'Drag Mop',
+    'Drag Delivery Box',
+    'Drag Bucket',
+    'Drag Mini Bench',
+    'Drag Mini Pump',
+    'Drag Mini Street Bench',
+    'Drag Mini Birdbath',
+    'Drag Mini Easel',
+    'Drag Mini Sun Lounge',
+    'Drag Topsoil Bag 1',
+    'Drag Topsoil Bag 2',
+    'Drag Topsoil Bag 3',
+    'Drop something in the well',
+    'Ring the bike bell',
+    'Turn on the tap in the Garden',
+    'Turn on the sprinkler',
+    "Unplug the shop's radio",
+    'Open Umbrella (Black)',
+    'Open Umbrella (Rainbow)',
+    'Open Umbrella (Red)',
+    "Untie Boy's Laces (Left)",
+    "Untie Boy's Laces (Right)",
+    'Boop the football',
+    'Ring the bell in the Back Gardens',
+    'Spin the windmill',
+    'Spin the purple flower',
+    'Break through the trellis',
+    'Spin the sunflower',
+    'Peck at the topiary',
+    'Play Wind Chime (G)',
+    'Play Wind Chime (F)',
+    'Play Wind Chime (E)',
+    'Play Wind Chime (D)',
+    'Play Wind Chime (C)',
+    'Play Wind Chime (B)',
+    'Play Wind Chime (A)',
+    'Close Van Door (Left)',
+    'Close Van Door (Right)',
+    "Untie Burly Man's Laces (Left)",
+    "Untie Burly Man's Laces (Right)",
+    'Turn on the tap in the Pub',
+    'Drop some mail in the well',
+    'Break the intro gate',
+    'Break through the boards to the back gardens',
+    'Short out the garden radio',
+    'Lock the groundskeeper IN the garden',
+    'Make the woman fix the topiary',
+    'Pose as a duck statue',
+    'Dress up the bush with both ribbons',
+    'Trip the burly man',
+    'Break a pint glass',
+    'Do some interior redecorating',
+    'Trap the TV shop owner in the garage',
+    'Perform at the pub with a harmonica',
+    'Peck Model Church Doorway',
+    'Peck Model Church Tower',
+    'Peck Model Church Doorway 1',
+    'Peck Model Church Doorway 2',
+    'Peck Model Church Doorway 3',
+    'Peck Model Church Doorway 4',
+    'Peck Model Church Doorway 5',
+    'Peck Model Church Doorway 6',
+    'Peck Model Church Doorway 7',
+    'Peck Model Church Doorway 8',
+    'Peck Model Church Doorway 9',
+    'Peck Model Church Doorway 10',
+    'Peck Model Church Doorway 11',
+    'Peck Model Church Doorway 12',
+    'Peck Model Church Doorway 13',
+    'Peck Model Church Doorway 14',
+    'Peck Model Church Doorway 15',
+    'Peck Model Church Doorway 16',
+    'Peck Model Church Doorway 17',
+    'Peck Model Church Doorway 18',
+    'Peck Model Church Doorway 19',
+    'Peck Model Church Tower 1',
+    'Peck Model Church Tower 2',
+    'Peck Model Church Tower 3',
+    'Peck Model Church Tower 4',
+    'Peck Model Church Tower 5',
+    'Peck Model Church Tower 6',
+    'Peck Model Church Tower 7',
+    'Peck Model Church Tower 8',
+    'Peck Model Church Tower 9',
+    'Peck Model Church Tower 10',
+    'Peck Model Church Tower 11',
+    'Peck Model Church Tower 12',
+    'Peck Model Church Tower 13',
+    'Peck Model Church Tower 14',
+    'Peck Model Church Tower 15',
+    'Peck Model Church Tower 16',
+    'All Garden tasks complete',
+    'All High Street tasks complete',
+    'All Back Gardens tasks complete',
+    'All Pub tasks complete',
+    'All main task lists complete',
+    'Complete all goals',
+    "All 'To Do (As Well)' tasks complete",
+    'All speedrun tasks complete',
+    'All tasks complete',
+    'Get into the Model Village (Golden Bell)',
+    'All main task lists complete (Golden Bell)',
+    'All speedrun tasks complete (Golden Bell)',
+    "All main task lists + 'To Do (As Well)' complete (Golden Bell)",
+    'All tasks complete (Golden Bell)',
+    'Complete the four final area tasks (Golden Bell)',
+)
+
+LOCATION_IDS = (
+    119000001,
+    119000002,
+    119000003,
+    119000004,
+    119000005,
+    119000006,
+    119000007,
+    119000010,
+    119000011,
+    119000012,
+    119000013,
+    119000014,
+    119000015,
+    119000016,
+    119000020,
+    119000021,
+    119000022,
+    119000023,
+    119000024,
+    119000025,
+    119000026,
+    119000030,
+    119000031,
+    119000032,
+    119000033,
+    119000034,
+    119000035,
+    119000036,
+    119000037,
+    119000040,
+    119000041,
+    119000042,
+    119001143,
+    119000050,
+    119000051,
+    119000052,
+    119000053,
+    119000054,
+    119000055,
+    119000056,
+    119000060,
+    119000061,
+    119000062,
+    119000063,
+    119000064,
+    119000065,
+    119000066,
+    119000067,
+    119000070,
+    119000071,
+    119000072,
+    119000073,
+    119001002,
+    119001003,
+    119001004,
+    119001006,
+    119001007,
+    119001008,
+    119001009,
+    119001010,
+    119001011,
+    119001012,
+    119001014,
+    119001015,
+    119001016,
+    119001017,
+    119001018,
+    119001021,
+    119001022,
+    119001023,
+    119001024,
+    119001025,
+    119001026,
+    119001027,
+    119001028,
+    119001029,
+    119001030,
+    119001031,
+    119001032,
+    119001033,
+    119001034,
+    119001035,
+    119001036,
+    119001037,
+    119001038,
+    119001039,
+    119001040,
+    119001041,
+    119001042,
+    119001043,
+    119001044,
+    119001045,
+    119001046,
+    119001058,
+    119001047,
+    119001048,
+    119001049,
+    119001050,
+    119001051,
+    119001052,
+    119001053,
+    119001054,
+    119001055,
+    119001056,
+    119001057,
+    119001059,
+    119001060,
+    119001061,
+    119001062,
+    119001071,
+    119001072,
+    119001073,
+    119001074,
+    119001075,
+    119001076,
+    119001077,
+    119001078,
+    119001079,
+    119001080,
+    119001081,
+    119001082,
+    119001083,
+    119001084,
+    119001085,
+    119001086,
+    119001087,
+    119001088,
+    119001089,
+    119001090,
+    119001093,
+    119001094,
+    119001101,
+    119001102,
+    119001104,
+    119001105,
+    119001106,
+    119001107,
+    119001108,
+    119001109,
+    119001110,
+    119001111,
+    119001112,
+    119001113,
+    119001114,
+    119001115,
+    119001116,
+    119001117,
+    119001118,
+    119001119,
+    119001120,
+    119001121,
+    119001122,
+    119001123,
+    119001124,
+    119001125,
+    119001126,
+    119001127,
+    119001128,
+    119001131,
+    119001132,
+    119001133,
+    119001134,
+    119001135,
+    119001136,
+    119001137,
+    119001138,
+    119001139,
+    119001140,
+    119001141,
+    119001144,
+    119001142,
+    119001401,
+    119001402,
+    119001403,
+    119001404,
+    119001405,
+    119001406,
+    119001407,
+    119001408,
+    119001409,
+    119001410,
+    119001421,
+    119001422,
+    119001423,
+    119001424,
+    119001425,
+    119001426,
+    119001427,
+    119001428,
+    119001429,
+    119001430,
+    119001431,
+    119001440,
+    119001441,
+    119001201,
+    119001202,
+    119001203,
+    119001205,
+    119001206,
+    119001207,
+    119001208,
+    119001209,
+    119001210,
+    119001211,
+    119001212,
+    119001213,
+    119001214,
+    119001215,
+    119001216,
+    119001220,
+    119001221,
+    119001222,
+    119001223,
+    119001224,
+    119001225,
+    119001226,
+    119001227,
+    119001228,
+    119001229,
+    119001240,
+    119001241,
+    119001242,
+    119001243,
+    119001244,
+    119001245,
+    119001246,
+    119001247,
+    119001248,
+    119001249,
+    119001250,
+    119001270,
+    119001271,
+    119001272,
+    119001273,
+    119001274,
+    119001275,
+    119001276,
+    119001277,
+    119001278,
+    119001279,
+    119001280,
+    119001290,
+    119001291,
+    119001292,
+    119001293,
+    119001294,
+    119001295,
+    119001450,
+    119001451,
+    119001452,
+    119001300,
+    119001301,
+    119001302,
+    119001303,
+    119001311,
+    119001313,
+    119001314,
+    119001315,
+    119001316,
+    119001317,
+    119001318,
+    119001320,
+    119001322,
+    119001323,
+    119001324,
+    119001325,
+    119001326,
+    119001340,
+    119001341,
+    119001342,
+    119001343,
+    119001344,
+    119001345,
+    119001346,
+    119001330,
+    119001331,
+    119001332,
+    119001333,
+    119001334,
+    119001500,
+    119001501,
+    119001502,
+    119001503,
+    119001504,
+    119001505,
+    119001506,
+    119001507,
+    119001508,
+    119001509,
+    119001510,
+    119001511,
+    119001512,
+    119001390,
+    119001391,
+    119001350,
+    119001351,
+    119001352,
+    119001353,
+    119001354,
+    119001355,
+    119001356,
+    119001357,
+    119001358,
+    119001359,
+    119001360,
+    119001361,
+    119001362,
+    119001363,
+    119001364,
+    119001365,
+    119001366,
+    119001367,
+    119001368,
+    119001369,
+    119001370,
+    119001371,
+    119001372,
+    119001373,
+    119001374,
+    119001375,
+    119001376,
+    119001377,
+    119001378,
+    119001379,
+    119001380,
+    119001381,
+    119001382,
+    119001383,
+    119001384,
+    119000081,
+    119000082,
+    119000083,
+    119000084,
+    119000088,
+    119000080,
+    119000085,
+    119000086,
+    119000090,
+    119000093,
+    119000089,
+    119000087,
+    119000092,
+    119000091,
+    119000094,
+)
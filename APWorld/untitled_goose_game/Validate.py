@@ -0,0 +1,141 @@
+"""Checks many goose YAMLs at once, without generating a seed for any of them.
+
+Each YAML's options are rolled like Generate does, then only generate_early runs, which raises the OptionErrors
+for settings that don't go together or that the goal can't be reached with (see Beatability.py).
+No regions, items or fill are made, so a YAML takes milliseconds instead of a full generation.
+The YAMLs are spread over worker processes and every one gets a pass or fail with its timing.
+
+Run from the root of an Archipelago checkout with the world installed:
+    python -m worlds.untitled_goose_game.Validate Players/ more_yamls/goose.yaml --output goose_yamls.json
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from Generate import PlandoOptions, roll_settings
+from Options import OptionError
+from Utils import parse_yamls
+
+from . import GooseGameWorld
+from .Benchmark import SETUP_STEPS, create_multiworld_from_options, run_steps
+
+YAML_EXTENSIONS = (".yaml", ".yml")
+
+# (label, YAML document, seed) for one player's settings
+Job = Tuple[str, Dict[str, Any], int]
+
+
+def find_yamls(paths: List[str]) -> List[str]:
+    """The YAML files among the paths, looking inside directories without going into their subdirectories"""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(sorted(
+                os.path.join(path, name) for name in os.listdir(path) if name.lower().endswith(YAML_EXTENSIONS)
+            ))
+        else:
+            files.append(path)
+    return files
+
+
+def load_jobs(files: List[str], seed: int) -> Tuple[List[Job], List[Dict[str, Any]]]:
+    """One job per player in the files, and a failed result for every file that can't be read as YAML"""
+    jobs: List[Job] = []
+    unreadable: List[Dict[str, Any]] = []
+    for path in files:
+        try:
+            with open(path, encoding="utf-8-sig") as file:
+                documents = [document for document in parse_yamls(file.read()) if document]
+        except Exception as error:
+            unreadable.append({"yaml": path, "passed": False, "error": f"{type(error).__name__}: {error}", "seconds": 0.0})
+            continue
+        for index, document in enumerate(documents):
+            label = path if len(documents) == 1 else f"{path}#{index + 1}"
+            jobs.append((label, document, seed))
+    return jobs, unreadable
+
+
+def validate_document(job: Job) -> Dict[str, Any]:
+    """Rolls one player's settings and runs generate_early on them"""
+    label, document, seed = job
+    result: Dict[str, Any] = {"yaml": label, "name": document.get("name")}
+    start = time.perf_counter()
+    try:
+        # roll_settings draws from the global random, as it does in Generate
+        random.seed(seed)
+        rolled = roll_settings(document, PlandoOptions.bosses)
+        if rolled.game != GooseGameWorld.game:
+            result["skipped"] = f"Rolled {rolled.game}"
+            return result
+
+        multiworld = create_multiworld_from_options({
+            name: getattr(rolled, name) for name in GooseGameWorld.options_dataclass.type_hints
+        }, seed)
+        run_steps(multiworld, SETUP_STEPS)
+        result["passed"] = True
+    except OptionError as error:
+        result["passed"] = False
+        result["error"] = str(error)
+    except Exception as error:
+        result["passed"] = False
+        result["error"] = f"{type(error).__name__}: {error}"
+    finally:
+        result["seconds"] = time.perf_counter() - start
+    return result
+
+
+def run_validation(paths: List[str], seed: int = 0, workers: Optional[int] = None) -> Dict[str, Any]:
+    jobs, results = load_jobs(find_yamls(paths), seed)
+    if jobs:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results.extend(executor.map(validate_document, jobs))
+
+    checked = [result for result in results if "skipped" not in result]
+    return {
+        "seed": seed,
+        "passed": sum(result["passed"] for result in checked),
+        "failed": sum(not result["passed"] for result in checked),
+        "skipped": len(results) - len(checked),
+        "results": results,
+    }
+
+
+def summary(report: Dict[str, Any]) -> str:
+    lines = []
+    for result in report["results"]:
+        if "skipped" in result:
+            status, message = "SKIP", result["skipped"]
+        elif result["passed"]:
+            status, message = "PASS", ""
+        else:
+            status, message = "FAIL", result["error"]
+        line = f"{status} {result['seconds'] * 1000:9.2f} ms  {result['yaml']}"
+        lines.append(f"{line}: {message}" if message else line)
+    lines.append(f"{report['passed']} passed, {report['failed']} failed, {report['skipped']} skipped")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Check Untitled Goose Game YAMLs without generating seeds for them")
+    parser.add_argument("paths", nargs="+", help="YAML files, or directories of them")
+    parser.add_argument("--seed", type=int, default=0, help="Seed used to roll random and weighted options")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes, one per CPU by default")
+    parser.add_argument("--output", default=None, help="File to also write the JSON report to")
+    args = parser.parse_args(argv)
+
+    report = run_validation(args.paths, args.seed, args.workers)
+    print(summary(report))
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    if report["failed"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
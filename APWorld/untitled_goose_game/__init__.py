@@ -1,13 +1,33 @@
-from typing import Dict, Any, ClassVar
-from worlds.AutoWorld import World, WebWorld
-from BaseClasses import Item, Tutorial
+import os
+from collections import defaultdict
+from itertools import accumulate
+from typing import TYPE_CHECKING, Dict, Any, ClassVar, FrozenSet, List, Optional, Tuple
+from worlds.AutoWorld import World, WebWorld, LogicMixin
+from BaseClasses import CollectionState, Item, MultiWorld, Tutorial
 from Options import OptionError
-from .Items import item_table, GooseGameItem, ITEM_GROUPS
-from .Locations import location_table, GooseGameLocation, get_all_location_ids
-from .Regions import create_regions
+from .Items import (
+    GooseGameItem, ITEM_GROUPS, ItemTemplate, item_names, item_ids, item_classification_codes, item_classifications,
+    BASE_ID, item_index_by_name, item_bits, area_items, get_item_template, area_item_templates, npc_soul_item_templates, prop_soul_item_templates
+)
+from .Manifest import MANIFEST_VERSION, decode_id_manifest, encode_id_manifest
 from .Options import GooseGameOptions
+from .Profiling import profile_stage
+from .StaticData import LOCATION_IDS, LOCATION_NAMES
 from .names import itemNames, locationNames, regionNames
 
+# Locations.py, Regions.py and Rules.py are only imported once a goose slot is generated,
+# so processes that merely load every world (launcher, server) don't pay for them
+if TYPE_CHECKING:
+    from .Rules import UntitledGooseRules
+
+# Set GOOSE_DEBUG=1 to double check the world's bookkeeping against the multiworld while generating
+GOOSE_DEBUG = bool(os.environ.get("GOOSE_DEBUG"))
+
+if GOOSE_DEBUG:
+    from .GenerateData import verify
+    stale_tables = verify()
+    assert not stale_tables, f"StaticData.py is out of date ({', '.join(stale_tables)}), run GenerateData"
+
 
 class GooseGameWeb(WebWorld):
     theme = "grass"
@@ -24,6 +44,24 @@ class GooseGameWeb(WebWorld):
     tutorials = [setup_en]
 
 
+class GooseGameLogic(LogicMixin):
+    # Results of the named tasks in Rules.py per player, cleared whenever that player's items change
+    goose_task_cache: Dict[int, Dict[str, bool]]
+    # Bitset of the goose items each player has (see Items.item_bits), which the compiled rules test against
+    goose_item_mask: Dict[int, int]
+
+    def init_mixin(self, parent: MultiWorld) -> None:
+        self.goose_task_cache = defaultdict(dict)
+        self.goose_item_mask = defaultdict(int)
+
+    def copy_mixin(self, new_state: CollectionState) -> CollectionState:
+        new_state.goose_task_cache = defaultdict(dict, {
+            player: cache.copy() for player, cache in self.goose_task_cache.items()
+        })
+        new_state.goose_item_mask = self.goose_item_mask.copy()
+        return new_state
+
+
 class GooseGameWorld(World):
     """
     Untitled Goose Game - It's a lovely morning in the village, 
@@ -39,16 +77,28 @@ class GooseGameWorld(World):
     options_dataclass = GooseGameOptions
     options: GooseGameOptions
     
-    item_name_to_id: ClassVar[Dict[str, int]] = {
-        name: data.id for name, data in item_table.items()
-    }
+    item_name_to_id: ClassVar[Dict[str, int]] = dict(zip(item_names, item_ids))
     
     # Register ALL possible locations - AP needs these upfront or it breaks badly (Lookin at you early MM Dev Builds)
-    location_name_to_id: ClassVar[Dict[str, int]] = get_all_location_ids()
+    # The location ids come from the tables generated into StaticData.py, so Locations.py waits for generation
+    location_name_to_id: ClassVar[Dict[str, int]] = dict(zip(LOCATION_NAMES, LOCATION_IDS))
     
     item_name_groups = ITEM_GROUPS
+    
+    # Number of locations create_regions added for this slot
+    location_count: int = 0
+    
+    # Access item of the area the player starts in, rolled once when first needed
+    starting_area: Optional[str] = None
+    
+    # Rules shared by create_regions and set_rules, made when first needed
+    goose_rules: Optional["UntitledGooseRules"] = None
+    
+    # Item name -> names of this slot's locations whose access depends on that item, filled in by set_rules
+    item_dependents: Dict[str, FrozenSet[str]]
 
     # Validating YAML options
+    @profile_stage
     def generate_early(self) -> None:
         if self.options.include_prop_souls.value and not self.options.include_item_pickups.value:
             raise OptionError("The setting 'Include Prop Souls' requires 'Include Item Pickups' to be enabled in the YAML options.")
@@ -58,16 +108,47 @@ class GooseGameWorld(World):
             raise OptionError("The goal 'all_tasks_no_speedrun' requires 'Include Extra Tasks' to be enabled in the YAML options.")
         elif self.options.goal.value == 5 and (not self.options.include_speedrun_tasks.value or not self.options.include_extra_tasks.value):
             raise OptionError("The goal 'all_tasks' requires both 'Include Extra Tasks' and 'Include Speedrun Tasks' to be enabled in the YAML options.")
+        
+        # Catch option combinations the goal can't be reached with before any regions or items are made
+        from .Beatability import check_beatable
+        missing = check_beatable(self)
+        if missing is not None:
+            raise OptionError(f"The goal can't be reached with these YAML options, even with every item it still needs: {missing}")
     
     def create_item(self, name: str) -> Item:
-        item_data = item_table[name]
-        return GooseGameItem(name, item_data.classification, item_data.id, self.player)
+        index = item_index_by_name[name]
+        return GooseGameItem(
+            item_names[index], item_classifications[item_classification_codes[index]], item_ids[index], self.player
+        )
     
+    @profile_stage
     def create_regions(self) -> None:
+        from .Regions import create_regions
         create_regions(self)
     
+    def collect(self, state: CollectionState, item: Item) -> bool:
+        changed = super().collect(state, item)
+        if changed:
+            state.goose_task_cache[self.player].clear()
+            state.goose_item_mask[self.player] |= item_bits.get(item.name, 0)
+        return changed
+    
+    def remove(self, state: CollectionState, item: Item) -> bool:
+        changed = super().remove(state, item)
+        if changed:
+            state.goose_task_cache[self.player].clear()
+            # World.remove drops the item from prog_items once the last copy is gone
+            if item.name not in state.prog_items[self.player]:
+                state.goose_item_mask[self.player] &= ~item_bits.get(item.name, 0)
+        return changed
+    
     def get_starting_area_name(self) -> str:
         """Determine which area the player starts with access to."""
+        if self.starting_area is None:
+            self.starting_area = self.roll_starting_area_name()
+        return self.starting_area
+    
+    def roll_starting_area_name(self) -> str:
         starting_option = self.options.starting_area.value
         
         # Only 4 valid starting areas (Model Village excluded - it's the finale!)
@@ -83,278 +164,117 @@ class GooseGameWorld(World):
         else:
             return area_names[starting_option]
     
+    def get_area_order(self) -> Tuple[str, ...]:
+        """Order Progressive Area items open the areas in, by access item name.
+        The starting area comes first and the Model Village, the finale, always last."""
+        starting_area = self.get_starting_area_name()
+        return (starting_area,) + tuple(area for area in area_items if area != starting_area)
+    
+    @profile_stage
     def create_items(self) -> None:
         # Determine starting area
         starting_area = self.get_starting_area_name()
         
-        # All area access items (5 total)
-        area_items = [
-            itemNames.GARDEN_ACCESS,
-            itemNames.HIGH_STREET_ACCESS,
-            itemNames.BACK_GARDENS_ACCESS,
-            itemNames.PUB_ACCESS,
-            itemNames.MODEL_VILLAGE_ACCESS,
-        ]
-        
-        # NPC Soul items (11 total) - required for NPC-related goals
-        npc_souls = [
-            itemNames.NPC_GROUNDSKEEPER,
-            itemNames.NPC_BOY,
-            itemNames.NPC_TV_SHOP_OWNER,
-            itemNames.NPC_MARKET_LADY,
-            itemNames.NPC_TIDY_NEIGHBOUR,
-            itemNames.NPC_MESSY_NEIGHBOUR,
-            itemNames.NPC_BURLY_MAN,
-            itemNames.NPC_OLD_MAN,
-            itemNames.NPC_PUB_LADY,
-            itemNames.NPC_FANCY_LADIES,
-            itemNames.NPC_COOK,
-        ]
+        # Everything for the pool is gathered as (name, classification, id) templates first,
+        # then created and added to the pool in one go at the end
+        templates: List[ItemTemplate] = []
         
-        # Prop Soul items - required for picking up/dragging items
-        # NOTE: NPC-tied items (Keys, Gardener Hat, Boy's Glasses, Slipper, Wooly Hat, Pub Cloth, etc)
-        prop_souls = [
-            # Grouped Props (26)
-            itemNames.PROP_CARROTS,
-            itemNames.PROP_TOMATOES,
-            itemNames.PROP_PUMPKINS,
-            itemNames.PROP_TOPSOIL_BAGS,
-            itemNames.PROP_GREEN_QUOITS,
-            itemNames.PROP_PLATES,
-            itemNames.PROP_ORANGES,
-            itemNames.PROP_LEEKS,
-            itemNames.PROP_CUCUMBERS,
-            itemNames.PROP_UMBRELLAS,
-            itemNames.PROP_TINNED_FOOD,
-            itemNames.PROP_SOCKS,
-            itemNames.PROP_PINT_BOTTLES,
-            itemNames.PROP_KNIVES,
-            itemNames.PROP_GUMBOOTS,
-            itemNames.PROP_FORKS,
-            itemNames.PROP_APPLE_CORES,
-            itemNames.PROP_APPLES,
-            itemNames.PROP_SANDWICH,
-            itemNames.PROP_RED_QUOITS,
-            itemNames.PROP_RIBBONS,
-            itemNames.PROP_WALKIE_TALKIES,
-            itemNames.PROP_BOOTS,
-            itemNames.PROP_MINI_PEOPLE,
-            itemNames.PROP_MINI_BENCHES,
-            itemNames.PROP_WEED_TOOLS,
-
-            # Start Area One-Off Props (5)
-            itemNames.PROP_DRINK_CAN,
-            itemNames.PROP_TENNIS_BALL,
-            itemNames.PROP_DUMMY,
-            itemNames.PROP_FISHING_BOBBER,
-            itemNames.PROP_TACKLE_BOX,
-            
-            # Garden One-Off Props (15)
-            itemNames.PROP_RADIO,
-            itemNames.PROP_TROWEL,
-            itemNames.PROP_TULIP,
-            itemNames.PROP_JAM,
-            itemNames.PROP_PICNIC_MUG,
-            itemNames.PROP_THERMOS,
-            itemNames.PROP_STRAW_HAT,
-            itemNames.PROP_RAKE,
-            itemNames.PROP_PICNIC_BASKET,
-            itemNames.PROP_ESKY,
-            itemNames.PROP_SHOVEL,
-            itemNames.PROP_WATERING_CAN,
-            itemNames.PROP_MALLET,
-            itemNames.PROP_WOODEN_CRATE,
-            itemNames.PROP_CABBAGES,
-            
-            # High Street One-Off Props (22)
-            itemNames.PROP_HORN_RIMMED_GLASSES,
-            itemNames.PROP_RED_GLASSES,
-            itemNames.PROP_SUNGLASSES,
-            itemNames.PROP_LOO_PAPER,
-            itemNames.PROP_TOY_CAR,
-            itemNames.PROP_FOOTBALL,
-            itemNames.PROP_HAIRBRUSH,
-            itemNames.PROP_TOOTHRBRUSH,
-            itemNames.PROP_STEREOSCOPE,
-            itemNames.PROP_DISH_SOAP_BOTTLE,
-            itemNames.PROP_SPRAY_BOTTLE,
-            itemNames.PROP_LILY_FLOWER,
-            itemNames.PROP_TOY_PLANE,
-            itemNames.PROP_CHALK,
-            itemNames.PROP_DUSTBIN_LID,
-            itemNames.PROP_SHOPPING_BASKET,
-            itemNames.PROP_PUSH_BROOM,
-            itemNames.PROP_DUSTBIN,
-            itemNames.PROP_BABY_DOLL,
-            itemNames.PROP_PRICING_GUN,
-            itemNames.PROP_ADDING_MACHINE,
-            itemNames.PROP_GARAGE_ROPE,
-            
-            # Back Gardens One-Off Props (24)
-            itemNames.PROP_CRICKET_BALL,
-            itemNames.PROP_BUST_PIPE,
-            itemNames.PROP_BUST_HAT,
-            itemNames.PROP_BUST_GLASSES,
-            itemNames.PROP_TEA_CUP,
-            itemNames.PROP_NEWSPAPER,
-            itemNames.PROP_BADMINTON_RACKET,
-            itemNames.PROP_POT_STACK,
-            itemNames.PROP_SOAP,
-            itemNames.PROP_PAINTBRUSH,
-            itemNames.PROP_VASE,
-            itemNames.PROP_BRA,
-            itemNames.PROP_ROSE,
-            itemNames.PROP_ROSE_BOX,
-            itemNames.PROP_CRICKET_BAT,
-            itemNames.PROP_TEA_POT,
-            itemNames.PROP_CLIPPERS,
-            itemNames.PROP_DUCK_STATUE,
-            itemNames.PROP_FROG_STATUE,
-            itemNames.PROP_JEREMY_FISH,
-            itemNames.PROP_NO_GOOSE_SIGN_MESSY,
-            itemNames.PROP_DRAWER,
-            itemNames.PROP_ENAMEL_JUG,
-            itemNames.PROP_NO_GOOSE_SIGN_CLEAN,
-            
-            # Pub Prop One-Off Props (17)
-            itemNames.PROP_LETTER,
-            itemNames.PROP_PINT_GLASSES,
-            itemNames.PROP_TOY_BOAT,
-            itemNames.PROP_PEPPER_GRINDER,
-            itemNames.PROP_CORK,
-            itemNames.PROP_CANDLESTICK,
-            itemNames.PROP_FLOWER_FOR_VASE,
-            itemNames.PROP_HARMONICA,
-            itemNames.PROP_TRAFFIC_CONE,
-            itemNames.PROP_PARCEL,
-            itemNames.PROP_STEALTH_BOX,
-            itemNames.PROP_NO_GOOSE_SIGN_PUB,
-            itemNames.PROP_PORTABLE_STOOL,
-            itemNames.PROP_DARTBOARD,
-            itemNames.PROP_MOP_BUCKET,
-            itemNames.PROP_MOP,
-            itemNames.PROP_BUCKET,
-            
-            # Model Village One-Off Props (10)
-            itemNames.PROP_MINI_GOOSE,
-            itemNames.PROP_MINI_MAIL_PILLAR,
-            itemNames.PROP_MINI_PHONE_DOOR,
-            itemNames.PROP_MINI_SHOVEL,
-            itemNames.PROP_POPPY_FLOWER,
-            itemNames.PROP_TIMBER_HANDLE,
-            itemNames.PROP_MINI_BIRDBATH,
-            itemNames.PROP_MINI_EASEL,
-            itemNames.PROP_MINI_PUMP,
-            itemNames.PROP_MINI_SUN_LOUNGE,
-            
-            # Golden Bell Soul is always required even when prop souls are turned off, so it's not in this list
-        ]
-
         # Add Golden Bell Soul to pool if the chosen goal is to find the bell
         # If the chosen goal is NOT to find the bell, Golden Bell Soul is placed in pre_fill()
         if self.options.goal.value == 1:
-            self.multiworld.itempool.append(self.create_item(itemNames.PROP_GOLDEN_BELL))
+            templates.append(get_item_template(itemNames.PROP_GOLDEN_BELL))
 
         # Track items added for filler calculation
         items_added = 2 # pre-fill item(s) + Golden Bell Soul
         
         # Add area items to pool (except the starting one)
-        for item_name in area_items:
-            if item_name == starting_area:
-                # Give starting area to player directly (precollected)
-                self.multiworld.push_precollected(self.create_item(item_name))
-            else:
-                self.multiworld.itempool.append(self.create_item(item_name))
+        if self.options.progressive_area_access:
+            # The first Progressive Area opens the starting area, so it is given directly like the starting area's item
+            self.multiworld.push_precollected(self.create_item(itemNames.PROGRESSIVE_AREA_ACCESS))
+            templates.extend([get_item_template(itemNames.PROGRESSIVE_AREA_ACCESS)] * (len(area_item_templates) - 1))
+        else:
+            for template in area_item_templates:
+                if template[0] == starting_area:
+                    # Give starting area to player directly (precollected)
+                    self.multiworld.push_precollected(self.create_item(template[0]))
+                else:
+                    templates.append(template)
         
         items_added += 4  # 4 area items in pool (1 is precollected)
         
         # Add NPC souls to pool if option enabled
         if self.options.include_npc_souls:
-            for soul in npc_souls:
-                self.multiworld.itempool.append(self.create_item(soul))
-            items_added += len(npc_souls)
+            templates.extend(npc_soul_item_templates)
+            items_added += len(npc_soul_item_templates)
         
         # Add Prop souls to pool if option enabled
         if self.options.include_prop_souls:
-            for soul in prop_souls:
-                self.multiworld.itempool.append(self.create_item(soul))
-            items_added += len(prop_souls)
+            templates.extend(prop_soul_item_templates)
+            items_added += len(prop_soul_item_templates)
         
         # NOTE: Golden Bell is NOT added to the pool here!
         # It is placed directly at "Pick up Golden Bell" location in pre_fill()
         # This ensures players must have Golden Bell Soul to access it
         
         # Calculate filler needed
-        total_locations = len(self.multiworld.get_unfilled_locations(self.player))
+        total_locations = self.location_count
+        if GOOSE_DEBUG:
+            unfilled_locations = len(self.multiworld.get_unfilled_locations(self.player))
+            assert total_locations == unfilled_locations, \
+                f"create_regions recorded {total_locations} locations, but {unfilled_locations} are unfilled"
         filler_needed = total_locations - items_added
 
         # Add Silent Steps first since there can only be one
         if self.options.filler_active_silent_steps:
-            self.multiworld.itempool.append(self.create_item(itemNames.FILLER_SILENT_STEPS))
+            templates.append(get_item_template(itemNames.FILLER_SILENT_STEPS))
             filler_needed -= 1
 
         # Add other capped fillers next
-        for i in range (self.options.filler_amount_mega_honk.value): # Max 3
-            self.multiworld.itempool.append(self.create_item(itemNames.FILLER_MEGA_HONK))
-            filler_needed -= 1
-        for i in range (self.options.filler_amount_speedy_feet.value): # Max 10
-            self.multiworld.itempool.append(self.create_item(itemNames.FILLER_SPEEDY_FEET))
-            filler_needed -= 1
-        for i in range (self.options.filler_amount_goose_day.value): # Max 3
-            self.multiworld.itempool.append(self.create_item(itemNames.FILLER_A_GOOSE_DAY))
-            filler_needed -= 1
+        capped_fillers = (
+            (itemNames.FILLER_MEGA_HONK, self.options.filler_amount_mega_honk.value), # Max 3
+            (itemNames.FILLER_SPEEDY_FEET, self.options.filler_amount_speedy_feet.value), # Max 10
+            (itemNames.FILLER_A_GOOSE_DAY, self.options.filler_amount_goose_day.value), # Max 3
+        )
+        for item_name, amount in capped_fillers:
+            templates.extend([get_item_template(item_name)] * amount)
+            filler_needed -= amount
         
         # Remaining filler items based on weights
         if filler_needed > 0:
             # Build weighted filler pool from options
             # Format: (item_name, weight)
-            weighted_items = []
-            coins_weight = self.options.filler_weight_coins.value
-            tired_goose_weight = self.options.trap_weight_tired_goose.value
-            confused_feet_weight = self.options.trap_weight_confused_feet.value
-            butterbeak_weight = self.options.trap_weight_butterbeak.value
-            suspicious_goose_weight = self.options.trap_weight_suspicious_goose.value
+            weighted_items = [
+                (item_name, weight)
+                for item_name, weight in (
+                    # Filler items
+                    (itemNames.FILLER_COIN, self.options.filler_weight_coins.value),
+                    
+                    # Trap items
+                    (itemNames.TRAP_TIRED_GOOSE, self.options.trap_weight_tired_goose.value),
+                    (itemNames.TRAP_CONFUSED_FEET, self.options.trap_weight_confused_feet.value),
+                    (itemNames.TRAP_BUTTERBEAK, self.options.trap_weight_butterbeak.value),
+                    (itemNames.TRAP_SUSPICIOUS_GOOSE, self.options.trap_weight_suspicious_goose.value),
+                )
+                if weight > 0
+            ]
             
-            # Filler items
-            if coins_weight > 0:
-                weighted_items.append((itemNames.FILLER_COIN, coins_weight))
-            
-            # Trap items
-            if tired_goose_weight > 0:
-                weighted_items.append((itemNames.TRAP_TIRED_GOOSE, tired_goose_weight))
-            if confused_feet_weight > 0:
-                weighted_items.append((itemNames.TRAP_CONFUSED_FEET, confused_feet_weight))
-            if butterbeak_weight > 0:
-                weighted_items.append((itemNames.TRAP_BUTTERBEAK, butterbeak_weight))
-            if suspicious_goose_weight > 0:
-                weighted_items.append((itemNames.TRAP_SUSPICIOUS_GOOSE, suspicious_goose_weight))
-                
-            total_weight = 0
-            for item_name, weight in weighted_items:
-                total_weight += weight
-            
-            for _ in range(filler_needed):
-                if total_weight == 0:
-                    # All weighted filler has been turned off, so Coins are forced
-                    item_name = itemNames.FILLER_COIN
-                else:
-                    # Weighted random selection
-                    roll = self.random.randint(1, total_weight)
-                    if roll <= coins_weight:
-                        item_name = itemNames.FILLER_COIN
-                    elif roll <= coins_weight + tired_goose_weight:
-                        item_name = itemNames.TRAP_TIRED_GOOSE
-                    elif roll <= coins_weight + tired_goose_weight + confused_feet_weight:
-                        item_name = itemNames.TRAP_CONFUSED_FEET
-                    elif roll <= coins_weight + tired_goose_weight + confused_feet_weight + butterbeak_weight:
-                        item_name = itemNames.TRAP_BUTTERBEAK
-                    elif roll <= coins_weight + tired_goose_weight + confused_feet_weight + butterbeak_weight + suspicious_goose_weight:
-                        item_name = itemNames.TRAP_SUSPICIOUS_GOOSE
-                    else:
-                        item_name = itemNames.FILLER_COIN # We shouldn't reach this, but if something goes wrong, we fall back on Coins
-                
-                self.multiworld.itempool.append(self.create_item(item_name))
+            if not weighted_items:
+                # All weighted filler has been turned off, so Coins are forced
+                templates.extend([get_item_template(itemNames.FILLER_COIN)] * filler_needed)
+            else:
+                # Weighted random selection, all drawn at once from the cumulative weights
+                templates.extend(self.random.choices(
+                    [get_item_template(item_name) for item_name, _ in weighted_items],
+                    cum_weights=list(accumulate(weight for _, weight in weighted_items)),
+                    k=filler_needed,
+                ))
+        
+        player = self.player
+        self.multiworld.itempool += [
+            GooseGameItem(name, classification, code, player) for name, classification, code in templates
+        ]
     
+    @profile_stage
     def pre_fill(self) -> None:
         """Place victory-related items at their fixed locations.
         
@@ -391,14 +311,67 @@ class GooseGameWorld(World):
             goal_6_location = self.multiworld.get_location(locationNames.GOAL_ALL_FINAL_TASKS, self.player)
             goal_6_location.place_locked_item(golden_bell_soul)
     
+    @profile_stage
     def set_rules(self) -> None:
-        from .Rules import UntitledGooseRules
-        rules = UntitledGooseRules(self)
-        rules.set_rules()
+        self.get_rules().set_rules()
+    
+    def get_rules(self) -> "UntitledGooseRules":
+        """The slot's rules, made once and reused so the rules compiled for the entrances are shared with set_rules"""
+        if self.goose_rules is None:
+            from .Rules import UntitledGooseRules
+            self.goose_rules = UntitledGooseRules(self)
+        return self.goose_rules
     
+    def post_fill(self) -> None:
+        if GOOSE_DEBUG and len(self.multiworld.player_ids) == 1:
+            from .Spheres import verify_location_spheres
+            mismatches = verify_location_spheres(self)
+            assert not mismatches, f"Goose sphere solver disagrees with get_spheres at {mismatches}"
+    
+    def get_location_spheres(self) -> Dict[str, int]:
+        """Sphere index of each of this solo seed's filled locations, see Spheres.py"""
+        from .Spheres import get_location_spheres
+        return get_location_spheres(self)
+    
+    def get_dependent_locations(self, item_name: str) -> FrozenSet[str]:
+        """Locations that might change reachability when the item is collected or removed.
+        Every other goose location keeps its previous result, so fill tooling only needs to re-check these."""
+        return self.item_dependents.get(item_name, frozenset())
+    
+    def get_item_manifest_ids(self) -> FrozenSet[int]:
+        """Ids of every item the slot can receive, read once the multiworld is filled so item links, plando and
+        start_inventory_from_pool have already made their changes to the pool"""
+        # Items sent to an item link group reach every player in it
+        receivers = {self.player}.union(
+            group_id for group_id, group in self.multiworld.groups.items() if self.player in group["players"]
+        )
+        items = [item for item in self.multiworld.itempool if item.player in receivers]
+        items.extend(self.multiworld.precollected_items[self.player])
+        # pre_fill locks the Golden Bell and its soul in place without them going through the pool
+        items.extend(
+            location.item for location in self.multiworld.get_locations(self.player)
+            if location.locked and location.item is not None and location.item.player in receivers
+        )
+        return frozenset(item.code for item in items if item.code is not None)
+    
+    @profile_stage
     def fill_slot_data(self) -> Dict[str, Any]:
+        from .Locations import get_location_categories
+        location_ids = [
+            location.address for location in self.multiworld.get_locations(self.player) if location.address is not None
+        ]
+        item_manifest_ids = self.get_item_manifest_ids()
+        location_manifest = encode_id_manifest(location_ids)
+        item_manifest = encode_id_manifest(item_manifest_ids)
+        if GOOSE_DEBUG:
+            assert decode_id_manifest(location_manifest) == sorted(location_ids)
+            assert decode_id_manifest(item_manifest) == sorted(item_manifest_ids)
+        
         return {
             "starting_area": self.get_starting_area_name(),
+            "progressive_area_access": self.options.progressive_area_access.value,
+            # Item id offsets of the area access items, in the order Progressive Area items open them
+            "progressive_area_order": [item_ids[item_index_by_name[area]] - BASE_ID for area in self.get_area_order()],
             "goal": self.options.goal.value,
             "include_extra_tasks": self.options.include_extra_tasks.value,
             "include_speedrun_tasks": self.options.include_speedrun_tasks.value,
@@ -408,6 +381,11 @@ class GooseGameWorld(World):
             "include_model_church_pecks": self.options.include_model_church_pecks.value,
             "include_milestone_locations": self.options.include_milestone_locations.value,
             "include_new_tasks": self.options.include_new_tasks.value,
+            "location_categories": int(get_location_categories(self.options)),
+            # Sorted ids of the slot's locations and receivable items, encoded as described in Manifest.py
+            "manifest_version": MANIFEST_VERSION,
+            "location_manifest": location_manifest,
+            "item_manifest": item_manifest,
             "include_npc_souls": self.options.include_npc_souls.value,
             "include_prop_souls": self.options.include_prop_souls.value,
             "filler_amount_mega_honk": self.options.filler_amount_mega_honk.value,
@@ -0,0 +1,5 @@
+from test.bases import WorldTestBase
+
+
+class GooseGameTestBase(WorldTestBase):
+    game = "Untitled Goose Game"
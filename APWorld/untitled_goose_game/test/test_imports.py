@@ -0,0 +1,33 @@
+import os
+import subprocess
+import sys
+import unittest
+
+WORLD_PACKAGE = __package__.rsplit(".", 1)[0]
+
+# Archipelago's root, which the world package is imported from
+ARCHIPELAGO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+# Loaded by generation only, so an install that never makes a goose slot doesn't pay for them
+LAZY_MODULES = ("Locations", "Rules", "Regions", "Requirements")
+
+# Each of these makes importing the world load the generation modules on purpose
+DEBUG_VARIABLES = ("GOOSE_DEBUG", "GOOSE_PROFILE", "GOOSE_PROFILE_RULES")
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_import_skips_generation_modules(self) -> None:
+        """Imports the world in a fresh interpreter, since this one has already loaded everything"""
+        modules = [f"{WORLD_PACKAGE}.{name}" for name in LAZY_MODULES]
+        script = (
+            "import sys\n"
+            f"import {WORLD_PACKAGE}\n"
+            f"print('loaded:', *(name for name in {modules!r} if name in sys.modules))\n"
+        )
+        env = {name: value for name, value in os.environ.items() if name not in DEBUG_VARIABLES}
+        result = subprocess.run(
+            [sys.executable, "-c", script], cwd=ARCHIPELAGO_ROOT, env=env, capture_output=True, text=True
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        # Other worlds may print while loading, so only the last line is the script's
+        self.assertEqual(result.stdout.splitlines()[-1], "loaded:")
@@ -0,0 +1,167 @@
+"""Compares the goose logic with a snapshot of what it allowed before Rules.py was rewritten into Requirement trees.
+
+logic_snapshot.json holds, for option sets covering every goal and every location category, a few item states
+with the locations each of them reaches and whether it beats the game. It was recorded from the hand-written
+CollectionState predicates the Requirement trees replaced, so any difference is a change in logic.
+
+After an intentional logic change, run this test with GOOSE_RECORD_SNAPSHOT set to record the current logic
+instead of checking it, and explain the changed cases in the commit.
+"""
+import json
+import os
+import random
+from typing import Any, Dict, List, Set
+
+from BaseClasses import CollectionState
+
+from . import GooseGameTestBase
+
+SNAPSHOT_PATH = os.path.join(os.path.dirname(__file__), "logic_snapshot.json")
+
+# Goals 3 to 5 need the extra and speedrun tasks, so every set has them.
+# NPC souls stay on whenever prop souls are, or goals 2 to 5 can't be finished at all.
+SNAPSHOT_OPTIONS: List[Dict[str, Any]] = [
+    {
+        "starting_area": "garden",
+        "include_npc_souls": True,
+        "include_prop_souls": True,
+        "include_item_pickups": True,
+        "include_drag_items": True,
+        "include_interactions": True,
+        "include_new_tasks": True,
+        "include_model_church_pecks": "all_pecks",
+        "include_milestone_locations": True,
+    },
+    {
+        "starting_area": "high_street",
+        "include_npc_souls": False,
+        "include_prop_souls": False,
+        "logically_require_npc_souls": True,
+        "include_item_pickups": True,
+        "include_drag_items": False,
+        "include_interactions": True,
+        "include_new_tasks": False,
+        "include_model_church_pecks": "first_pecks_only",
+        "include_milestone_locations": True,
+    },
+    {
+        "starting_area": "back_gardens",
+        "include_npc_souls": True,
+        "include_prop_souls": False,
+        "include_item_pickups": False,
+        "include_drag_items": True,
+        "include_interactions": False,
+        "include_new_tasks": True,
+        "include_model_church_pecks": "none",
+        "include_milestone_locations": False,
+    },
+    {
+        "starting_area": "pub",
+        "include_npc_souls": True,
+        "include_prop_souls": True,
+        "logically_require_npc_souls": True,
+        "include_item_pickups": True,
+        "include_drag_items": False,
+        "include_interactions": False,
+        "include_new_tasks": False,
+        "include_model_church_pecks": "none",
+        "include_milestone_locations": False,
+    },
+]
+
+# Chance of each progression item being in a recorded state, besides the empty and the complete state
+STATE_FILLS = (0.3, 0.6, 0.85)
+
+
+def snapshot_cases() -> List[Dict[str, Any]]:
+    return [
+        {"goal": goal, "include_extra_tasks": True, "include_speedrun_tasks": True, **options}
+        for options in SNAPSHOT_OPTIONS
+        for goal in range(7)
+    ]
+
+
+class TestLogicSnapshot(GooseGameTestBase):
+    auto_construct = False
+
+    def location_names(self) -> List[str]:
+        """Every goose location, in id order, which the snapshot's location masks are over"""
+        return sorted(self.world.location_name_to_id, key=self.world.location_name_to_id.get)
+
+    def encode_locations(self, names: Set[str]) -> str:
+        mask = 0
+        for index, name in enumerate(self.location_names()):
+            if name in names:
+                mask |= 1 << index
+        return format(mask, "x")
+
+    def decode_locations(self, mask: str) -> Set[str]:
+        bits = int(mask, 16)
+        return {name for index, name in enumerate(self.location_names()) if bits >> index & 1}
+
+    def reach(self, item_ids: List[int]) -> CollectionState:
+        """A state with the starting items and the items with the given ids"""
+        item_names = {item_id: name for name, item_id in self.world.item_name_to_id.items()}
+        state = CollectionState(self.multiworld)
+        for item_id in item_ids:
+            state.collect(self.world.create_item(item_names[item_id]), True)
+        return state
+
+    def reachable(self, state: CollectionState) -> Set[str]:
+        return {
+            location.name for location in self.multiworld.get_locations(self.player) if location.can_reach(state)
+        }
+
+    def record_case(self, options: Dict[str, Any], seed: int) -> Dict[str, Any]:
+        self.options = options
+        self.world_setup(seed)
+
+        # Everything the player can ever collect: the progression in the pool and what pre_fill locked in place
+        everything = sorted(
+            item.code for item in self.multiworld.itempool + [
+                location.item for location in self.multiworld.get_locations(self.player) if location.item
+            ]
+            if item.advancement
+        )
+        rng = random.Random(seed)
+        item_states = [[], everything] + [
+            [item_id for item_id in everything if rng.random() < fill] for fill in STATE_FILLS
+        ]
+
+        states = []
+        for item_ids in item_states:
+            state = self.reach(item_ids)
+            states.append({
+                "items": item_ids,
+                "reachable": self.encode_locations(self.reachable(state)),
+                "beaten": self.multiworld.completion_condition[self.player](state),
+            })
+        return {
+            "options": options,
+            "seed": seed,
+            "locations": self.encode_locations({location.name for location in self.multiworld.get_locations(self.player)}),
+            "states": states,
+        }
+
+    def test_logic_matches_snapshot(self) -> None:
+        if os.environ.get("GOOSE_RECORD_SNAPSHOT"):
+            cases = [self.record_case(options, seed) for seed, options in enumerate(snapshot_cases())]
+            with open(SNAPSHOT_PATH, "w", newline="\n") as file:
+                file.write("[\n" + ",\n".join(json.dumps(case) for case in cases) + "\n]\n")
+            self.skipTest(f"Recorded {SNAPSHOT_PATH}")
+
+        with open(SNAPSHOT_PATH) as file:
+            cases = json.load(file)
+        self.assertEqual(len(cases), len(snapshot_cases()))
+        for case in cases:
+            with self.subTest(options=case["options"]):
+                self.options = case["options"]
+                self.world_setup(case["seed"])
+                self.assertEqual(
+                    {location.name for location in self.multiworld.get_locations(self.player)},
+                    self.decode_locations(case["locations"]),
+                )
+                for recorded in case["states"]:
+                    state = self.reach(recorded["items"])
+                    self.assertEqual(self.reachable(state), self.decode_locations(recorded["reachable"]))
+                    self.assertEqual(self.multiworld.completion_condition[self.player](state), recorded["beaten"])
@@ -0,0 +1,62 @@
+from typing import Dict
+
+from Fill import distribute_items_restrictive
+
+from . import GooseGameTestBase
+
+
+class SpheresTestBase(GooseGameTestBase):
+    """Fills solo seeds and checks the goose sphere solver against MultiWorld.get_spheres"""
+    auto_construct = False
+    seeds = range(3)
+
+    def get_spheres(self) -> Dict[str, int]:
+        spheres: Dict[str, int] = {}
+        for sphere, locations in enumerate(self.multiworld.get_spheres()):
+            if not locations:
+                # get_spheres follows an empty sphere with the unreachable locations
+                break
+            spheres.update((location.name, sphere) for location in locations)
+        return spheres
+
+    def test_spheres_match_get_spheres(self) -> None:
+        for seed in self.seeds:
+            with self.subTest(seed=seed):
+                self.world_setup(seed)
+                distribute_items_restrictive(self.multiworld)
+                self.assertEqual(self.world.get_location_spheres(), self.get_spheres())
+
+
+class TestSpheresEverything(SpheresTestBase):
+    options = {
+        "include_npc_souls": True,
+        "include_prop_souls": True,
+        "include_item_pickups": True,
+        "include_drag_items": True,
+        "include_interactions": True,
+        "include_extra_tasks": True,
+        "include_speedrun_tasks": True,
+        "include_new_tasks": True,
+        "include_model_church_pecks": "all_pecks",
+    }
+
+
+class TestSpheresProgressiveAreas(SpheresTestBase):
+    options = {
+        "goal": 2,
+        "progressive_area_access": True,
+        "include_npc_souls": True,
+        "include_item_pickups": True,
+        "include_extra_tasks": True,
+        "include_speedrun_tasks": True,
+    }
+
+
+class TestSpheresGoldenBell(SpheresTestBase):
+    options = {
+        "goal": 1,
+        "include_prop_souls": True,
+        "include_npc_souls": True,
+        "include_drag_items": True,
+        "include_milestone_locations": True,
+    }
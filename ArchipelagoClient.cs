@@ -53,6 +53,16 @@ namespace GooseGameAP
         public bool NewTasksEnabled { get; private set; } = true;
         public bool DeathLinkEnabled { get; private set; } = false;
         
+        // Area access item offsets in the order Progressive Area items open them (starting area first)
+        public static readonly long[] DefaultProgressiveAreaOrder = { 100, 101, 102, 103, 104 };
+        public long[] ProgressiveAreaOrder { get; private set; } = DefaultProgressiveAreaOrder;
+        
+        // Sorted ids of the slot's locations and receivable items from the slot_data manifests (null if not sent)
+        // Must match MANIFEST_VERSION in the apworld's Manifest.py
+        public const int SupportedManifestVersion = 1;
+        public long[] EnabledLocationIds { get; private set; } = null;
+        public long[] PoolItemIds { get; private set; } = null;
+        
         // Gate sync timing
         public bool PendingGateSync { get; set; } = false;
         public float GateSyncTimer { get; set; } = 0f;
@@ -199,6 +209,11 @@ namespace GooseGameAP
         public void SendLocationCheck(long locationId)
         {
             if (!IsConnected) return;
+            if (!IsLocationEnabled(locationId))
+            {
+                Log.LogInfo($"[LOC-APCLIENT] Skipping location not in this slot: {locationId} = {LocationMappings.GetLocationName(locationId)}");
+                return;
+            }
             string json = "[{\"cmd\":\"LocationChecks\",\"locations\":[" + locationId + "]}]";
             SendPacket(json);
             Log.LogInfo($"[LOC-APCLIENT] Sent location check: {locationId} = {LocationMappings.GetLocationName(locationId)}");
@@ -891,6 +906,34 @@ namespace GooseGameAP
                 Log.LogInfo($"[AP] Parsed death_link: {DeathLinkEnabled}");
             }
             
+            List<long> order = ParseLongArray(data, "progressive_area_order", slotDataIdx);
+            if (order != null && order.Count > 0)
+            {
+                ProgressiveAreaOrder = order.ToArray();
+                Log.LogInfo($"[AP] Parsed progressive_area_order: {string.Join(", ", ProgressiveAreaOrder)}");
+            }
+            
+            EnabledLocationIds = null;
+            PoolItemIds = null;
+            int manifestVersionIdx = data.IndexOf("\"manifest_version\":", slotDataIdx);
+            if (manifestVersionIdx > 0)
+            {
+                int colonPos = manifestVersionIdx + 19;
+                string valueArea = data.Substring(colonPos, Math.Min(10, data.Length - colonPos)).Trim();
+                int end = 0;
+                while (end < valueArea.Length && char.IsDigit(valueArea[end])) end++;
+                if (int.TryParse(valueArea.Substring(0, end), out int manifestVersion) && manifestVersion == SupportedManifestVersion)
+                {
+                    EnabledLocationIds = DecodeIdManifest(ParseLongArray(data, "location_manifest", slotDataIdx));
+                    PoolItemIds = DecodeIdManifest(ParseLongArray(data, "item_manifest", slotDataIdx));
+                    Log.LogInfo($"[AP] Parsed manifests: {EnabledLocationIds?.Length ?? 0} locations, {PoolItemIds?.Length ?? 0} items");
+                }
+                else
+                {
+                    Log.LogWarning($"[AP] Unsupported slot data manifest version '{valueArea.Substring(0, end)}' (client supports {SupportedManifestVersion}), ignoring manifests");
+                }
+            }
+            
             Log.LogInfo($"[AP] Slot data parsed: NPCSouls={NPCSoulsEnabled}, PropSouls={PropSoulsEnabled}, NewTasks={NewTasksEnabled}, DeathLink={DeathLinkEnabled}");
             
             PlayerPrefs.SetInt("AP_NPCSoulsEnabled", NPCSoulsEnabled ? 1 : 0);
@@ -899,6 +942,67 @@ namespace GooseGameAP
             PlayerPrefs.Save();
         }
         
+        /// <summary>
+        /// Parse a flat array of integers from slot_data
+        /// Format: "key":[1,2,3]
+        /// </summary>
+        private static List<long> ParseLongArray(string data, string key, int startIdx)
+        {
+            string keyPattern = "\"" + key + "\":";
+            int keyIdx = data.IndexOf(keyPattern, startIdx);
+            if (keyIdx < 0) return null;
+            
+            // The array must be the key's own value, not one further along in the packet
+            int arrStart = keyIdx + keyPattern.Length;
+            while (arrStart < data.Length && char.IsWhiteSpace(data[arrStart])) arrStart++;
+            if (arrStart >= data.Length || data[arrStart] != '[') return null;
+            
+            // A flat array of numbers closes at its first ']'
+            int arrEnd = data.IndexOf("]", arrStart);
+            if (arrEnd < 0) return null;
+            
+            List<long> values = new List<long>();
+            foreach (string entry in data.Substring(arrStart + 1, arrEnd - arrStart - 1).Split(','))
+            {
+                if (long.TryParse(entry.Trim(), out long value))
+                    values.Add(value);
+            }
+            return values;
+        }
+        
+        /// <summary>
+        /// Rebuild the sorted ids of a manifest, which holds each id's difference to the one before it (starting at BASE_ID)
+        /// </summary>
+        private static long[] DecodeIdManifest(List<long> manifest)
+        {
+            if (manifest == null) return null;
+            
+            long[] ids = new long[manifest.Count];
+            long previous = Plugin.BASE_ID;
+            for (int i = 0; i < manifest.Count; i++)
+            {
+                previous += manifest[i];
+                ids[i] = previous;
+            }
+            return ids;
+        }
+        
+        /// <summary>
+        /// Whether the location exists in this slot. Without a manifest every location is assumed to exist.
+        /// </summary>
+        public bool IsLocationEnabled(long locationId)
+        {
+            return EnabledLocationIds == null || Array.BinarySearch(EnabledLocationIds, locationId) >= 0;
+        }
+        
+        /// <summary>
+        /// Whether this slot can receive the item. Without a manifest every item is assumed to be receivable.
+        /// </summary>
+        public bool IsItemInPool(long itemId)
+        {
+            return PoolItemIds == null || Array.BinarySearch(PoolItemIds, itemId) >= 0;
+        }
+        
         public void LoadSavedSoulSettings()
         {
             NPCSoulsEnabled = PlayerPrefs.GetInt("AP_NPCSoulsEnabled", 1) == 1;
@@ -986,6 +1090,10 @@ namespace GooseGameAP
                         
                         if (currentIndex > lastProcessedIndex)
                         {
+                            // Still processed, the server can hand out items the slot's pool never had (e.g. /send)
+                            if (!IsItemInPool(itemId))
+                                Log.LogWarning($"[AP] Received item not in this slot's pool: {itemId} = {itemName}");
+
                             plugin.UI.AddReceivedItem(itemName);
                             plugin.ProcessReceivedItem(itemId);
                             newItemsCount++;
@@ -0,0 +1,1012 @@
+// <auto-generated>
+// Generated by GenerateData.py from the apworld's Items.py and Locations.py.
+// Do not edit by hand, run `python -m worlds.untitled_goose_game.GenerateData --csharp <this file>` instead.
+// </auto-generated>
+
+namespace GooseGameAP
+{
+    /// <summary>
+    /// Every item and location the apworld defines, as id offsets from Plugin.BASE_ID sorted ascending
+    /// with the matching names at the same index. LocationMappings builds its lookups from these.
+    /// </summary>
+    public static class GeneratedIdTables
+    {
+        public static readonly int[] ItemOffsets =
+        {
+            100,
+            101,
+            102,
+            103,
+            104,
+            110,
+            120,
+            121,
+            122,
+            123,
+            124,
+            125,
+            126,
+            127,
+            128,
+            129,
+            130,
+            200,
+            201,
+            202,
+            203,
+            204,
+            300,
+            301,
+            302,
+            303,
+            400,
+            401,
+            402,
+            403,
+            404,
+            405,
+            406,
+            407,
+            408,
+            409,
+            410,
+            411,
+            412,
+            413,
+            414,
+            415,
+            416,
+            418,
+            419,
+            420,
+            422,
+            423,
+            424,
+            425,
+            500,
+            501,
+            502,
+            503,
+            504,
+            505,
+            506,
+            507,
+            508,
+            509,
+            511,
+            512,
+            513,
+            514,
+            515,
+            517,
+            518,
+            521,
+            522,
+            523,
+            524,
+            525,
+            526,
+            527,
+            528,
+            529,
+            530,
+            531,
+            532,
+            533,
+            534,
+            535,
+            536,
+            537,
+            538,
+            539,
+            540,
+            541,
+            542,
+            543,
+            550,
+            551,
+            552,
+            553,
+            554,
+            555,
+            556,
+            557,
+            558,
+            559,
+            560,
+            561,
+            562,
+            563,
+            564,
+            565,
+            566,
+            567,
+            568,
+            569,
+            570,
+            571,
+            572,
+            573,
+            574,
+            580,
+            581,
+            582,
+            583,
+            585,
+            587,
+            588,
+            589,
+            590,
+            591,
+            592,
+            593,
+            594,
+            595,
+            596,
+            597,
+            598,
+            599,
+            601,
+            610,
+            611,
+            612,
+            613,
+            614,
+            615,
+            616,
+            617,
+            618,
+            619,
+            620,
+            621,
+            999,
+        };
+
+        public static readonly string[] ItemNames =
+        {
+            "Garden Access",
+            "High Street Access",
+            "Back Gardens Access",
+            "Pub Access",
+            "Model Village Access",
+            "Progressive Area",
+            "Groundskeeper's Soul",
+            "Boy's Soul",
+            "TV Shop Owner's Soul",
+            "Market Lady's Soul",
+            "Tidy Neighbour's Soul",
+            "Messy Neighbour's Soul",
+            "Burly Man's Soul",
+            "Old Man's Soul",
+            "Pub Lady's Soul",
+            "Fancy Ladies' Souls",
+            "Cook's Soul",
+            "Mega Honk",
+            "Speedy Feet",
+            "Silent Steps",
+            "A Goose Day",
+            "Coin",
+            "Tired Goose",
+            "Confused Feet",
+            "Butterbeak",
+            "Suspicious Goose",
+            "Carrots",
+            "Tomatoes",
+            "Pumpkins",
+            "Topsoil Bags",
+            "Quoits (Green)",
+            "Plates",
+            "Oranges",
+            "Leeks",
+            "Cucumbers",
+            "Quoits (Red)",
+            "Umbrellas",
+            "Tinned Food",
+            "Socks",
+            "Pint Bottles",
+            "Knives",
+            "Gumboots",
+            "Forks",
+            "Apple Cores",
+            "Apples",
+            "Sandwich",
+            "Ribbons",
+            "Walkie Talkies",
+            "Boots",
+            "Miniature People",
+            "Radio",
+            "Trowel",
+            "Cabbages",
+            "Tulip",
+            "Jam",
+            "Picnic Mug",
+            "Thermos",
+            "Sun Hat",
+            "Drink Can",
+            "Tennis Ball",
+            "Rake",
+            "Picnic Basket",
+            "Esky",
+            "Shovel",
+            "Watering Can",
+            "Mallet",
+            "Wooden Crate",
+            "Horn-Rimmed Glasses",
+            "Red Glasses",
+            "Sunglasses",
+            "Loo Paper",
+            "Toy Car",
+            "Hairbrush",
+            "Toothbrush",
+            "Stereoscope",
+            "Dish Soap Bottle",
+            "Spray Bottle",
+            "Weed Tools",
+            "Lily Flower",
+            "Toy Plane",
+            "Football",
+            "Chalk",
+            "Dustbin Lid",
+            "Shopping Basket",
+            "Push Broom",
+            "Garage Rope",
+            "Dustbin",
+            "Baby Doll",
+            "Pricing Gun",
+            "Adding Machine",
+            "Dummy",
+            "Cricket Ball",
+            "Bust Pipe",
+            "Bust Hat",
+            "Bust Glasses",
+            "Tea Cup",
+            "Newspaper",
+            "Badminton Racket",
+            "Pot Stack",
+            "Soap",
+            "Paintbrush",
+            "Vase",
+            "Bra",
+            "Rose",
+            "Rose Box",
+            "Cricket Bat",
+            "Tea Pot",
+            "Clippers",
+            "Duck Statue",
+            "Frog Statue",
+            "Jeremy Fish",
+            "No Goose Sign (Messy)",
+            "Drawer",
+            "Enamel Jug",
+            "No Goose Sign (Clean)",
+            "Fishing Bobber",
+            "Letter",
+            "Pint Glasses",
+            "Toy Boat",
+            "Pepper Grinder",
+            "Cork",
+            "Candlestick",
+            "Flower for Vase",
+            "Harmonica",
+            "Tackle Box",
+            "Traffic Cone",
+            "Parcel",
+            "Stealth Box",
+            "No Goose Sign (Pub)",
+            "Portable Stool",
+            "Dartboard",
+            "Mop Bucket",
+            "Mop",
+            "Bucket",
+            "Miniature Mail Pillar",
+            "Miniature Phone Door",
+            "Miniature Shovel",
+            "Poppy Flower",
+            "Timber Handle",
+            "Miniature Birdbath",
+            "Miniature Easel",
+            "Miniature Benches",
+            "Miniature Pump",
+            "Miniature Goose",
+            "Miniature Sun Lounge",
+            "Golden Bell",
+            "Escape Sequence",
+        };
+
+        public static readonly int[] LocationOffsets =
+        {
+            1,
+            2,
+            3,
+            4,
+            5,
+            6,
+            7,
+            10,
+            11,
+            12,
+            13,
+            14,
+            15,
+            16,
+            20,
+            21,
+            22,
+            23,
+            24,
+            25,
+            26,
+            30,
+            31,
+            32,
+            33,
+            34,
+            35,
+            36,
+            37,
+            40,
+            41,
+            42,
+            50,
+            51,
+            52,
+            53,
+            54,
+            55,
+            56,
+            60,
+            61,
+            62,
+            63,
+            64,
+            65,
+            66,
+            67,
+            70,
+            71,
+            72,
+            73,
+            80,
+            81,
+            82,
+            83,
+            84,
+            85,
+            86,
+            87,
+            88,
+            89,
+            90,
+            91,
+            92,
+            93,
+            94,
+            1002,
+            1003,
+            1004,
+            1006,
+            1007,
+            1008,
+            1009,
+            1010,
+            1011,
+            1012,
+            1014,
+            1015,
+            1016,
+            1017,
+            1018,
+            1021,
+            1022,
+            1023,
+            1024,
+            1025,
+            1026,
+            1027,
+            1028,
+            1029,
+            1030,
+            1031,
+            1032,
+            1033,
+            1034,
+            1035,
+            1036,
+            1037,
+            1038,
+            1039,
+            1040,
+            1041,
+            1042,
+            1043,
+            1044,
+            1045,
+            1046,
+            1047,
+            1048,
+            1049,
+            1050,
+            1051,
+            1052,
+            1053,
+            1054,
+            1055,
+            1056,
+            1057,
+            1058,
+            1059,
+            1060,
+            1061,
+            1062,
+            1071,
+            1072,
+            1073,
+            1074,
+            1075,
+            1076,
+            1077,
+            1078,
+            1079,
+            1080,
+            1081,
+            1082,
+            1083,
+            1084,
+            1085,
+            1086,
+            1087,
+            1088,
+            1089,
+            1090,
+            1093,
+            1094,
+            1101,
+            1102,
+            1104,
+            1105,
+            1106,
+            1107,
+            1108,
+            1109,
+            1110,
+            1111,
+            1112,
+            1113,
+            1114,
+            1115,
+            1116,
+            1117,
+            1118,
+            1119,
+            1120,
+            1121,
+            1122,
+            1123,
+            1124,
+            1125,
+            1126,
+            1127,
+            1128,
+            1131,
+            1132,
+            1133,
+            1134,
+            1135,
+            1136,
+            1137,
+            1138,
+            1139,
+            1140,
+            1141,
+            1142,
+            1143,
+            1144,
+            1201,
+            1202,
+            1203,
+            1205,
+            1206,
+            1207,
+            1208,
+            1209,
+            1210,
+            1211,
+            1212,
+            1213,
+            1214,
+            1215,
+            1216,
+            1220,
+            1221,
+            1222,
+            1223,
+            1224,
+            1225,
+            1226,
+            1227,
+            1228,
+            1229,
+            1240,
+            1241,
+            1242,
+            1243,
+            1244,
+            1245,
+            1246,
+            1247,
+            1248,
+            1249,
+            1250,
+            1270,
+            1271,
+            1272,
+            1273,
+            1274,
+            1275,
+            1276,
+            1277,
+            1278,
+            1279,
+            1280,
+            1290,
+            1291,
+            1292,
+            1293,
+            1294,
+            1295,
+            1300,
+            1301,
+            1302,
+            1303,
+            1311,
+            1313,
+            1314,
+            1315,
+            1316,
+            1317,
+            1318,
+            1320,
+            1322,
+            1323,
+            1324,
+            1325,
+            1326,
+            1330,
+            1331,
+            1332,
+            1333,
+            1334,
+            1340,
+            1341,
+            1342,
+            1343,
+            1344,
+            1345,
+            1346,
+            1350,
+            1351,
+            1352,
+            1353,
+            1354,
+            1355,
+            1356,
+            1357,
+            1358,
+            1359,
+            1360,
+            1361,
+            1362,
+            1363,
+            1364,
+            1365,
+            1366,
+            1367,
+            1368,
+            1369,
+            1370,
+            1371,
+            1372,
+            1373,
+            1374,
+            1375,
+            1376,
+            1377,
+            1378,
+            1379,
+            1380,
+            1381,
+            1382,
+            1383,
+            1384,
+            1390,
+            1391,
+            1401,
+            1402,
+            1403,
+            1404,
+            1405,
+            1406,
+            1407,
+            1408,
+            1409,
+            1410,
+            1421,
+            1422,
+            1423,
+            1424,
+            1425,
+            1426,
+            1427,
+            1428,
+            1429,
+            1430,
+            1431,
+            1440,
+            1441,
+            1450,
+            1451,
+            1452,
+            1500,
+            1501,
+            1502,
+            1503,
+            1504,
+            1505,
+            1506,
+            1507,
+            1508,
+            1509,
+            1510,
+            1511,
+            1512,
+        };
+
+        public static readonly string[] LocationNames =
+        {
+            "Get into the garden",
+            "Get the groundskeeper wet",
+            "Steal the groundskeeper's keys",
+            "Make the groundskeeper wear his sun hat",
+            "Rake in the lake",
+            "Have a picnic",
+            "Make the groundskeeper hammer his thumb",
+            "Break the broom",
+            "Trap the boy in the phone booth",
+            "Make the boy wear the wrong glasses",
+            "Make someone buy back their own stuff",
+            "Get on TV",
+            "Go shopping",
+            "Trap the shopkeeper in the garage",
+            "Make someone break the fancy vase",
+            "Help the woman dress up the bust",
+            "Make the man spit out his tea",
+            "Get dressed up with a ribbon",
+            "Make the man go barefoot",
+            "Do the washing",
+            "Make someone prune the prize rose",
+            "Get into the pub",
+            "Break the dartboard",
+            "Get the toy boat",
+            "Make the old man fall on his bum",
+            "Be awarded a flower",
+            "Steal a pint glass and drop it in the canal",
+            "Set the table",
+            "Drop a bucket on the burly man's head",
+            "Get into the model village",
+            "Steal the beautiful miniature golden bell",
+            "...and take it all the way back home",
+            "Lock the groundskeeper out of the garden",
+            "Cabbage picnic",
+            "Trip the boy in the puddle",
+            "Make the scales go ding",
+            "Open an umbrella inside the TV shop",
+            "Make someone from outside the high street buy back their own stuff",
+            "Collect the five flowers",
+            "Trap the boy in the garage",
+            "Catch an object as it's thrown over the fence",
+            "Get thrown over the fence",
+            "Dress up the bust with things from outside the back gardens",
+            "Score a goal",
+            "Sail the toy boat under the bridge",
+            "Perform at the pub wearing a ribbon",
+            "Steal the old man's woolen hat",
+            "Complete Garden before noon",
+            "Complete High Street before noon",
+            "Complete Back Gardens before noon",
+            "Complete Pub before noon",
+            "Complete all goals",
+            "All Garden tasks complete",
+            "All High Street tasks complete",
+            "All Back Gardens tasks complete",
+            "All Pub tasks complete",
+            "All 'To Do (As Well)' tasks complete",
+            "All speedrun tasks complete",
+            "All speedrun tasks complete (Golden Bell)",
+            "All main task lists complete",
+            "All main task lists complete (Golden Bell)",
+            "All tasks complete",
+            "All tasks complete (Golden Bell)",
+            "All main task lists + 'To Do (As Well)' complete (Golden Bell)",
+            "Get into the Model Village (Golden Bell)",
+            "Complete the four final area tasks (Golden Bell)",
+            "Pick up Radio",
+            "Pick up Trowel",
+            "Pick up Keys",
+            "Pick up Tulip",
+            "Pick up Apple 1",
+            "Pick up Jam",
+            "Pick up Picnic Mug",
+            "Pick up Thermos",
+            "Pick up Sandwich (Right)",
+            "Pick up Sandwich (Left)",
+            "Pick up Straw Hat",
+            "Pick up Drink Can",
+            "Pick up Tennis Ball",
+            "Pick up Groundskeeper's Hat",
+            "Pick up Apple 2",
+            "Pick up Boy's Glasses",
+            "Pick up Horn-Rimmed Glasses",
+            "Pick up Red Glasses",
+            "Pick up Sunglasses",
+            "Pick up Loo Paper",
+            "Pick up Toy Car",
+            "Pick up Hairbrush",
+            "Pick up Toothbrush",
+            "Pick up Stereoscope",
+            "Pick up Dish Soap Bottle",
+            "Pick up Tinned Food (Blue)",
+            "Pick up Tinned Food (Yellow)",
+            "Pick up Tinned Food (Orange)",
+            "Pick up Weed Tool",
+            "Pick up Lily Flower",
+            "Pick up Orange 1",
+            "Pick up Shop Tomato 1",
+            "Pick up Shop Carrot 1",
+            "Pick up Cucumber 1",
+            "Pick up Leek 1",
+            "Pick up Fusilage",
+            "Pick up Pint Bottle (Hub)",
+            "Pick up Spray Bottle",
+            "Pick up Walkie Talkie 2",
+            "Pick up Walkie Talkie 1",
+            "Pick up Apple Core 1",
+            "Pick up Dustbin Lid",
+            "Pick up Pint Bottle (High Street 1)",
+            "Pick up Pint Bottle (High Street 2)",
+            "Pick up Chalk",
+            "Pick up Shop Tomato 2",
+            "Pick up Orange 2",
+            "Pick up Orange 3",
+            "Pick up Shop Carrot 2",
+            "Pick up Cucumber 2",
+            "Pick up Leek 2",
+            "Pick up Shop Carrot 3",
+            "Pick up Apple Core 2",
+            "Pick up Leek 3",
+            "Pick up Shop Tomato 3",
+            "Pick up Cucumber 3",
+            "Pick up Garden Fork",
+            "Pick up Ribbon (Blue)",
+            "Pick up Dummy",
+            "Pick up Cricket Ball",
+            "Pick up Bust Pipe",
+            "Pick up Bust Hat",
+            "Pick up Bust Glasses",
+            "Pick up Slipper (Right)",
+            "Pick up Slipper (Left)",
+            "Pick up Tea Cup",
+            "Pick up Newspaper",
+            "Pick up Sock 1",
+            "Pick up Sock 2",
+            "Pick up Vase",
+            "Pick up Ribbon (Red)",
+            "Pick up Pot Stack",
+            "Pick up Soap",
+            "Pick up Paintbrush",
+            "Pick up Broken Vase Piece 1",
+            "Pick up Broken Vase Piece 2",
+            "Pick up Bra",
+            "Pick up Badminton Racket",
+            "Pick up Rose",
+            "Pick up Fishing Bobber",
+            "Pick up Letter",
+            "Pick up Plate 1",
+            "Pick up Plate 2",
+            "Pick up Plate 3",
+            "Pick up Green Quoit 1",
+            "Pick up Red Quoit 1",
+            "Pick up Fork 1",
+            "Pick up Fork 2",
+            "Pick up Knife 1",
+            "Pick up Knife 2",
+            "Pick up Cork",
+            "Pick up Candlestick",
+            "Pick up Flower for Vase",
+            "Pick up Dart 1",
+            "Pick up Dart 2",
+            "Pick up Dart 3",
+            "Pick up Harmonica",
+            "Pick up Pint Glass",
+            "Pick up Toy Boat",
+            "Pick up Old Man's Woolen Hat",
+            "Pick up Pepper Grinder",
+            "Pick up Pub Woman's Cloth",
+            "Pick up Green Quoit 2",
+            "Pick up Green Quoit 3",
+            "Pick up Red Quoit 2",
+            "Pick up Red Quoit 3",
+            "Pick up Mini Person (Child)",
+            "Pick up Mini Person (Jumpsuit)",
+            "Pick up Mini Person (Gardener)",
+            "Pick up Mini Shovel",
+            "Pick up Poppy Flower",
+            "Pick up Mini Person (Old Woman)",
+            "Pick up Mini Phone Door",
+            "Pick up Mini Mail Pillar",
+            "Pick up Mini Person (Postie)",
+            "Pick up Mini Person (Vest Man)",
+            "Pick up Mini Person",
+            "Pick up Timber Handle",
+            "Pick up Golden Bell",
+            "Pick up Mini Goose",
+            "Drag Rake",
+            "Drag Picnic Basket",
+            "Drag Esky",
+            "Drag Shovel",
+            "Drag Pumpkin 1",
+            "Drag Pumpkin 2",
+            "Drag Pumpkin 3",
+            "Drag Pumpkin 4",
+            "Drag Watering Can",
+            "Drag Gumboot 1",
+            "Drag Gumboot 2",
+            "Drag No Goose Sign (Garden)",
+            "Drag Wooden Crate",
+            "Drag Fence Bolt",
+            "Drag Mallet",
+            "Drag Shopping Basket",
+            "Drag Umbrella (Black)",
+            "Drag Push Broom",
+            "Drag Broken Broom Head",
+            "Drag Dustbin",
+            "Drag Baby Doll",
+            "Drag Pricing Gun",
+            "Drag Adding Machine",
+            "Drag Umbrella (Rainbow)",
+            "Drag Umbrella (Red)",
+            "Drag Rose Box",
+            "Drag Cricket Bat",
+            "Drag Tea Pot",
+            "Drag Clippers",
+            "Drag Duck Statue",
+            "Drag Frog Statue",
+            "Drag Jeremy Fish",
+            "Drag No Goose Sign (Messy)",
+            "Drag Drawer",
+            "Drag Enamel Jug",
+            "Drag No Goose Sign (Clean)",
+            "Drag Tackle Box",
+            "Drag Traffic Cone",
+            "Drag Parcel",
+            "Drag Stealth Box",
+            "Drag No Goose Sign (Pub)",
+            "Drag Portable Stool",
+            "Drag Dartboard",
+            "Drag Mop Bucket",
+            "Drag Mop",
+            "Drag Delivery Box",
+            "Drag Bucket",
+            "Drag Mini Bench",
+            "Drag Mini Pump",
+            "Drag Mini Street Bench",
+            "Drag Mini Birdbath",
+            "Drag Mini Easel",
+            "Drag Mini Sun Lounge",
+            "Drop something in the well",
+            "Ring the bike bell",
+            "Turn on the tap in the Garden",
+            "Turn on the sprinkler",
+            "Unplug the shop's radio",
+            "Open Umbrella (Black)",
+            "Open Umbrella (Rainbow)",
+            "Open Umbrella (Red)",
+            "Untie Boy's Laces (Left)",
+            "Untie Boy's Laces (Right)",
+            "Boop the football",
+            "Ring the bell in the Back Gardens",
+            "Spin the windmill",
+            "Spin the purple flower",
+            "Break through the trellis",
+            "Spin the sunflower",
+            "Peck at the topiary",
+            "Close Van Door (Left)",
+            "Close Van Door (Right)",
+            "Untie Burly Man's Laces (Left)",
+            "Untie Burly Man's Laces (Right)",
+            "Turn on the tap in the Pub",
+            "Play Wind Chime (G)",
+            "Play Wind Chime (F)",
+            "Play Wind Chime (E)",
+            "Play Wind Chime (D)",
+            "Play Wind Chime (C)",
+            "Play Wind Chime (B)",
+            "Play Wind Chime (A)",
+            "Peck Model Church Doorway 1",
+            "Peck Model Church Doorway 2",
+            "Peck Model Church Doorway 3",
+            "Peck Model Church Doorway 4",
+            "Peck Model Church Doorway 5",
+            "Peck Model Church Doorway 6",
+            "Peck Model Church Doorway 7",
+            "Peck Model Church Doorway 8",
+            "Peck Model Church Doorway 9",
+            "Peck Model Church Doorway 10",
+            "Peck Model Church Doorway 11",
+            "Peck Model Church Doorway 12",
+            "Peck Model Church Doorway 13",
+            "Peck Model Church Doorway 14",
+            "Peck Model Church Doorway 15",
+            "Peck Model Church Doorway 16",
+            "Peck Model Church Doorway 17",
+            "Peck Model Church Doorway 18",
+            "Peck Model Church Doorway 19",
+            "Peck Model Church Tower 1",
+            "Peck Model Church Tower 2",
+            "Peck Model Church Tower 3",
+            "Peck Model Church Tower 4",
+            "Peck Model Church Tower 5",
+            "Peck Model Church Tower 6",
+            "Peck Model Church Tower 7",
+            "Peck Model Church Tower 8",
+            "Peck Model Church Tower 9",
+            "Peck Model Church Tower 10",
+            "Peck Model Church Tower 11",
+            "Peck Model Church Tower 12",
+            "Peck Model Church Tower 13",
+            "Peck Model Church Tower 14",
+            "Peck Model Church Tower 15",
+            "Peck Model Church Tower 16",
+            "Peck Model Church Doorway",
+            "Peck Model Church Tower",
+            "Pick up Carrot 1",
+            "Pick up Carrot 2",
+            "Pick up Carrot 3",
+            "Pick up Carrot 4",
+            "Pick up Carrot 5",
+            "Pick up Carrot 6",
+            "Pick up Carrot 7",
+            "Pick up Carrot 8",
+            "Pick up Carrot 9",
+            "Pick up Carrot 10",
+            "Pick up Boxed Pub Tomato 1",
+            "Pick up Boxed Pub Tomato 2",
+            "Pick up Boxed Pub Tomato 3",
+            "Pick up Boxed Pub Tomato 4",
+            "Pick up Boxed Pub Tomato 5",
+            "Pick up Boxed Pub Tomato 6",
+            "Pick up Boxed Pub Tomato 7",
+            "Pick up Boxed Pub Tomato 8",
+            "Pick up Boxed Pub Tomato 9",
+            "Pick up Pub Tomato 1",
+            "Pick up Pub Tomato 2",
+            "Pick up Boot (Start)",
+            "Pick up Boot (Hub)",
+            "Drag Topsoil Bag 1",
+            "Drag Topsoil Bag 2",
+            "Drag Topsoil Bag 3",
+            "Drop some mail in the well",
+            "Break the intro gate",
+            "Break through the boards to the back gardens",
+            "Short out the garden radio",
+            "Lock the groundskeeper IN the garden",
+            "Make the woman fix the topiary",
+            "Pose as a duck statue",
+            "Dress up the bush with both ribbons",
+            "Trip the burly man",
+            "Break a pint glass",
+            "Do some interior redecorating",
+            "Trap the TV shop owner in the garage",
+            "Perform at the pub with a harmonica",
+        };
+    }
+}
@@ -30,194 +30,31 @@ namespace GooseGameAP
             return cleaned;
         }
 
+        // Names by id - BASE_ID, built once from the tables GenerateData.py writes from the apworld
+        private static readonly string[] itemNamesByOffset = IndexByOffset(GeneratedIdTables.ItemOffsets, GeneratedIdTables.ItemNames);
+        private static readonly string[] locationNamesByOffset = IndexByOffset(GeneratedIdTables.LocationOffsets, GeneratedIdTables.LocationNames);
+        
+        private static string[] IndexByOffset(int[] offsets, string[] names)
+        {
+            // Offsets are sorted, so the last one is the largest
+            string[] index = new string[offsets[offsets.Length - 1] + 1];
+            for (int i = 0; i < offsets.Length; i++)
+                index[offsets[i]] = names[i];
+            return index;
+        }
+        
+        private static string NameAtOffset(string[] index, long offset)
+        {
+            return offset >= 0 && offset < index.Length ? index[offset] : null;
+        }
+
         /// <summary>
         /// Get Archipelago item name from item ID
         /// </summary>
         public static string GetItemName(long itemId)
         {
             long offset = itemId - BASE_ID;
-            switch (offset)
-            {
-                // Area Access
-                case 100: return "Garden Access";
-                case 101: return "High Street Access";
-                case 102: return "Back Gardens Access";
-                case 103: return "Pub Access";
-                case 104: return "Model Village Access";
-                case 110: return "Progressive Area";
-                
-                // NPC Souls (120-130)
-                case 120: return "Groundskeeper's Soul";
-                case 121: return "Boy's Soul";
-                case 122: return "TV Shop Owner's Soul";
-                case 123: return "Market Lady's Soul";
-                case 124: return "Tidy Neighbour's Soul";
-                case 125: return "Messy Neighbour's Soul";
-                case 126: return "Burly Man's Soul";
-                case 127: return "Old Man's Soul";
-                case 128: return "Pub Lady's Soul";
-                case 129: return "Fancy Ladies' Souls";
-                case 130: return "Cook's Soul";
-                
-                // Filler/Useful
-                case 200: return "Mega Honk";
-                case 201: return "Speedy Feet";
-                case 202: return "Silent Steps";
-                case 203: return "A Goose Day";
-                case 204: return "Coin";
-                
-                // Traps
-                case 300: return "Tired Goose";
-                case 301: return "Confused Feet";
-                case 302: return "Butterbeak";
-                case 303: return "Suspicious Goose";
-                
-                // Grouped Prop Souls (400-425)
-                case 400: return "Carrots";
-                case 401: return "Tomatoes";
-                case 402: return "Pumpkins";
-                case 403: return "Topsoil Bags";
-                case 404: return "Quoits (Green)";
-                case 405: return "Plates";
-                case 406: return "Oranges";
-                case 407: return "Leeks";
-                case 408: return "Cucumbers";
-                case 409: return "Quoits (Red)";
-                case 410: return "Umbrellas";
-                case 411: return "Tinned Food";
-                case 412: return "Socks";
-                case 413: return "Pint Bottles";
-                case 414: return "Knives";
-                case 415: return "Gumboots";
-                case 416: return "Forks";
-                // case 417: return "";
-                case 418: return "Apple Cores";
-                case 419: return "Apples";
-                case 420: return "Sandwich";
-                // case 421: return "";
-                case 422: return "Ribbons";
-                case 423: return "Walkie Talkies";
-                case 424: return "Boots";
-                case 425: return "Miniature People";
-                
-                // Garden One-Off Prop Souls (500-519)
-                case 500: return "Radio";
-                case 501: return "Trowel";
-                case 502: return "Cabbages";
-                case 503: return "Tulip";
-                case 504: return "Jam";
-                case 505: return "Picnic Mug";
-                case 506: return "Thermos";
-                case 507: return "Sun Hat";
-                case 508: return "Drink Can";
-                case 509: return "Tennis Ball";
-                // case 510: return "";
-                case 511: return "Rake";
-                case 512: return "Picnic Basket";
-                case 513: return "Esky";
-                case 514: return "Shovel";
-                case 515: return "Watering Can";
-                // case 516: return "";
-                case 517: return "Mallet";
-                case 518: return "Wooden Crate";
-                
-                // High Street One-Off Prop Souls (520-543)
-                // case 520: return "";
-                case 521: return "Horn-Rimmed Glasses";
-                case 522: return "Red Glasses";
-                case 523: return "Sunglasses";
-                case 524: return "Loo Paper";
-                case 525: return "Toy Car";
-                case 526: return "Hairbrush";
-                case 527: return "Toothbrush";
-                case 528: return "Stereoscope";
-                case 529: return "Dish Soap Bottle";
-                case 530: return "Spray Bottle";
-                case 531: return "Weed Tools";
-                case 532: return "Lily Flower";
-                case 533: return "Toy Plane";
-                case 534: return "Football";
-                case 535: return "Chalk";
-                case 536: return "Dustbin Lid";
-                case 537: return "Shopping Basket";
-                case 538: return "Push Broom";
-                case 539: return "Garage Rope";
-                case 540: return "Dustbin";
-                case 541: return "Baby Doll";
-                case 542: return "Pricing Gun";
-                case 543: return "Adding Machine";
-                // case 545: return "";
-                
-                // Back Gardens One-Off Prop Souls (550-574)
-                case 550: return "Dummy";
-                case 551: return "Cricket Ball";
-                case 552: return "Bust Pipe";
-                case 553: return "Bust Hat";
-                case 554: return "Bust Glasses";
-                case 555: return "Tea Cup";
-                case 556: return "Newspaper";
-                case 557: return "Badminton Racket";
-                case 558: return "Pot Stack";
-                case 559: return "Soap";
-                case 560: return "Paintbrush";
-                case 561: return "Vase";
-                case 562: return "Bra";
-                case 563: return "Rose";
-                case 564: return "Rose Box";
-                case 565: return "Cricket Bat";
-                case 566: return "Tea Pot";
-                case 567: return "Clippers";
-                case 568: return "Duck Statue";
-                case 569: return "Frog Statue";
-                case 570: return "Jeremy Fish";
-                case 571: return "No Goose Sign (Messy)";
-                case 572: return "Drawer";
-                case 573: return "Enamel Jug";
-                case 574: return "No Goose Sign (Clean)";
-                
-                // Pub One-Off Prop Souls (580-601)
-                case 580: return "Fishing Bobber";
-                case 581: return "Letter";
-                case 582: return "Pint Glasses";
-                case 583: return "Toy Boat";
-                // case 584: return "";
-                case 585: return "Pepper Grinder";
-                // case 586: return "";
-                case 587: return "Cork";
-                case 588: return "Candlestick";
-                case 589: return "Flower for Vase";
-                case 590: return "Harmonica";
-                case 591: return "Tackle Box";
-                case 592: return "Traffic Cone";
-                case 593: return "Parcel";
-                case 594: return "Stealth Box";
-                case 595: return "No Goose Sign (Pub)";
-                case 596: return "Portable Stool";
-                case 597: return "Dartboard";
-                case 598: return "Mop Bucket";
-                case 599: return "Mop";
-                // case 600: return "";
-                case 601: return "Bucket";
-                
-                // Model Village One-Off Prop Souls (610-620)
-                case 610: return "Miniature Mail Pillar";
-                case 611: return "Miniature Phone Door";
-                case 612: return "Miniature Shovel";
-                case 613: return "Poppy Flower";
-                case 614: return "Timber Handle";
-                case 615: return "Miniature Birdbath";
-                case 616: return "Miniature Easel";
-                case 617: return "Miniature Benches";
-                case 618: return "Miniature Pump";
-                case 619: return "Miniature Goose";
-                case 620: return "Miniature Sun Lounge";
-                case 621: return "Golden Bell";
-                
-                // Victory
-                case 999: return "Escape Sequence";
-                
-                default: return "Unknown Item (" + offset + ")";
-            }
+            return NameAtOffset(itemNamesByOffset, offset) ?? "Unknown Item (" + offset + ")";
         }
 
         /// <summary>
@@ -694,395 +531,9 @@ namespace GooseGameAP
         {
             long offset = locationId - BASE_ID;
             
-            // Goals (1-80)
-            switch (offset)
-            {
-                case 1: return "Get into the garden";
-                case 2: return "Get the groundskeeper wet";
-                case 3: return "Steal the groundskeeper's keys";
-                case 4: return "Make the groundskeeper wear his sun hat";
-                case 5: return "Rake in the lake";
-                case 6: return "Have a picnic";
-                case 7: return "Make the groundskeeper hammer his thumb";
-                case 10: return "Break the broom";
-                case 11: return "Trap the boy in the phone booth";
-                case 12: return "Make the boy wear the wrong glasses";
-                case 13: return "Make someone buy back their own stuff";
-                case 14: return "Get on TV";
-                case 15: return "Go shopping";
-                case 16: return "Trap the shopkeeper in the garage";
-                case 20: return "Make someone break the fancy vase";
-                case 21: return "Help the woman dress up the bust";
-                case 22: return "Make the man spit out his tea";
-                case 23: return "Get dressed up with a ribbon";
-                case 24: return "Make the man go barefoot";
-                case 25: return "Do the washing";
-                case 26: return "Make someone prune the prize rose";
-                case 30: return "Get into the pub";
-                case 31: return "Break the dartboard";
-                case 32: return "Get the toy boat";
-                case 33: return "Make the old man fall on his bum";
-                case 34: return "Be awarded a flower";
-                case 35: return "Steal a pint glass and drop it in the canal";
-                case 36: return "Set the table";
-                case 37: return "Drop a bucket on the burly man's head";
-                case 40: return "Get into the model village";
-                case 41: return "Steal the beautiful miniature golden bell";
-                case 42: return "...and take it all the way back home";
-
-                case 50: return "Lock the groundskeeper out of the garden";
-                case 51: return "Cabbage picnic";
-                case 52: return "Trip the boy in the puddle";
-                case 53: return "Make the scales go ding";
-                case 54: return "Open an umbrella inside the TV shop";
-                case 55: return "Make someone from outside the high street buy back their own stuff";
-                case 56: return "Collect the five flowers";
-                case 60: return "Trap the boy in the garage";
-                case 61: return "Catch an object as it's thrown over the fence";
-                case 62: return "Get thrown over the fence";
-                case 63: return "Dress up the bust with things from outside the back gardens";
-                case 64: return "Score a goal";
-                case 65: return "Sail the toy boat under the bridge";
-                case 66: return "Perform at the pub wearing a ribbon";
-                case 67: return "Steal the old man's woolen hat";
-
-                case 70: return "Complete Garden before noon";
-                case 71: return "Complete High Street before noon";
-                case 72: return "Complete Back Gardens before noon";
-                case 73: return "Complete Pub before noon";
-
-                case 80: return "100% Completion";
-
-                // Milestone goals
-                case 81: return "All Garden tasks complete";
-                case 82: return "All High Street tasks complete";
-                case 83: return "All Back Gardens tasks complete";
-                case 84: return "All Pub tasks complete";
-                case 85: return "All 'To Do (As Well)' tasks complete";
-                case 86: return "All speedrun tasks complete";
-                case 87: return "All speedrun tasks complete (Golden Bell)";
-                case 88: return "All main task lists complete";
-                case 89: return "All main task lists complete (Golden Bell)";
-                case 90: return "All tasks complete";
-                case 91: return "All tasks complete (Golden Bell)";
-                case 92: return "All main task lists + 'To Do (As Well)' complete (Golden Bell)";
-                case 93: return "Get into the Model Village (Golden Bell)";
-                case 94: return "Complete the four final area tasks (Golden Bell)";
-                
-                // Pickups
-                case 1002: return "Pickup Radio";
-                case 1003: return "Pickup Trowel";
-                case 1004: return "Pickup Keys";
-                case 1006: return "Pickup Tulip";
-                case 1007: return "Pickup Apple 1";
-                case 1008: return "Pickup Jam";
-                case 1009: return "Pickup Picnic Mug";
-                case 1010: return "Pickup Thermos";
-                case 1011: return "Pickup Sandwich (Right)";
-                case 1012: return "Pickup Sandwich (Left)";
-                case 1014: return "Pickup Sun Hat";
-                case 1015: return "Pickup Drink Can";
-                case 1016: return "Pickup Tennis Ball";
-                case 1017: return "Pickup Groundskeeper's Hat";
-                case 1018: return "Pickup Apple 2";
-    
-                case 1021: return "Pickup Boy's Glasses";
-                case 1022: return "Pickup Horn-Rimmed Glasses";
-                case 1023: return "Pickup Red Glasses";
-                case 1024: return "Pickup Sunglasses";
-                case 1025: return "Pickup Loo Paper";
-                case 1026: return "Pickup Toy Car";
-                case 1027: return "Pickup Hairbrush";
-                case 1028: return "Pickup Toothbrush";
-                case 1029: return "Pickup Stereoscope";
-                case 1030: return "Pickup Dish Soap Bottle";
-                case 1031: return "Pickup Tinned Food (Blue)";
-                case 1032: return "Pickup Tinned Food (Yellow)";
-                case 1033: return "Pickup Tinned Food (Orange)";
-                case 1034: return "Pickup Weed Tool";
-                case 1035: return "Pickup Lily Flower";
-                case 1036: return "Pickup Orange 1";
-                case 1037: return "Pickup Shop Tomato 1";
-                case 1038: return "Pickup Shop Carrot 1";
-                case 1039: return "Pickup Cucumber 1";
-                case 1040: return "Pickup Leek 1";
-                case 1041: return "Pickup Toy Plane";
-                case 1042: return "Pickup Pint Bottle (Hub)";
-                case 1043: return "Pickup Spray Bottle";
-                case 1044: return "Pickup Walkie Talkie 2";
-                case 1045: return "Pickup Walkie Talkie 1";
-                case 1046: return "Pickup Apple Core 1";
-                case 1058: return "Pickup Apple Core 2";
-                case 1047: return "Pickup Dustbin Lid";
-                case 1048: return "Pickup Pint Bottle (High Street 1)";
-                case 1049: return "Pickup Pint Bottle (High Street 2)";
-                case 1050: return "Pickup Chalk";
-                case 1051: return "Pickup Shop Tomato 2";
-                case 1052: return "Pickup Orange 2";
-                case 1053: return "Pickup Orange 3";
-                case 1054: return "Pickup Shop Carrot 2";
-                case 1055: return "Pickup Cucumber 2";
-                case 1056: return "Pickup Leek 2";
-                case 1057: return "Pickup Shop Carrot 3";
-                case 1059: return "Pickup Leek 3";
-                case 1060: return "Pickup Shop Tomato 3";
-                case 1061: return "Pickup Cucumber 3";
-                case 1062: return "Pickup Garden Fork";
-    
-                case 1071: return "Pickup Ribbon (Blue)";
-                case 1072: return "Pickup Dummy";
-                case 1073: return "Pickup Cricket Ball";
-                case 1074: return "Pickup Bust Pipe";
-                case 1075: return "Pickup Bust Hat";
-                case 1076: return "Pickup Bust Glasses";
-                case 1077: return "Pickup Slipper (Right)";
-                case 1078: return "Pickup Slipper (Left)";
-                case 1079: return "Pickup Tea Cup";
-                case 1080: return "Pickup Newspaper";
-                case 1081: return "Pickup Sock 1";
-                case 1082: return "Pickup Sock 2";
-                case 1083: return "Pickup Vase";
-                case 1084: return "Pickup Ribbon (Red)";
-                case 1085: return "Pickup Pot Stack";
-                case 1086: return "Pickup Soap";
-                case 1087: return "Pickup Paintbrush";
-                case 1088: return "Pickup Vase Piece 1";
-                case 1089: return "Pickup Vase Piece 2";
-                case 1090: return "Pickup Bra";
-                case 1093: return "Pickup Badminton Racket";
-                case 1094: return "Pickup Rose";
-    
-                case 1101: return "Pickup Fishing Bobber";
-                case 1102: return "Pickup Letter";
-                case 1104: return "Pickup Plate 1";
-                case 1105: return "Pickup Plate 2";
-                case 1106: return "Pickup Plate 3";
-                case 1107: return "Pickup Green Quoit 1";
-                case 1108: return "Pickup Red Quoit 1";
-                case 1109: return "Pickup Fork 1";
-                case 1110: return "Pickup Fork 2";
-                case 1111: return "Pickup Knife 1";
-                case 1112: return "Pickup Knife 2";
-                case 1113: return "Pickup Cork";
-                case 1114: return "Pickup Candlestick";
-                case 1115: return "Pickup Flower for Vase";
-                case 1116: return "Pickup Dart 1";
-                case 1117: return "Pickup Dart 2";
-                case 1118: return "Pickup Dart 3";
-                case 1119: return "Pickup Harmonica";
-                case 1120: return "Pickup Pint Glass";
-                case 1121: return "Pickup Toy Boat";
-                case 1122: return "Pickup Old Man's Woolen Hat";
-                case 1123: return "Pickup Pepper Grinder";
-                case 1124: return "Pickup Pub Woman's Cloth";
-                case 1125: return "Pickup Green Quoit 2";
-                case 1126: return "Pickup Green Quoit 3";
-                case 1127: return "Pickup Red Quoit 2";
-                case 1128: return "Pickup Red Quoit 3";
-
-                case 1131: return "Pickup Mini Person (Child)";
-                case 1132: return "Pickup Mini Person (Jumpsuit)";
-                case 1133: return "Pickup Mini Person (Gardener)";
-                case 1134: return "Pickup Mini Shovel";
-                case 1135: return "Pickup Poppy Flower";
-                case 1136: return "Pickup Mini Person (Old Woman)";
-                case 1137: return "Pickup Mini Phone Door";
-                case 1138: return "Pickup Mini Mail Pillar";
-                case 1139: return "Pickup Mini Person (Postie)";
-                case 1140: return "Pickup Mini Person (Vestman)";
-                case 1141: return "Pickup Mini Person";
-                case 1144: return "Pickup Mini Goose";
-                case 1142: return "Pickup Timber Handle";
-                case 1143: return "Pickup Golden Bell";
-                
-                // Drags
-                case 1201: return "Drag Rake";
-                case 1202: return "Drag Picnic Basket";
-                case 1203: return "Drag Esky";
-                case 1205: return "Drag Shovel";
-                case 1206: return "Drag Pumpkin 1";
-                case 1207: return "Drag Pumpkin 2";
-                case 1208: return "Drag Pumpkin 3";
-                case 1209: return "Drag Pumpkin 4";
-                case 1210: return "Drag Watering Can";
-                case 1211: return "Drag Gumboot 1";
-                case 1212: return "Drag Gumboot 2";
-                case 1213: return "No Goose Sign (Garden)";
-                case 1214: return "Drag Wooden Crate";
-                case 1215: return "Drag Fence Bolt";
-                case 1216: return "Drag Mallet";
-    
-                case 1220: return "Drag Shopping Basket";
-                case 1221: return "Drag Umbrella (Black)";
-                case 1222: return "Drag Push Broom";
-                case 1223: return "Drag Broken Broom Head";
-                case 1224: return "Drag Dustbin";
-                case 1225: return "Drag Baby Doll";
-                case 1226: return "Drag Pricing Gun";
-                case 1227: return "Drag Adding Machine";
-                case 1228: return "Drag Umbrella (Rainbow)";
-                case 1229: return "Drag Umbrella (Red)";
-    
-                case 1240: return "Drag Rose Box";
-                case 1241: return "Drag Cricket Bat";
-                case 1242: return "Drag Tea Pot";
-                case 1243: return "Drag Clippers";
-                case 1244: return "Drag Duck Statue";
-                case 1245: return "Drag Frog Statue";
-                case 1246: return "Drag Jeremy Fish";
-                case 1247: return "Drag No Goose Sign (Messy)";
-                case 1248: return "Drag Drawer";
-                case 1249: return "Drag Enamel Jug";
-                case 1250: return "Drag No Goose Sign (Clean)";
-    
-                case 1270: return "Drag Tackle Box";
-                case 1271: return "Drag Traffic Cone";
-                case 1272: return "Drag Parcel";
-                case 1273: return "Drag Stealth Box";
-                case 1274: return "Drag No Goose Sign (Pub)";
-                case 1275: return "Drag Portable Stool";
-                case 1276: return "Drag Dartboard";
-                case 1277: return "Drag Mop Bucket";
-                case 1278: return "Drag Mop";
-                case 1279: return "Drag Delivery Box";
-                case 1280: return "Drag Bucket";
-    
-                case 1290: return "Drag Mini Bench";
-                case 1291: return "Drag Mini Pump";
-                case 1292: return "Drag Mini Street Bench";
-                case 1293: return "Drag Mini Birdbath";
-                case 1294: return "Drag Mini Easel";
-                case 1295: return "Drag Mini Sun Lounge";
-                
-                // Interactions (1301-1350)
-                case 1301: return "Ring Bell";
-                case 1302: return "Honk at Speaker";
-                case 1303: return "Doorbell";
-                case 1304: return "Garden Gate";
-                case 1305: return "Greenhouse Window";
-                case 1306: return "Intro Gate";
-                case 1307: return "TV Remote";
-                case 1308: return "Open Umbrella (Black)";
-                case 1309: return "Turn on Tap";
-                case 1310: return "Open Phone Booth";
-                case 1311: return "Spin Propeller";
-                case 1312: return "Kick Football";
-                case 1313: return "Open Umbrella (Black)";
-                case 1314: return "Open Umbrella (Rainbow)";
-                case 1315: return "Open Umbrella (Red)";
-                case 1316: return "Honk at Wimp";
-                case 1317: return "Honk at Burly Kid";
-                case 1318: return "Kick Football";
-                case 1319: return "Turn on Sprinkler";
-                case 1320: return "Untie Wimp's Left Laces";
-                case 1321: return "Untie Wimp's Right Laces";
-                case 1322: return "Untie Pub Man's Left Laces";
-                case 1323: return "Untie Pub Man's Right Laces";
-                case 1324: return "Spin Windmill";
-                case 1325: return "Wheel Barrow Handle";
-                case 1326: return "Spin Purple Flower";
-                case 1327: return "Spin Sunflower";
-                case 1328: return "Pose as Duck";
-                case 1329: return "Dress up the bush with both ribbons";
-                case 1330: return "Close Van Door (Left)";
-                case 1331: return "Close Van Door (Right)";
-                case 1332: return "Untie Burly Man's Left Laces";
-                case 1333: return "Untie Burly Man's Right Laces";
-                case 1334: return "Turn on Pub Tap";
-                case 1340: return "Wind Chime G";
-                case 1341: return "Wind Chime F";
-                case 1342: return "Wind Chime E";
-                case 1343: return "Wind Chime D";
-                case 1344: return "Wind Chime C";
-                case 1345: return "Wind Chime B";
-                case 1346: return "Wind Chime A";
-                
-                // Sandcastle pecks (1350-1384) - 35 raw pecks
-                case 1350: return "Peck Model Church Doorway 1";
-                case 1351: return "Peck Model Church Doorway 2";
-                case 1352: return "Peck Model Church Doorway 3";
-                case 1353: return "Peck Model Church Doorway 4";
-                case 1354: return "Peck Model Church Doorway 5";
-                case 1355: return "Peck Model Church Doorway 6";
-                case 1356: return "Peck Model Church Doorway 7";
-                case 1357: return "Peck Model Church Doorway 8";
-                case 1358: return "Peck Model Church Doorway 9";
-                case 1359: return "Peck Model Church Doorway 10";
-                case 1360: return "Peck Model Church Doorway 11";
-                case 1361: return "Peck Model Church Doorway 12";
-                case 1362: return "Peck Model Church Doorway 13";
-                case 1363: return "Peck Model Church Doorway 14";
-                case 1364: return "Peck Model Church Doorway 15";
-                case 1365: return "Peck Model Church Doorway 16";
-                case 1366: return "Peck Model Church Doorway 17";
-                case 1367: return "Peck Model Church Doorway 18";
-                case 1368: return "Peck Model Church Doorway 19";
-                case 1369: return "Peck Model Church Tower 1";
-                case 1370: return "Peck Model Church Tower 2";
-                case 1371: return "Peck Model Church Tower 3";
-                case 1372: return "Peck Model Church Tower 4";
-                case 1373: return "Peck Model Church Tower 5";
-                case 1374: return "Peck Model Church Tower 6";
-                case 1375: return "Peck Model Church Tower 7";
-                case 1376: return "Peck Model Church Tower 8";
-                case 1377: return "Peck Model Church Tower 9";
-                case 1378: return "Peck Model Church Tower 10";
-                case 1379: return "Peck Model Church Tower 11";
-                case 1380: return "Peck Model Church Tower 12";
-                case 1381: return "Peck Model Church Tower 13";
-                case 1382: return "Peck Model Church Tower 14";
-                case 1383: return "Peck Model Church Tower 15";
-                case 1384: return "Peck Model Church Tower 16";
-                
-                case 1390: return "Peck Model Church Doorway";
-                case 1391: return "Peck Model Church Tower";
-                
-                // Renamed pickups (1401-1452)
-                case 1401: return "Pickup Carrot 1";
-                case 1402: return "Pickup Carrot 2";
-                case 1403: return "Pickup Carrot 3";
-                case 1404: return "Pickup Carrot 4";
-                case 1405: return "Pickup Carrot 5";
-                case 1406: return "Pickup Carrot 6";
-                case 1407: return "Pickup Carrot 7";
-                case 1408: return "Pickup Carrot 8";
-                case 1409: return "Pickup Carrot 9";
-                case 1410: return "Pickup Carrot 10";
-                case 1411: return "Pickup Carrot 11";
-                case 1412: return "Pickup Carrot 12";
-                case 1413: return "Pickup Carrot 13";
-                case 1421: return "Pickup Boxed Pub Tomato 1";
-                case 1422: return "Pickup Boxed Pub Tomato 2";
-                case 1423: return "Pickup Boxed Pub Tomato 3";
-                case 1424: return "Pickup Boxed Pub Tomato 4";
-                case 1425: return "Pickup Boxed Pub Tomato 5";
-                case 1426: return "Pickup Boxed Pub Tomato 6";
-                case 1427: return "Pickup Boxed Pub Tomato 7";
-                case 1428: return "Pickup Boxed Pub Tomato 8";
-                case 1429: return "Pickup Boxed Pub Tomato 9";
-                case 1430: return "Pickup Pub Tomato 1";
-                case 1431: return "Pickup Pub Tomato 2";
-                case 1440: return "Pickup Boot (Hub)";
-                case 1441: return "Pickup Boot (Start)";
-                case 1450: return "Pickup Topsoil Bag 1";
-                case 1451: return "Pickup Topsoil Bag 2";
-                case 1452: return "Pickup Topsoil Bag 3";
-                
-                // New Tasks (1500-1520)
-                case 1500: return "Drop some mail in the well";
-                case 1501: return "Break the intro gate";
-                case 1502: return "Break through the boards to the back gardens";
-                case 1503: return "Short out the garden radio";
-                case 1504: return "Lock the groundskeeper IN the garden";
-                case 1505: return "Make the woman fix the topiary";
-                case 1506: return "Pose as a duck statue";
-                case 1507: return "Dress up the bush with both ribbons";
-                case 1508: return "Trip the burly man";
-                case 1509: return "Break a pint glass";
-                case 1510: return "Do some interior redecorating";
-                case 1511: return "Trap the TV shop owner in the garage";
-                case 1512: return "Perform at the pub with a harmonica";
-            }
+            string name = NameAtOffset(locationNamesByOffset, offset);
+            if (name != null)
+                return name;
             
             // Generic fallbacks for ID ranges
             if (offset >= 1001 && offset <= 1199)
@@ -903,6 +903,18 @@ namespace GooseGameAP
                     SaveAccessFlags();
                     break;
                 
+                // Progressive Area - opens the first area in the slot's order that isn't open yet
+                case 110:
+                    foreach (long areaOffset in Client?.ProgressiveAreaOrder ?? ArchipelagoClient.DefaultProgressiveAreaOrder)
+                    {
+                        if (!HasAreaAccess(areaOffset))
+                        {
+                            ProcessReceivedItem(BASE_ID + areaOffset);
+                            break;
+                        }
+                    }
+                    break;
+                
                 // NPC Souls (120-129) - only process if NPC souls enabled
                 case 120:
                     HasGroundskeeperSoul = true;
@@ -1108,6 +1120,19 @@ namespace GooseGameAP
             }
         }
         
+        private bool HasAreaAccess(long areaOffset)
+        {
+            switch (areaOffset)
+            {
+                case 100: return HasGardenAccess;
+                case 101: return HasHighStreetAccess;
+                case 102: return HasBackGardensAccess;
+                case 103: return HasPubAccess;
+                case 104: return HasModelVillageAccess;
+                default: return true;
+            }
+        }
+        
         public bool CanEnterArea(GoalListArea area)
         {
             switch (area)